@@ -1,26 +1,56 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 import feedparser
-import requests
+import httpx
 import os
 import json
 import hashlib
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
 import asyncio
+import calendar
+import random
+import threading
+import sqlite3
+import time
+import uuid
+import socket
+import base64
+import gzip
+from email.utils import formatdate, parsedate_to_datetime
+from collections import OrderedDict, deque
+import struct
+from array import array
+import wave
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pydantic import BaseModel
 import re
-from bs4 import BeautifulSoup
+import html
+import functools
+import gc
+import mmap
+import contextvars
+import hmac
+import sys
+import bisect
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from urllib.parse import urlparse, urlsplit
 import logging
 
-# Hugging Face and TTS imports
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
-import pyttsx3
-from gtts import gTTS
-import io
+# brotli is optional; without it snapshot responses are offered gzip-compressed only
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Hugging Face and TTS libraries (transformers, torch, pyttsx3, gTTS) are imported lazily
+# where they are used so that importing the app and starting the server stay fast
+PROCESS_START_TIME = time.time()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,150 +63,1483 @@ os.makedirs("static/audio", exist_ok=True)
 os.makedirs("static/voices", exist_ok=True)
 os.makedirs("templates", exist_ok=True)
 
+class AudioStaticFiles(StaticFiles):
+    """Static files that count plays of pre-rendered audio towards the pre-render hit rate"""
+    
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            count_prerendered_play(path, scope)
+        return response
+
 # Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", AudioStaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 # Pydantic models
 class NewsItem(BaseModel):
+    id: str = ""
     title: str
     summary: str
     original_content: str
     url: str
     published: str
+    published_at: float = 0.0
     source: str
     audio_file: Optional[str] = None
+    audio_files: Dict[str, str] = {}
+    sources: List[Dict[str, str]] = []  # Every source carrying this story
 
 class VoiceRequest(BaseModel):
     text: str
     voice_name: str = "celebrity_voice"
 
 # Global variables
-news_cache = {}
 CACHE_DURATION = 3600  # 1 hour
 
+# Shared state: the news snapshot and coordination leases, shared by every worker process
+CACHE_BACKEND = os.getenv("NEWSBREEZE_CACHE_BACKEND", "memory")  # memory, sqlite or redis
+CACHE_BACKEND_PATH = os.getenv("NEWSBREEZE_CACHE_BACKEND_PATH", "cache/shared_state.db")
+REDIS_URL = os.getenv("NEWSBREEZE_REDIS_URL", "redis://localhost:6379/0")
+WORKERS = int(os.getenv("NEWSBREEZE_WORKERS", "1"))
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+POLLER_LEASE_TTL = 30  # Seconds the poller leader keeps its lease without renewing it
+POLLER_LEASE_RENEW = 10  # Seconds between lease renewals (and leadership checks by followers)
+REFRESH_LEASE_TTL = 300  # Longest an on-request refresh may hold the refresh lease
+shared_state = None
+local_snapshot: Dict[str, Any] = {}  # This worker's deserialized copy of the shared snapshot, by version
+poller_leader_task: Optional[asyncio.Task] = None
+
+# Forced refreshes (?refresh=true) are allowed at most once per interval across all clients and workers
+FORCED_REFRESH_INTERVAL = int(os.getenv("NEWSBREEZE_FORCED_REFRESH_INTERVAL", "60"))
+
+# The serialized, compressed /api/news body of the current snapshot, built once per snapshot
+snapshot_payload: Dict[str, Any] = {}
+# The same snapshot as /api/news/stream NDJSON, per field selection
+stream_payloads: Dict[str, Dict[str, Any]] = {}
+STREAM_PAYLOAD_LIMIT = 16  # Field selections kept per snapshot
+ENCODING_ETAG_SUFFIXES = {"identity": "", "gzip": "-gz", "br": "-br"}
+news_response_stats = {"served": 0, "not_modified": 0, "serializations": 0, "forced_refreshes": 0, "refreshes_throttled": 0,
+                       "cache_hits": 0, "cache_misses": 0}
+
+# Metrics: latency histograms per pipeline stage and per endpoint, exposed on /metrics in Prometheus text format
+METRIC_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_HELP = {
+    "newsbreeze_stage_seconds": "Time spent in each pipeline stage, by source where one applies",
+    "newsbreeze_http_request_seconds": "HTTP request duration by route and status",
+}
+metric_histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[float]] = {}
+metrics_lock = threading.Lock()
+stage_collector = threading.local()  # Lets inference workers hand their stage timings back to the server process
+
+# Diagnostics: an admin-only sampling profiler and per-request trace spans, switched on at runtime
+ADMIN_TOKEN = os.getenv("NEWSBREEZE_ADMIN_TOKEN", "")  # Admin endpoints are disabled without one
+PROFILE_MAX_SECONDS = 60
+PROFILE_IDLE_FRAMES = ("threading.py", "selectors.py", "queue.py", "thread.py:_worker")  # Leaf frames of waiting threads
+TRACE_BUFFER_SIZE = 200  # Completed traces kept for /admin/traces
+tracing = {"enabled": False, "sample_rate": 1.0}
+recent_traces: deque = deque(maxlen=TRACE_BUFFER_SIZE)
+current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+profiler_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profiler")
+profile_lock = threading.Lock()
+
+# RSS fetch settings
+FEED_FETCH_TIMEOUT = 15  # Per-feed network timeout (seconds)
+NEWS_FETCH_DEADLINE = 10  # Overall deadline for fetching all feeds (seconds)
+MAX_CONNECTIONS_PER_HOST = 4
+MAX_CONNECTIONS = 50
+FEED_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Shared async HTTP client, per-host connection limits and feed fetches still running after the deadline
+http_client: Optional[httpx.AsyncClient] = None
+host_semaphores: Dict[str, asyncio.Semaphore] = {}
+inflight_feed_tasks: Dict[str, asyncio.Task] = {}
+late_feed_articles: Dict[str, List[Dict]] = {}
+
+# Background polling settings
+BACKGROUND_POLLING = os.getenv("NEWSBREEZE_BACKGROUND_POLLING", "1") != "0"
+FEED_POLL_INTERVAL = 900  # Default seconds between polls of one feed
+FEED_POLL_JITTER = 0.1  # Fraction of the interval to randomize by
+MAX_NEWS_ITEMS = int(os.getenv("NEWSBREEZE_MAX_NEWS_ITEMS", "20"))
+PENDING_RETRY_BATCH = int(os.getenv("NEWSBREEZE_PENDING_RETRY_BATCH", "4"))  # Still-pending stories each feed poll re-summarizes
+
+# Feed registry: per-feed settings loaded from a JSON config, bounded fetch concurrency and a circuit breaker
+FEEDS_CONFIG_PATH = os.getenv("NEWSBREEZE_FEEDS_CONFIG", "feeds.json")
+FEED_DEFAULTS = {"interval": FEED_POLL_INTERVAL, "priority": 0, "max_entries": 5, "enabled": True}
+FEED_FETCH_CONCURRENCY = int(os.getenv("NEWSBREEZE_FEED_CONCURRENCY", "16"))  # Feeds fetched at once, however many are registered
+FEED_FAILURE_THRESHOLD = 3  # Consecutive failures before a feed's circuit opens
+FEED_BACKOFF_BASE = 60  # Seconds a feed is skipped when its circuit first opens; doubles on each further failure
+FEED_BACKOFF_MAX = 6 * 3600
+feed_fetch_semaphore: Optional[asyncio.Semaphore] = None
+
+# Background poller tasks, one per feed
+poller_tasks: Dict[str, asyncio.Task] = {}
+
+# Single-flight: in-progress work keyed by what it computes, shared by concurrent callers
+inflight_calls: Dict[str, asyncio.Future] = {}
+
+# Per-feed revalidation state: validators, body hash, last parsed articles and counters
+feed_state: Dict[str, Dict] = {}
+
+# Cross-source deduplication: exact URL/GUID matches plus SimHash near-duplicates of cleaned content
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8  # Index bands; stories within SIMHASH_MAX_DISTANCE bits share at least one exactly
+SIMHASH_MAX_DISTANCE = 7  # Differing bits for two bodies to count as the same story (unrelated stories differ by ~20+)
+SHINGLE_SIZE = 3  # Words per shingle
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "ocid", "cmpid", "at_medium", "at_campaign")
+dedup_stats = {"articles_seen": 0, "duplicates": 0, "summaries_reused": 0}
+
 # AI Models - Global variables for model loading
 summarizer_model = None
 summarizer_tokenizer = None
 tts_engine = None
 
-# Updated RSS Feed sources with the ones you provided
-RSS_FEEDS = {
+# Summarization settings
+SUMMARIZER_MODEL_NAME = os.getenv("NEWSBREEZE_SUMMARIZER_MODEL", "Falconsai/text_summarization")
+SUMMARY_INPUT_CHARS = 1024  # Characters of article text passed to the model
+SUMMARY_MAX_INPUT_TOKENS = 512
+SUMMARY_PRESETS = {
+    # Original settings: 4-beam search
+    "quality": {
+        "max_length": 150,
+        "min_length": 30,
+        "length_penalty": 2.0,
+        "num_beams": 4,
+        "early_stopping": True,
+    },
+    "balanced": {
+        "max_length": 150,
+        "min_length": 30,
+        "length_penalty": 2.0,
+        "num_beams": 2,
+        "early_stopping": True,
+    },
+    "fast": {
+        "max_length": 120,
+        "min_length": 30,
+        "num_beams": 1,
+        "do_sample": False,
+    },
+}
+SUMMARY_PRESET = os.getenv("NEWSBREEZE_SUMMARY_PRESET", "quality")
+SUMMARY_GENERATION_CONFIG = SUMMARY_PRESETS.get(SUMMARY_PRESET, SUMMARY_PRESETS["quality"])
+
+# Long articles: "truncate" summarizes the first SUMMARY_INPUT_CHARS only, "chunked" splits the whole
+# article into token-budgeted sentence chunks, summarizes them together and merges them in a reduce pass
+SUMMARY_MODE = os.getenv("NEWSBREEZE_SUMMARY_MODE", "truncate")
+SUMMARY_MAX_CHUNKS = int(os.getenv("NEWSBREEZE_SUMMARY_MAX_CHUNKS", "4"))  # Text beyond this many chunks is dropped
+SUMMARY_MAP_CONFIG = {"max_length": 80, "min_length": 15}  # Chunk summaries are shorter than final ones
+SUMMARY_TOKEN_CACHE_SIZE = 1000
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+token_cache: "OrderedDict[str, Tuple[array, List[int]]]" = OrderedDict()
+token_cache_stats = {"hits": 0, "misses": 0}
+
+# Inference backend: "eager" (fp32 PyTorch), "int8" (dynamic quantization) or "onnx" (ONNX Runtime)
+SUMMARIZER_BACKEND = os.getenv("NEWSBREEZE_SUMMARIZER_BACKEND", "eager")
+SUMMARIZER_ONNX_PATH = os.getenv("NEWSBREEZE_SUMMARIZER_ONNX_PATH", "models/text_summarization-onnx")
+SUMMARIZER_TORCH_THREADS = int(os.getenv("NEWSBREEZE_TORCH_THREADS", "0"))  # 0 keeps the torch default
+SUMMARIZER_MMAP = os.getenv("NEWSBREEZE_MODEL_MMAP", "1") == "1"  # Map eager/int8 weights from safetensors instead of copying them
+SAFETENSORS_DTYPES = {
+    "F64": "float64", "F32": "float32", "F16": "float16", "BF16": "bfloat16",
+    "I64": "int64", "I32": "int32", "I16": "int16", "I8": "int8", "U8": "uint8", "BOOL": "bool",
+}
+SUMMARY_BATCH_SIZE = int(os.getenv("NEWSBREEZE_SUMMARY_BATCH_SIZE", "8"))
+
+# Persistent summary cache: SQLite on disk with an in-memory LRU in front
+SUMMARY_CACHE_PATH = os.getenv("NEWSBREEZE_SUMMARY_CACHE", "cache/summaries.db")
+SUMMARY_CACHE_MAX_ENTRIES = 20000
+SUMMARY_CACHE_MAX_AGE = 30 * 24 * 3600  # 30 days
+SUMMARY_CACHE_LRU_SIZE = 1000
+summary_db: Optional[sqlite3.Connection] = None
+summary_lru: "OrderedDict[str, str]" = OrderedDict()
+summary_cache_lock = threading.Lock()
+summary_cache_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+# Persistent article store: every ingested entry in SQLite, summarized once per content version
+ARTICLE_STORE_PATH = os.getenv("NEWSBREEZE_ARTICLE_STORE", "cache/articles.db")
+ARTICLE_RETENTION = 7 * 24 * 3600  # Drop articles no feed has listed for this long
+DEDUP_WINDOW = 2 * 24 * 3600  # Published within this window, stored stories are checked for near-duplicates
+DEDUP_PRUNE_INTERVAL = 3600  # How often stories older than the window are dropped from the in-memory index
+dedup_index = None  # DuplicateIndex over recent stories, kept across ingests and caught up from the store
+article_db: Optional[sqlite3.Connection] = None
+article_store_lock = threading.Lock()
+article_store_stats = {"inserted": 0, "changed": 0, "unchanged": 0}
+MAX_PAGE_SIZE = 100  # Largest page /api/news serves
+
+# Serialized NewsItem fields and the article store column each is read from
+NEWS_ITEM_COLUMNS = {
+    "id": "id",
+    "title": "title",
+    "summary": "summary",
+    "original_content": "content",
+    "url": "url",
+    "published": "published",
+    "published_at": "published_at",
+    "source": "source",
+    "audio_file": "audio_files",
+    "audio_files": "audio_files",
+    "sources": "sources",
+}
+
+# Persistent audio cache: files in static/audio indexed by (text hash, voice, engine, rate)
+AUDIO_DIR = "static/audio"
+AUDIO_CACHE_INDEX_PATH = os.getenv("NEWSBREEZE_AUDIO_CACHE_INDEX", "cache/audio_index.db")
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("NEWSBREEZE_AUDIO_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+AUDIO_ENGINE_EXTENSIONS = {"gtts": "mp3", "pyttsx3": "wav"}
+AUDIO_ORPHAN_GRACE = 600  # Unindexed files younger than this may be another worker's synthesis in flight
+AUDIO_RECONCILE_LEASE_TTL = 300
+AUDIO_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav"}
+TTS_STREAM_CHUNK_MIN_CHARS = 80  # Short sentences are merged up to this length
+TTS_STREAM_PARALLELISM = 3  # Chunks synthesized ahead of the one being streamed
+audio_db: Optional[sqlite3.Connection] = None
+audio_cache_lock = threading.Lock()
+audio_cache_stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "orphans_removed": 0}
+
+# Audio pre-rendering: synthesize new summaries ahead of demand in a low-priority background worker
+PRERENDER_AUDIO = os.getenv("NEWSBREEZE_PRERENDER_AUDIO", "0") == "1"
+PRERENDER_VOICES = [v for v in os.getenv("NEWSBREEZE_PRERENDER_VOICES", "morgan_freeman").split(",") if v]
+PRERENDER_MAX_VOICES = int(os.getenv("NEWSBREEZE_PRERENDER_MAX_VOICES", "2"))  # Voice variants per article
+PRERENDER_QUEUE_SIZE = 200
+prerender_queue: Optional[asyncio.Queue] = None
+prerender_task: Optional[asyncio.Task] = None
+PRERENDER_TRACKED_LIMIT = 5000  # Pre-rendered files remembered for hit counting
+prerendered_files: "OrderedDict[str, str]" = OrderedDict()  # Audio filename -> content key of its text and voice
+prerendered_keys: Dict[str, str] = {}  # Content key -> audio filename
+prerender_lock = threading.Lock()
+prerender_stats = {"queued": 0, "rendered": 0, "failed": 0, "dropped": 0, "request_hits": 0, "request_misses": 0}
+
+# Inference workers: summarization in a process pool, TTS in bounded threads
+SUMMARY_WORKERS = int(os.getenv("NEWSBREEZE_SUMMARY_WORKERS", "1"))  # 0 summarizes in-process
+TTS_WORKERS = 4
+INFERENCE_QUEUE_LIMITS = {
+    "summary": 4,  # Pending summarization batches
+    "audio": 8,  # Pending audio syntheses
+    "prerender": 1,  # Background audio pre-renders (kept low so user requests go first)
+}
+INFERENCE_RETRY_AFTER = 5  # Seconds a rejected client is asked to wait (Retry-After)
+summary_executor: Optional[Executor] = None
+tts_executor = ThreadPoolExecutor(max_workers=TTS_WORKERS, thread_name_prefix="tts")
+pyttsx3_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")  # pyttsx3 is not thread-safe
+inference_slots: Dict[str, asyncio.Semaphore] = {}
+inference_queue_depth: Dict[str, int] = {kind: 0 for kind in INFERENCE_QUEUE_LIMITS}
+
+# Model loading progress: pending -> loading -> ready | failed; standby while another worker runs the model;
+# unloaded after sitting idle, then reloading on the next use
+model_states: Dict[str, str] = {"summarizer": "pending", "tts": "pending"}
+model_load_seconds: Dict[str, float] = {}
+model_load_tasks: Dict[str, asyncio.Future] = {}
+model_last_used: Dict[str, float] = {}
+model_memory: Dict[str, Dict[str, float]] = {}  # RSS growth measured while each model loaded in this process
+model_unloads: Dict[str, int] = {"summarizer": 0}
+MODEL_IDLE_UNLOAD = int(os.getenv("NEWSBREEZE_MODEL_IDLE_UNLOAD", "0"))  # Seconds unused before the summarizer is unloaded; 0 never
+MODEL_IDLE_CHECK_INTERVAL = 30
+idle_unload_task: Optional[asyncio.Task] = None
+startup_seconds: Optional[float] = None
+
+# Built-in feeds, used when there is no feed registry file
+DEFAULT_RSS_FEEDS = {
     "CNN": "http://rss.cnn.com/rss/cnn_topstories.rss",
-    "New York Times": "http://feeds.nytimes.com/nyt/rss/HomePage",
-    "Washington Post": "http://www.washingtonpost.com/rss/",
-    "USA Today": "http://rssfeeds.usatoday.com/usatoday-NewsTopStories",
-    "NPR": "http://www.npr.org/rss/rss.php?id=1001",
-    "BBC News": "http://newsrss.bbc.co.uk/rss/newsonline_world_edition/americas/rss.xml",
+    "New York Times": "https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml",
+    "Washington Post": "https://feeds.washingtonpost.com/rss/national",
+    "NPR": "https://feeds.npr.org/1001/rss.xml",
+    "BBC News": "https://feeds.bbci.co.uk/news/world/rss.xml",
 }
 
-def load_ai_models():
-    """Load Hugging Face models for summarization and TTS"""
-    global summarizer_model, summarizer_tokenizer, tts_engine
+def load_feed_registry(path: str = FEEDS_CONFIG_PATH) -> Dict[str, Dict]:
+    """Load per-feed settings from the registry file, enabled feeds only, highest priority first (the order feeds start fetching in)"""
+    if os.path.exists(path):
+        with open(path) as f:
+            entries = json.load(f)["feeds"]
+        logger.info(f"📋 Loaded {len(entries)} feeds from {path}")
+    else:
+        entries = [{"name": name, "url": url} for name, url in DEFAULT_RSS_FEEDS.items()]
+    
+    registry = {}
+    for entry in entries:
+        if not entry.get("name") or not entry.get("url"):
+            logger.warning(f"Skipping feed registry entry without a name and url: {entry}")
+            continue
+        feed = dict(FEED_DEFAULTS, **entry)
+        if feed["enabled"]:
+            registry[feed["name"]] = feed
+    
+    # Stable sort: equal priorities keep their order in the file
+    return dict(sorted(registry.items(), key=lambda item: -item[1]["priority"]))
+
+FEED_REGISTRY = load_feed_registry()
+RSS_FEEDS = {name: feed["url"] for name, feed in FEED_REGISTRY.items()}
+
+def mmap_safetensors(path: str) -> Dict[str, Any]:
+    """Return the tensors of a safetensors file backed by a mapping of the file rather than copies of it"""
+    import torch
+    
+    with open(path, "rb") as f:
+        header_size = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_size))
+        # Copy-on-write mapping: pages stay shared with the page cache, and so with every process loading the file
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    
+    tensors = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        dtype = getattr(torch, SAFETENSORS_DTYPES[info["dtype"]])
+        start, end = info["data_offsets"]
+        count = (end - start) // torch.empty((), dtype=dtype).element_size()
+        if count == 0:
+            tensors[name] = torch.empty(info["shape"], dtype=dtype)
+            continue
+        tensors[name] = torch.frombuffer(mapped, dtype=dtype, count=count, offset=8 + header_size + start).reshape(info["shape"])
+    return tensors
+
+def build_mmap_model(model_name: str):
+    """Build the seq2seq model with its weights memory-mapped from the model's safetensors checkpoint"""
+    import torch
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM, GenerationConfig
+    from transformers.utils import cached_file
+    
+    if os.path.isdir(model_name):
+        checkpoint = os.path.join(model_name, "model.safetensors")
+    else:
+        checkpoint = cached_file(model_name, "model.safetensors")
+    
+    # Allocate no weights up front: every parameter is assigned straight from the mapped checkpoint
+    with torch.device("meta"):
+        model = AutoModelForSeq2SeqLM.from_config(AutoConfig.from_pretrained(model_name))
+    model.load_state_dict(mmap_safetensors(checkpoint), strict=False, assign=True)
+    model.tie_weights()
+    missing = [name for name, tensor in list(model.named_parameters()) + list(model.named_buffers()) if tensor.is_meta]
+    if missing:
+        raise ValueError(f"checkpoint is missing {len(missing)} weights, e.g. {missing[0]}")
     
     try:
-        logger.info("🤗 Loading Hugging Face summarization model: Falconsai/text_summarization")
+        model.generation_config = GenerationConfig.from_pretrained(model_name)
+    except Exception:
+        pass  # Fall back to the generation defaults derived from the model config
+    return model.eval()
+
+def build_summarizer(model_name: str = SUMMARIZER_MODEL_NAME, backend: str = SUMMARIZER_BACKEND, torch_threads: int = SUMMARIZER_TORCH_THREADS):
+    """Build a (tokenizer, model) pair for the given inference backend"""
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+    
+    if torch_threads > 0:
+        # Fewer threads per worker avoids oversubscribing cores shared by several workers
+        torch.set_num_threads(torch_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Only settable before any inter-op parallel work has started
+    
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    
+    if backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            if not os.path.isdir(SUMMARIZER_ONNX_PATH):
+                raise FileNotFoundError(
+                    f"{SUMMARIZER_ONNX_PATH} not found, export it with: "
+                    f"optimum-cli export onnx --model {model_name} {SUMMARIZER_ONNX_PATH}"
+                )
+            logger.info(f"⚙️ Using ONNX Runtime summarizer from {SUMMARIZER_ONNX_PATH}")
+            return tokenizer, ORTModelForSeq2SeqLM.from_pretrained(SUMMARIZER_ONNX_PATH)
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable ({e}), falling back to eager PyTorch")
+            backend = "eager"
+    
+    model = None
+    if SUMMARIZER_MMAP:
+        try:
+            model = build_mmap_model(model_name)
+            logger.info("🗺️ Summarizer weights memory-mapped from safetensors")
+        except Exception as e:
+            logger.warning(f"Memory-mapped loading unavailable ({e}), loading a private copy of the weights")
+    if model is None:
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model.eval()
+    
+    if backend == "int8":
+        # Dynamic int8 quantization of the Linear layers: smaller and faster on CPU
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        logger.info("⚙️ Using dynamically quantized int8 summarizer")
+    
+    return tokenizer, model
+
+def load_summarizer_model():
+    """Load the Hugging Face summarization model into this process"""
+    global summarizer_model, summarizer_tokenizer
+    
+    try:
+        logger.info(f"🤗 Loading Hugging Face summarization model: {SUMMARIZER_MODEL_NAME} ({SUMMARIZER_BACKEND}, {SUMMARY_PRESET} preset)")
         
         # Load Falconsai/text_summarization model
-        model_name = "Falconsai/text_summarization"
-        summarizer_tokenizer = AutoTokenizer.from_pretrained(model_name)
-        summarizer_model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        summarizer_tokenizer, summarizer_model = build_summarizer()
         
         logger.info("✅ Hugging Face summarization model loaded successfully")
         
-        # Initialize TTS engine
-        logger.info("🎤 Initializing TTS engine")
-        try:
-            tts_engine = pyttsx3.init()
-            # Configure TTS settings
-            tts_engine.setProperty('rate', 150)  # Speed of speech
-            tts_engine.setProperty('volume', 0.9)  # Volume level
-            logger.info("✅ TTS engine initialized successfully")
-        except Exception as tts_error:
-            logger.warning(f"TTS engine initialization failed: {tts_error}")
-            tts_engine = None
-        
     except Exception as e:
-        logger.error(f"❌ Error loading AI models: {e}")
+        logger.error(f"❌ Error loading summarization model: {e}")
         logger.info("Falling back to simple mode")
 
+def init_tts_engine():
+    """Initialize the pyttsx3 engine (run on the dedicated pyttsx3 thread)"""
+    global tts_engine
+    
+    logger.info("🎤 Initializing TTS engine")
+    try:
+        import pyttsx3
+        tts_engine = pyttsx3.init()
+        # Configure TTS settings
+        tts_engine.setProperty('rate', 150)  # Speed of speech
+        tts_engine.setProperty('volume', 0.9)  # Volume level
+        logger.info("✅ TTS engine initialized successfully")
+    except Exception as tts_error:
+        logger.warning(f"TTS engine initialization failed: {tts_error}")
+        tts_engine = None
+
+def summarizer_worker_ready() -> bool:
+    """Report whether the summarization model is loaded in this (worker) process"""
+    return summarizer_model is not None and summarizer_tokenizer is not None
+
+def get_summary_executor() -> Executor:
+    """Return the summarization executor, starting the worker pool on first use"""
+    global summary_executor
+    
+    if summary_executor is None:
+        if SUMMARY_WORKERS > 0:
+            # Spawned workers each load the model once, keeping inference off the server process
+            summary_executor = ProcessPoolExecutor(
+                max_workers=SUMMARY_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=load_summarizer_model,
+            )
+            logger.info(f"🧵 Started {SUMMARY_WORKERS} summarization worker process(es)")
+        else:
+            summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarizer")
+    return summary_executor
+
+def _load_summarizer() -> bool:
+    """Load the summarizer in the worker pool (or in-process) and report success"""
+    if SUMMARY_WORKERS > 0:
+        # Workers load the model in their initializer; this call waits for that to finish
+        return get_summary_executor().submit(summarizer_worker_ready).result()
+    load_summarizer_model()
+    return summarizer_worker_ready()
+
+def _load_tts() -> bool:
+    """Initialize the TTS engine on the thread that will use it and report success"""
+    pyttsx3_executor.submit(init_tts_engine).result()
+    return tts_engine is not None
+
+MODEL_LOADERS = {
+    "summarizer": _load_summarizer,
+    "tts": _load_tts,
+}
+
+def load_model(name: str):
+    """Load one model, tracking its state, load time and the memory it took in this process"""
+    model_states[name] = "reloading" if model_states[name] in ("unloaded", "reloading") else "loading"
+    started = time.time()
+    rss_before = process_memory_mb().get("rss_mb", 0.0)
+    try:
+        loaded = MODEL_LOADERS[name]()
+    except Exception as e:
+        logger.error(f"❌ Error loading {name} model: {e}")
+        loaded = False
+    model_load_seconds[name] = round(time.time() - started, 3)
+    model_memory[name] = {"rss_growth_mb": round(process_memory_mb().get("rss_mb", 0.0) - rss_before, 1)}
+    model_last_used[name] = time.time()
+    model_states[name] = "ready" if loaded else "failed"
+    logger.info(f"{'✅' if loaded else '⚠️'} {name} model {model_states[name]} after {model_load_seconds[name]}s")
+
+def load_ai_models():
+    """Load Hugging Face models for summarization and TTS in parallel, waiting for both"""
+    with ThreadPoolExecutor(max_workers=len(MODEL_LOADERS)) as loader:
+        list(loader.map(load_model, MODEL_LOADERS))
+    if model_states["summarizer"] != "ready":
+        logger.info("Falling back to simple mode")
+
+def start_model_loading(names: Optional[List[str]] = None):
+    """Load the models (all by default) in the background and in parallel without blocking startup"""
+    loop = asyncio.get_running_loop()
+    for name in names or MODEL_LOADERS:
+        task = model_load_tasks.get(name)
+        if task is None or (task.done() and model_states[name] != "ready"):
+            model_load_tasks[name] = loop.run_in_executor(None, load_model, name)
+
+def _unload_summarizer() -> Optional[Executor]:
+    """Drop the summarizer; returns the executor whose worker processes still have to exit"""
+    global summary_executor, summarizer_model, summarizer_tokenizer
+    
+    executor, summary_executor = summary_executor, None
+    summarizer_model = summarizer_tokenizer = None
+    token_cache.clear()
+    return executor
+
+# Models that are unloaded when idle: the inference queue they serve, and how to release them
+MODEL_UNLOADERS = {
+    "summarizer": ("summary", _unload_summarizer),
+}
+
+def process_memory_mb(pid: Any = "self") -> Dict[str, float]:
+    """Resident memory of a process, split into private (anonymous) and file-backed pages that mmap'd weights use"""
+    fields = {"VmRSS": "rss_mb", "RssAnon": "rss_anon_mb", "RssFile": "rss_file_mb"}
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in fields:
+                    memory[fields[key]] = round(int(value.split()[0]) / 1024, 1)
+    except (OSError, ValueError):
+        pass  # Not Linux, or the process has exited
+    return memory
+
+def release_free_memory():
+    """Collect garbage and ask glibc to hand freed heap pages back to the OS"""
+    gc.collect()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass  # Not glibc
+
+async def ensure_model(name: str, wait: bool) -> bool:
+    """Note a use of the model and reload it if it was unloaded; concurrent callers share one load"""
+    model_last_used[name] = time.time()
+    if model_states[name] == "unloaded":
+        logger.info(f"♻️ Reloading the {name} model on demand")
+        model_states[name] = "reloading"
+        start_model_loading([name])
+    task = model_load_tasks.get(name)
+    if wait and task is not None and not task.done():
+        await asyncio.shield(task)
+    return model_states[name] == "ready"
+
+async def unload_model(name: str):
+    """Release an idle model and the memory it held"""
+    logger.info(f"💤 Unloading the {name} model after {MODEL_IDLE_UNLOAD}s idle")
+    model_states[name] = "unloaded"
+    model_unloads[name] += 1
+    executor = MODEL_UNLOADERS[name][1]()
+    loop = asyncio.get_running_loop()
+    if executor is not None:
+        # Worker processes exit, returning all of their memory
+        await loop.run_in_executor(None, functools.partial(executor.shutdown, wait=True))
+    await loop.run_in_executor(None, release_free_memory)
+
+async def unload_idle_models():
+    """Unload models unused for MODEL_IDLE_UNLOAD seconds that have no inference in flight"""
+    while True:
+        await asyncio.sleep(MODEL_IDLE_CHECK_INTERVAL)
+        for name, (kind, _) in MODEL_UNLOADERS.items():
+            idle = time.time() - model_last_used.get(name, time.time())
+            if model_states[name] == "ready" and idle > MODEL_IDLE_UNLOAD and inference_queue_depth[kind] == 0:
+                try:
+                    await unload_model(name)
+                except Exception as e:
+                    logger.error(f"Error unloading the {name} model: {e}")
+
+def get_model_stats() -> Dict[str, Dict]:
+    """Each model's state, load time, idle time and resident memory"""
+    stats = {}
+    now = time.time()
+    for name, state in model_states.items():
+        entry = {
+            "state": state,
+            "load_seconds": model_load_seconds.get(name),
+            "idle_seconds": round(now - model_last_used[name], 1) if name in model_last_used else None,
+            "unloads": model_unloads.get(name, 0),
+        }
+        if name == "summarizer" and SUMMARY_WORKERS > 0:
+            # The model lives in the worker processes, so report theirs
+            processes = getattr(summary_executor, "_processes", None) or {}
+            entry["worker_processes"] = {str(pid): process_memory_mb(pid) for pid in processes}
+        elif state == "ready":
+            entry.update(model_memory.get(name, {}))
+        stats[name] = entry
+    return stats
+
+def shutdown_inference_workers():
+    """Stop the summarization and TTS executors"""
+    global summary_executor
+    
+    if summary_executor is not None:
+        summary_executor.shutdown(wait=False, cancel_futures=True)
+        summary_executor = None
+    tts_executor.shutdown(wait=False, cancel_futures=True)
+    pyttsx3_executor.shutdown(wait=False, cancel_futures=True)
+    profiler_executor.shutdown(wait=False, cancel_futures=True)
+
+async def run_inference(kind: str, executor: Executor, func: Callable, *args, block: bool = False) -> Any:
+    """Run inference work in an executor, rejecting with 429 when its queue is full unless block is set"""
+    slots = inference_slots.get(kind)
+    if slots is None:
+        slots = inference_slots[kind] = asyncio.Semaphore(INFERENCE_QUEUE_LIMITS[kind])
+    
+    if slots.locked() and not block:
+        logger.warning(f"🚦 {kind} queue full ({inference_queue_depth[kind]} pending), rejecting request")
+        raise HTTPException(status_code=429, detail=f"Too many pending {kind} requests, please retry shortly",
+                            headers={"Retry-After": str(INFERENCE_RETRY_AFTER)})
+    
+    waiting_since = time.perf_counter()
+    async with slots:
+        observe_stage(f"{kind}_queue_wait", time.perf_counter() - waiting_since)
+        inference_queue_depth[kind] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            with stage_timer(f"{kind}_inference"):
+                return await loop.run_in_executor(executor, func, *args)
+        finally:
+            inference_queue_depth[kind] -= 1
+
+async def single_flight(key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+    """Run func once per key; concurrent callers with the same key await the same result"""
+    task = inflight_calls.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func())
+        inflight_calls[key] = task
+        task.add_done_callback(lambda t: inflight_calls.pop(key, None))
+    else:
+        logger.info(f"🔗 Joining in-progress work for {key[:40]}")
+    # Shield so one caller going away does not cancel the work for the others
+    return await asyncio.shield(task)
+
+@contextmanager
+def trace_span(name: str, root: bool = False, **attributes: Any):
+    """Record a span under the current trace; a root span starts a trace when tracing is on and the request is sampled"""
+    parent = current_span.get()
+    if parent is None and not (root and tracing["enabled"] and random.random() < tracing["sample_rate"]):
+        yield
+        return
+    
+    trace = parent["trace"] if parent is not None else {"trace_id": uuid.uuid4().hex[:16], "started_at": time.time(), "spans": []}
+    span = {"id": len(trace["spans"]) + 1, "parent": parent["id"] if parent is not None else None,
+            "name": name, "attributes": attributes, "start": time.perf_counter(), "trace": trace}
+    trace["spans"].append(span)
+    token = current_span.set(span)
+    try:
+        yield
+    finally:
+        span["end"] = time.perf_counter()
+        current_span.reset(token)
+        if parent is None:
+            recent_traces.append(format_trace(trace))
+
+def traced(name: str, root: bool = False):
+    """Decorate an async function so each call is a trace span (a whole trace when root is set)"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with trace_span(name, root=root):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def format_trace(trace: Dict) -> Dict:
+    """Turn a finished trace into JSON: span offsets, durations and self time (excluding child spans), in ms"""
+    spans = trace["spans"]
+    origin = spans[0]["start"]
+    durations = {span["id"]: span["end"] - span["start"] if "end" in span else None for span in spans}
+    child_time: Dict[int, float] = {}
+    for span in spans:
+        if span["parent"] is not None and durations[span["id"]] is not None:
+            child_time[span["parent"]] = child_time.get(span["parent"], 0.0) + durations[span["id"]]
+    
+    def ms(seconds: Optional[float]) -> Optional[float]:
+        return round(seconds * 1000, 3) if seconds is not None else None
+    
+    return {
+        "trace_id": trace["trace_id"],
+        "name": spans[0]["name"],
+        "started_at": datetime.fromtimestamp(trace["started_at"]).isoformat(),
+        "duration_ms": ms(durations[1]),
+        "spans": [
+            {
+                "id": span["id"],
+                "parent": span["parent"],
+                "name": span["name"],
+                "start_ms": ms(span["start"] - origin),
+                "duration_ms": ms(durations[span["id"]]),
+                # Concurrent children can add up to more than their parent
+                "self_ms": ms(max(0.0, durations[span["id"]] - child_time.get(span["id"], 0.0)))
+                if durations[span["id"]] is not None else None,
+                **span["attributes"],
+            }
+            for span in spans
+        ],
+    }
+
+def sample_stacks(seconds: float, hz: int, include_idle: bool = False) -> Dict[str, int]:
+    """Sample every thread's Python stack hz times a second and count identical stacks, root frame first"""
+    counts: Dict[str, int] = {}
+    me = threading.get_ident()
+    thread_names = {}
+    interval = 1.0 / hz
+    deadline = time.perf_counter() + seconds
+    
+    while time.perf_counter() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            leaf_file = os.path.basename(frame.f_code.co_filename)
+            if not include_idle and (leaf_file in PROFILE_IDLE_FRAMES or f"{leaf_file}:{frame.f_code.co_name}" in PROFILE_IDLE_FRAMES):
+                continue
+            if ident not in thread_names:
+                thread_names.update((thread.ident, thread.name) for thread in threading.enumerate())
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(thread_names.get(ident, f"thread-{ident}"))
+            key = ";".join(reversed(stack))
+            counts[key] = counts.get(key, 0) + 1
+        time.sleep(interval)
+    return counts
+
+def require_admin(request: Request):
+    """Reject requests without the admin token; without a configured token the admin endpoints don't exist"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # Compare bytes: compare_digest rejects non-ASCII str, which would surface as a 500
+    if not hmac.compare_digest(request.headers.get("x-admin-token", "").encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+def observe(metric: str, seconds: float, **labels: str):
+    """Record one duration in a histogram: a count per bucket, then the +Inf count and the sum"""
+    collector = getattr(stage_collector, "observations", None)
+    if collector is not None:
+        collector.append((metric, seconds, labels))
+        return
+    key = (metric, tuple(sorted(labels.items())))
+    with metrics_lock:
+        histogram = metric_histograms.get(key)
+        if histogram is None:
+            histogram = metric_histograms[key] = [0] * (len(METRIC_BUCKETS) + 1) + [0.0]
+        histogram[bisect.bisect_left(METRIC_BUCKETS, seconds)] += 1
+        histogram[-1] += seconds
+
+def observe_stage(stage: str, seconds: float, source: str = ""):
+    """Record the duration of one pipeline stage"""
+    observe("newsbreeze_stage_seconds", seconds, stage=stage, source=source)
+
+@contextmanager
+def stage_timer(stage: str, source: str = ""):
+    """Time the enclosed block as one pipeline stage (and as a trace span when the request is traced)"""
+    started = time.perf_counter()
+    try:
+        with trace_span(stage, **({"source": source} if source else {})):
+            yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started, source)
+
+def metric_labels(labels: Dict[str, Any]) -> str:
+    """Format labels for the Prometheus text format"""
+    escaped = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}" if labels else ""
+
+def render_metrics() -> str:
+    """Render the histograms, cache counters and gauges in Prometheus text format"""
+    lines = []
+    with metrics_lock:
+        histograms = sorted((key, list(values)) for key, values in metric_histograms.items())
+    
+    current = None
+    for (metric, labels), values in histograms:
+        if metric != current:
+            current = metric
+            lines += [f"# HELP {metric} {METRIC_HELP.get(metric, metric)}", f"# TYPE {metric} histogram"]
+        cumulative = 0
+        for bound, count in zip(METRIC_BUCKETS + ("+Inf",), values):
+            cumulative += count
+            lines.append(f"{metric}_bucket{metric_labels(dict(labels, le=bound))} {cumulative}")
+        lines.append(f"{metric}_sum{metric_labels(dict(labels))} {values[-1]:.6f}")
+        lines.append(f"{metric}_count{metric_labels(dict(labels))} {cumulative}")
+    
+    def family(name: str, kind: str, help_text: str, samples: List[Tuple[Dict[str, Any], float]]):
+        lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"])
+        lines.extend(f"{name}{metric_labels(labels)} {value}" for labels, value in samples)
+    
+    cache_events = [({"cache": "news", "event": event[len("cache_"):]}, news_response_stats[event])
+                    for event in ("cache_hits", "cache_misses")]
+    cache_events += [({"cache": "summary", "event": event}, count) for event, count in summary_cache_stats.items()]
+    cache_events += [({"cache": "audio", "event": event}, count) for event, count in audio_cache_stats.items()]
+    family("newsbreeze_cache_events_total", "counter", "Cache lookups and maintenance by cache and event", cache_events)
+    family("newsbreeze_news_responses_total", "counter", "Snapshot responses served, revalidated and rebuilt",
+           [({"outcome": outcome}, count) for outcome, count in news_response_stats.items() if not outcome.startswith("cache_")])
+    family("newsbreeze_inference_queue_depth", "gauge", "Pending inference jobs by kind",
+           [({"kind": kind}, depth) for kind, depth in inference_queue_depth.items()])
+    family("newsbreeze_prerender_queue_depth", "gauge", "Audio pre-renders waiting",
+           [({}, prerender_queue.qsize() if prerender_queue is not None else 0)])
+    family("newsbreeze_model_load_seconds", "gauge", "Time the last load of each model took",
+           [({"model": name}, seconds) for name, seconds in model_load_seconds.items()])
+    family("newsbreeze_model_ready", "gauge", "1 when the model is loaded in this worker",
+           [({"model": name}, int(state == "ready")) for name, state in model_states.items()])
+    family("newsbreeze_feed_consecutive_failures", "gauge", "Consecutive failed fetches per feed",
+           [({"source": source}, state["consecutive_failures"]) for source, state in feed_state.items()])
+    return "\n".join(lines) + "\n"
+
+def content_key(*parts: str) -> str:
+    """Return a stable hash of the given strings for use as a single-flight/cache key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+# Text cleaning: precompiled patterns, shared by every feed entry
+MARKUP_PATTERN = re.compile(r"<[a-zA-Z/!?]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+URL_PATTERN = re.compile(r"https?://[^\s\"<>]+")
+NON_TEXT_TAGS = ("script", "style", "template")
+
+class TextExtractor(HTMLParser):
+    """Streaming tag stripper that keeps text nodes and drops script/style contents"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in NON_TEXT_TAGS:
+            self.skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if tag in NON_TEXT_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+    
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):
+            self.parts.append(data[len("CDATA["):])
+
+def strip_tags(text: str) -> str:
+    """Return the text content of an HTML fragment without building a document tree"""
+    extractor = TextExtractor()
+    extractor.feed(text)
+    extractor.close()
+    return "".join(extractor.parts)
+
 def clean_text(text: str) -> str:
     """Clean and prepare text for processing"""
     if not text:
         return ""
     
-    soup = BeautifulSoup(text, 'html.parser')
-    text = soup.get_text()
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    # Plain text (the common case for titles) only needs entity decoding, not a parser
+    if MARKUP_PATTERN.search(text):
+        text = strip_tags(text)
+    elif "&" in text:
+        text = html.unescape(text)
+    
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
+    text = URL_PATTERN.sub("", text)
     return text
 
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive HTTP client, creating it on first use"""
+    global http_client
+    
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(
+            headers=FEED_HEADERS,
+            timeout=httpx.Timeout(FEED_FETCH_TIMEOUT),
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            follow_redirects=True,
+        )
+    return http_client
+
+def get_host_semaphore(url: str) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent connections to the host of a URL"""
+    host = urlparse(url).netloc
+    if host not in host_semaphores:
+        host_semaphores[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+    return host_semaphores[host]
+
+def parse_feed_entries(content: bytes, source_name: str, max_entries: int = FEED_DEFAULTS["max_entries"]) -> List[Dict]:
+    """Parse a downloaded RSS feed body into article dicts"""
+    with stage_timer("parse", source_name):
+        feed = feedparser.parse(content)
+    articles = []
+    clean_seconds = 0.0
+    
+    logger.info(f"Found {len(feed.entries)} entries in {source_name}")
+    
+    for entry in feed.entries[:max_entries]:  # Per-feed entry cap from the registry
+        try:
+            # Extract content
+            content = ""
+            if hasattr(entry, 'content') and entry.content:
+                content = entry.content[0].value
+            elif hasattr(entry, 'summary'):
+                content = entry.summary
+            elif hasattr(entry, 'description'):
+                content = entry.description
+            else:
+                content = entry.title  # Fallback to title
+            
+            started = time.perf_counter()
+            content = clean_text(content)
+            title = clean_text(entry.title)
+            clean_seconds += time.perf_counter() - started
+            
+            # Skip if content is too short
+            if len(content) < 50:
+                continue
+            
+            # Extract publication date
+            published = ""
+            if hasattr(entry, 'published'):
+                published = entry.published
+            elif hasattr(entry, 'updated'):
+                published = entry.updated
+            else:
+                published = str(datetime.now())
+            
+            # Sortable publication time for the article store
+            published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            published_at = calendar.timegm(published_parsed) if published_parsed else time.time()
+            
+            article = {
+                "title": title,
+                "content": content,
+                "url": entry.link if hasattr(entry, 'link') else "",
+                "guid": entry.get("id", ""),
+                "published": published,
+                "published_at": published_at,
+                "source": source_name
+            }
+            articles.append(article)
+            logger.info(f"Added article: {article['title'][:50]}...")
+            
+        except Exception as e:
+            logger.error(f"Error processing entry from {source_name}: {e}")
+            continue
+    
+    observe_stage("clean_text", clean_seconds, source_name)
+    return articles
+
+def get_feed_state(url: str, source_name: str) -> Dict:
+    """Return the revalidation state for a feed, resetting it if the URL changed"""
+    state = feed_state.get(source_name)
+    if state is None or state["url"] != url:
+        state = {
+            "url": url,
+            "etag": None,
+            "last_modified": None,
+            "content_hash": None,
+            "articles": [],
+            "not_modified": 0,
+            "unchanged": 0,
+            "full_fetches": 0,
+            "errors": 0,
+            "consecutive_failures": 0,
+            "open_until": 0.0,
+            "skipped": 0,
+        }
+        feed_state[source_name] = state
+    return state
+
+def get_feed_stats() -> Dict[str, Dict]:
+    """Return per-feed revalidation counters"""
+    return {
+        source_name: {
+            "not_modified": state["not_modified"],
+            "unchanged": state["unchanged"],
+            "full_fetches": state["full_fetches"],
+            "errors": state["errors"],
+            "consecutive_failures": state["consecutive_failures"],
+            "circuit_open": state["open_until"] > time.time(),
+            "skipped": state["skipped"],
+        }
+        for source_name, state in feed_state.items()
+    }
+
+def get_feed_fetch_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding how many feeds are fetched at once"""
+    global feed_fetch_semaphore
+    if feed_fetch_semaphore is None:
+        feed_fetch_semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+    return feed_fetch_semaphore
+
+def record_feed_failure(state: Dict, source_name: str):
+    """Count a failed fetch and open the feed's circuit, with exponential backoff, once failures repeat"""
+    state["errors"] += 1
+    state["consecutive_failures"] += 1
+    if state["consecutive_failures"] >= FEED_FAILURE_THRESHOLD:
+        backoff = min(FEED_BACKOFF_MAX, FEED_BACKOFF_BASE * 2 ** (state["consecutive_failures"] - FEED_FAILURE_THRESHOLD))
+        state["open_until"] = time.time() + backoff
+        logger.warning(f"🚧 {source_name} failed {state['consecutive_failures']} times in a row, skipping it for {backoff}s")
+
 async def fetch_rss_feed(url: str, source_name: str) -> List[Dict]:
-    """Fetch and parse RSS feed"""
+    """Fetch and parse RSS feed, revalidating against the previous fetch"""
+    state = get_feed_state(url, source_name)
+    
+    # Circuit open: don't spend a connection on a feed that keeps failing until its backoff expires
+    if state["open_until"] > time.time():
+        state["skipped"] += 1
+        return []
+    
+    max_entries = FEED_REGISTRY.get(source_name, FEED_DEFAULTS)["max_entries"]
     try:
-        logger.info(f"📡 Fetching RSS feed from {source_name}: {url}")
+        # Conditional GET using the validators from the last successful fetch
+        headers = {}
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
         
-        # Add headers to avoid being blocked
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        async with get_feed_fetch_semaphore(), get_host_semaphore(url):
+            logger.info(f"📡 Fetching RSS feed from {source_name}: {url}")
+            with stage_timer("fetch", source_name):
+                response = await get_http_client().get(url, headers=headers)
+        
+        if response.status_code == 304:
+            state["consecutive_failures"] = 0
+            state["not_modified"] += 1
+            logger.info(f"♻️ {source_name} not modified, reusing {len(state['articles'])} articles")
+            return state["articles"]
         
-        response = requests.get(url, timeout=15, headers=headers)
         response.raise_for_status()
+        state["consecutive_failures"] = 0
         
-        feed = feedparser.parse(response.content)
-        articles = []
+        state["etag"] = response.headers.get("ETag")
+        state["last_modified"] = response.headers.get("Last-Modified")
         
-        logger.info(f"Found {len(feed.entries)} entries in {source_name}")
+        # Servers without validators still often return an identical body
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if content_hash == state["content_hash"]:
+            state["unchanged"] += 1
+            logger.info(f"♻️ {source_name} body unchanged, reusing {len(state['articles'])} articles")
+            return state["articles"]
         
-        for entry in feed.entries[:5]:  # Limit to 5 articles per source
-            try:
-                # Extract content
-                content = ""
-                if hasattr(entry, 'content') and entry.content:
-                    content = entry.content[0].value
-                elif hasattr(entry, 'summary'):
-                    content = entry.summary
-                elif hasattr(entry, 'description'):
-                    content = entry.description
-                else:
-                    content = entry.title  # Fallback to title
-                
-                content = clean_text(content)
-                
-                # Skip if content is too short
-                if len(content) < 50:
-                    continue
-                
-                # Extract publication date
-                published = ""
-                if hasattr(entry, 'published'):
-                    published = entry.published
-                elif hasattr(entry, 'updated'):
-                    published = entry.updated
-                else:
-                    published = str(datetime.now())
-                
-                article = {
-                    "title": clean_text(entry.title),
-                    "content": content,
-                    "url": entry.link if hasattr(entry, 'link') else "",
-                    "published": published,
-                    "source": source_name
-                }
-                articles.append(article)
-                logger.info(f"Added article: {article['title'][:50]}...")
-                
-            except Exception as e:
-                logger.error(f"Error processing entry from {source_name}: {e}")
-                continue
-            
+        # Parse off the event loop so other requests keep being served
+        loop = asyncio.get_running_loop()
+        articles = await loop.run_in_executor(None, parse_feed_entries, response.content, source_name, max_entries)
+        
+        state["content_hash"] = content_hash
+        state["articles"] = articles
+        state["full_fetches"] += 1
         return articles
         
     except Exception as e:
+        record_feed_failure(state, source_name)
         logger.error(f"Error fetching RSS feed {source_name} ({url}): {e}")
         return []
 
+def _store_late_articles(source_name: str, task: asyncio.Task):
+    """Keep the articles of a feed that finished after the request deadline"""
+    inflight_feed_tasks.pop(source_name, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    articles = task.result()
+    if articles:
+        late_feed_articles[source_name] = articles
+        logger.info(f"⏰ {len(articles)} late articles from {source_name} queued for the next request")
+
+@traced("fetch_all_feeds")
+async def fetch_all_feeds(feeds: Optional[Dict[str, str]] = None, deadline: float = NEWS_FETCH_DEADLINE) -> List[Dict]:
+    """Fetch every feed concurrently, returning whatever arrived before the deadline"""
+    if feeds is None:
+        feeds = RSS_FEEDS
+    
+    tasks = {}
+    for source_name, rss_url in feeds.items():
+        # Reuse a fetch that is still running from an earlier request
+        task = inflight_feed_tasks.get(source_name)
+        if task is None or task.done():
+            task = asyncio.ensure_future(fetch_rss_feed(rss_url, source_name))
+            inflight_feed_tasks[source_name] = task
+        tasks[task] = source_name
+    
+    if not tasks:
+        return []
+    
+    done, pending = await asyncio.wait(tasks.keys(), timeout=deadline)
+    
+    all_articles = []
+    for task, source_name in tasks.items():
+        if task in done:
+            inflight_feed_tasks.pop(source_name, None)
+            late_feed_articles.pop(source_name, None)
+            articles = task.result()
+            all_articles.extend(articles)
+            logger.info(f"Fetched {len(articles)} articles from {source_name}")
+        else:
+            # Let slow feeds finish in the background and deliver their articles later
+            logger.warning(f"⏰ {source_name} missed the {deadline}s deadline, continuing in background")
+            task.add_done_callback(lambda t, name=source_name: _store_late_articles(name, t))
+    
+    return all_articles
+
+def take_late_articles() -> List[Dict]:
+    """Return and clear the articles delivered by feeds that missed an earlier deadline"""
+    articles = []
+    for source_name in list(late_feed_articles.keys()):
+        articles.extend(late_feed_articles.pop(source_name))
+    return articles
+
+WORD_PATTERN = re.compile(r"\w+")
+
+def normalize_url(url: str) -> str:
+    """Reduce a URL to what identifies the article: no scheme, www., fragment, tracking params or trailing slash"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[len("www."):]
+    params = sorted(p for p in parts.query.split("&") if p and not p.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip("/")
+    return host + path + ("?" + "&".join(params) if params else "")
+
+@functools.lru_cache(maxsize=4096)
+def simhash(text: str) -> int:
+    """64-bit SimHash of a text's word shingles"""
+    words = WORD_PATTERN.findall(text.lower())
+    weights = [0] * SIMHASH_BITS
+    for i in range(max(1, len(words) - SHINGLE_SIZE + 1)):
+        shingle = " ".join(words[i:i + SHINGLE_SIZE])
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+class DuplicateIndex:
+    """Finds stories already seen by normalized URL, GUID or near-identical content"""
+    
+    def __init__(self):
+        self.exact: Dict[str, Dict] = {}
+        self.bands: List[Dict[int, List[Tuple[int, Dict]]]] = [{} for _ in range(SIMHASH_BANDS)]
+        self.ids = set()
+        self.last_rowid = 0  # Stored stories up to this rowid are indexed
+        self.pruned_at = time.time()
+    
+    @staticmethod
+    def exact_keys(article: Dict) -> List[str]:
+        keys = []
+        if article.get("url"):
+            keys.append("url:" + normalize_url(article["url"]))
+        if article.get("guid"):
+            keys.append("guid:" + article["guid"])
+        return keys
+    
+    @staticmethod
+    def band_values(fingerprint: int) -> List[int]:
+        width = SIMHASH_BITS // SIMHASH_BANDS
+        return [fingerprint >> (band * width) & ((1 << width) - 1) for band in range(SIMHASH_BANDS)]
+    
+    def find(self, article: Dict, published_after: float = 0.0, fingerprint: Optional[int] = None) -> Optional[Dict]:
+        """Return the indexed story this article duplicates, if any, among stories published after the cutoff"""
+        for key in self.exact_keys(article):
+            story = self.exact.get(key)
+            if story is not None and (story.get("published_at") or 0.0) > published_after:
+                return story
+        
+        if fingerprint is None:
+            fingerprint = simhash(article.get("content") or article.get("original_content", ""))
+        for band, value in enumerate(self.band_values(fingerprint)):
+            for candidate_fingerprint, story in self.bands[band].get(value, []):
+                if (story.get("published_at") or 0.0) <= published_after:
+                    continue
+                if bin(fingerprint ^ candidate_fingerprint).count("1") <= SIMHASH_MAX_DISTANCE:
+                    return story
+        return None
+    
+    def add(self, article: Dict, fingerprint: Optional[int] = None):
+        """Index an article (or summarized item) as the representative of its story"""
+        # Keep only the story's identity, not its text, since the index lives as long as the process
+        story = {key: article.get(key) for key in ("id", "url", "guid", "published_at")}
+        if story["id"]:
+            self.ids.add(story["id"])
+        for key in self.exact_keys(story):
+            self.exact.setdefault(key, story)
+        
+        if fingerprint is None:
+            fingerprint = simhash(article.get("content") or article.get("original_content", ""))
+        for band, value in enumerate(self.band_values(fingerprint)):
+            self.bands[band].setdefault(value, []).append((fingerprint, story))
+    
+    def prune(self, published_before: float):
+        """Drop stories published before the cutoff"""
+        keep = lambda story: (story.get("published_at") or 0.0) > published_before
+        self.exact = {key: story for key, story in self.exact.items() if keep(story)}
+        for band in range(SIMHASH_BANDS):
+            pruned = {}
+            for value, entries in self.bands[band].items():
+                kept = [entry for entry in entries if keep(entry[1])]
+                if kept:
+                    pruned[value] = kept
+            self.bands[band] = pruned
+        # Every story has an entry in each band
+        self.ids = {story["id"] for entries in self.bands[0].values() for _, story in entries if story["id"]}
+        self.pruned_at = time.time()
+
+def get_dedup_index(db: sqlite3.Connection, now: float) -> DuplicateIndex:
+    """Return the in-memory duplicate index, catching up on stories stored since the last call (caller holds article_store_lock)"""
+    global dedup_index
+    
+    if dedup_index is None:
+        dedup_index = DuplicateIndex()
+    # Only stories new since the last call are read, including ones other workers stored
+    for row in db.execute(
+        "SELECT rowid, id, url, guid, content, published_at FROM articles "
+        "WHERE rowid > ? AND duplicate_of IS NULL AND published_at > ?", (dedup_index.last_rowid, now - DEDUP_WINDOW)
+    ):
+        dedup_index.last_rowid = max(dedup_index.last_rowid, row["rowid"])
+        if row["id"] not in dedup_index.ids:
+            dedup_index.add({key: row[key] for key in ("id", "url", "guid", "content", "published_at")})
+    if now - dedup_index.pruned_at > DEDUP_PRUNE_INTERVAL:
+        dedup_index.prune(now - DEDUP_WINDOW)
+    return dedup_index
+
+def add_source(story: Dict, article: Dict):
+    """Record that an article's source also carries a story"""
+    source = {"source": article["source"], "url": article["url"]}
+    if source not in story["sources"]:
+        story["sources"].append(source)
+
+def get_article_db() -> sqlite3.Connection:
+    """Open the article store, creating it on first use"""
+    global article_db, dedup_index
+    
+    if article_db is None:
+        dedup_index = None  # Rebuilt from this store on the next ingest
+        os.makedirs(os.path.dirname(ARTICLE_STORE_PATH) or ".", exist_ok=True)
+        article_db = sqlite3.connect(ARTICLE_STORE_PATH, check_same_thread=False)
+        article_db.row_factory = sqlite3.Row
+        article_db.execute("PRAGMA journal_mode=WAL")
+        article_db.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "id TEXT PRIMARY KEY, source TEXT NOT NULL, guid TEXT NOT NULL, url TEXT NOT NULL, "
+            "title TEXT NOT NULL, content TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "published TEXT NOT NULL, published_at REAL NOT NULL, first_seen_at REAL NOT NULL, last_seen_at REAL NOT NULL, "
+            "summary TEXT, needs_summary INTEGER NOT NULL, duplicate_of TEXT, "
+            "sources TEXT NOT NULL, audio_files TEXT NOT NULL DEFAULT '{}')"
+        )
+        article_db.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, published_at)")
+        article_db.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at)")
+        article_db.execute("CREATE INDEX IF NOT EXISTS idx_articles_guid ON articles (guid)")
+        article_db.execute("CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen_at)")
+        article_db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_pending ON articles (published_at) WHERE needs_summary = 1"
+        )
+        # Listing indexes: summarized, non-duplicate stories in (published_at, id) order, overall and per source
+        article_db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_listed ON articles (published_at, id) "
+            "WHERE duplicate_of IS NULL AND summary IS NOT NULL"
+        )
+        article_db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_listed_source ON articles (source, published_at, id) "
+            "WHERE duplicate_of IS NULL AND summary IS NOT NULL"
+        )
+        article_db.commit()
+    return article_db
+
+def article_id(article: Dict) -> str:
+    """Stable id of a feed entry: its source plus GUID, or normalized URL when the feed has no GUIDs"""
+    identity = article.get("guid") or normalize_url(article["url"])
+    return hashlib.sha256(f"{article['source']}\0{identity}".encode("utf-8")).hexdigest()[:32]
+
+@stage_timer("ingest")
+def ingest_articles(articles: List[Dict]) -> List[Dict]:
+    """Upsert fetched articles into the store; return the new or changed stories that need a summary"""
+    now = time.time()
+    pending = []
+    digests = []
+    for article in articles:
+        article["id"] = article_id(article)
+        digests.append(content_key(article["title"], article["content"]))
+    
+    # Fingerprint new and edited entries before taking the lock, which store reads from requests wait on
+    with article_store_lock:
+        db = get_article_db()
+        stored = [db.execute("SELECT content_hash FROM articles WHERE id = ?", (article["id"],)).fetchone()
+                  for article in articles]
+    fingerprints = [simhash(article["content"]) if row is None or row["content_hash"] != digest else None
+                    for article, digest, row in zip(articles, digests, stored)]
+    
+    with article_store_lock:
+        db = get_article_db()
+        
+        # Recent stories, to recognize the same story arriving from another source
+        index = get_dedup_index(db, now)
+        inserted: Dict[str, Dict] = {}  # Stories new in this batch, whose source lists go out with them
+        
+        for article, digest, fingerprint in zip(articles, digests, fingerprints):
+            row = db.execute(
+                "SELECT content_hash, duplicate_of FROM articles WHERE id = ?", (article["id"],)
+            ).fetchone()
+            
+            if row is not None and row["content_hash"] == digest:
+                article_store_stats["unchanged"] += 1
+                db.execute("UPDATE articles SET last_seen_at = ? WHERE id = ?", (now, article["id"]))
+                continue
+            
+            if row is not None:
+                # Edited entry: keep serving the old summary until the new one is ready
+                article_store_stats["changed"] += 1
+                db.execute(
+                    "UPDATE articles SET title = ?, url = ?, content = ?, content_hash = ?, published = ?, "
+                    "published_at = ?, last_seen_at = ?, needs_summary = ? WHERE id = ?",
+                    (article["title"], article["url"], article["content"], digest, article["published"],
+                     article["published_at"], now, int(row["duplicate_of"] is None), article["id"]),
+                )
+                if row["duplicate_of"] is None:
+                    index.add(article, fingerprint)  # Match later duplicates against the edited content too
+                    pending.append(article)
+                continue
+            
+            article_store_stats["inserted"] += 1
+            dedup_stats["articles_seen"] += 1
+            story = index.find(article, now - DEDUP_WINDOW, fingerprint)
+            if story is not None:
+                # The index only holds identities: read the story's current sources and summary, which
+                # other workers may have changed, before adding to them
+                current = db.execute("SELECT sources, summary FROM articles WHERE id = ?", (story["id"],)).fetchone()
+                story = dict(story, sources=json.loads(current["sources"]), summary=current["summary"]) if current else None
+            if story is not None:
+                # Same story as one already stored: list this source on it and reuse its summary
+                add_source(story, article)
+                db.execute("UPDATE articles SET sources = ? WHERE id = ?", (json.dumps(story["sources"]), story["id"]))
+                if story["id"] in inserted:
+                    inserted[story["id"]]["sources"] = story["sources"]
+                dedup_stats["duplicates"] += 1
+                if story.get("summary"):
+                    dedup_stats["summaries_reused"] += 1
+            else:
+                article["sources"] = [{"source": article["source"], "url": article["url"]}]
+                index.add(article, fingerprint)
+                inserted[article["id"]] = article
+                pending.append(article)
+            
+            db.execute(
+                "INSERT INTO articles (id, source, guid, url, title, content, content_hash, published, published_at, "
+                "first_seen_at, last_seen_at, summary, needs_summary, duplicate_of, sources) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (article["id"], article["source"], article.get("guid", ""), article["url"], article["title"],
+                 article["content"], digest, article["published"], article["published_at"], now, now,
+                 story.get("summary") if story else None, int(story is None), story["id"] if story else None,
+                 json.dumps(article.get("sources", []))),
+            )
+        
+        db.execute("DELETE FROM articles WHERE last_seen_at < ?", (now - ARTICLE_RETENTION,))
+        db.commit()
+    
+    if pending:
+        logger.info(f"🗃️ {len(pending)} new or changed articles of {len(articles)} fetched")
+    return pending
+
+def pending_articles(limit: int) -> List[Dict]:
+    """Return the newest stored stories still waiting for a summary"""
+    with article_store_lock:
+        rows = get_article_db().execute(
+            "SELECT id, source, guid, url, title, content, published, published_at, sources FROM articles "
+            "WHERE needs_summary = 1 ORDER BY published_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+    return [dict(row, sources=json.loads(row["sources"])) for row in rows]
+
+def store_summaries(items: List[Dict], model_written: List[bool]):
+    """Save summaries for stories whose content hasn't changed since they were summarized; fallback
+    summaries are shown meanwhile but leave the story pending until the model summarizes it"""
+    with article_store_lock:
+        db = get_article_db()
+        db.executemany(
+            "UPDATE articles SET summary = ?, needs_summary = ? WHERE id = ? AND content = ?",
+            [(item["summary"], 0 if used else 1, item["id"], item["original_content"])
+             for item, used in zip(items, model_written) if item["id"]],
+        )
+        db.commit()
+
+def store_article_audio(item_id: str, voice_name: str, audio_url: str):
+    """Remember a pre-rendered audio file for a stored story"""
+    with article_store_lock:
+        db = get_article_db()
+        db.execute(
+            "UPDATE articles SET audio_files = json_set(audio_files, ?, ?) WHERE id = ?",
+            (f'$."{voice_name}"', audio_url, item_id),
+        )
+        db.commit()
+
+def row_to_news_item(row: sqlite3.Row, fields: Optional[List[str]] = None) -> Dict:
+    """Convert a stored story into a serialized NewsItem, optionally only some of its fields"""
+    item = {}
+    for field in fields or NEWS_ITEM_COLUMNS:
+        value = row[NEWS_ITEM_COLUMNS[field]]
+        if field in ("sources", "audio_files"):
+            value = json.loads(value)
+        elif field == "audio_file":
+            value = json.loads(value).get(PRERENDER_VOICES[0]) if PRERENDER_VOICES else None
+        item[field] = value
+    return item
+
+def encode_cursor(published_at: float, item_id: str) -> str:
+    """Opaque pagination cursor pointing just past a story"""
+    return base64.urlsafe_b64encode(json.dumps([published_at, item_id]).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Decode a cursor from encode_cursor, raising ValueError if it is malformed"""
+    try:
+        published_at, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(published_at), str(item_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+@stage_timer("query")
+def query_news(
+    limit: int = MAX_NEWS_ITEMS,
+    sources: Optional[List[str]] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """Return a page of summarized stories, newest first, and the cursor of the next page"""
+    conditions = ["duplicate_of IS NULL", "summary IS NOT NULL"]
+    params: List[Any] = []
+    if sources:
+        conditions.append(f"source IN ({', '.join('?' * len(sources))})")
+        params.extend(sources)
+    if since is not None:
+        conditions.append("published_at >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append("published_at < ?")
+        params.append(until)
+    if cursor:
+        conditions.append("(published_at, id) < (?, ?)")
+        params.extend(decode_cursor(cursor))
+    
+    # Only read the columns the projection needs, plus the sort key for the cursor
+    columns = {"id", "published_at"} | {NEWS_ITEM_COLUMNS[field] for field in fields or NEWS_ITEM_COLUMNS}
+    with article_store_lock:
+        rows = get_article_db().execute(
+            f"SELECT {', '.join(sorted(columns))} FROM articles WHERE {' AND '.join(conditions)} "
+            "ORDER BY published_at DESC, id DESC LIMIT ?", params + [limit]
+        ).fetchall()
+    
+    next_cursor = encode_cursor(rows[-1]["published_at"], rows[-1]["id"]) if len(rows) == limit else None
+    return [row_to_news_item(row, fields) for row in rows], next_cursor
+
+def get_article_store_stats() -> Dict:
+    """Return article store counters and sizes"""
+    with article_store_lock:
+        total, pending = get_article_db().execute(
+            "SELECT COUNT(*), COALESCE(SUM(needs_summary), 0) FROM articles"
+        ).fetchone()
+    return dict(article_store_stats, articles=total, pending_summaries=pending)
+
+async def run_store_call(func, *args, **kwargs):
+    """Run an article store call on the default executor, so waiting on article_store_lock never stalls the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
 def huggingface_summarize(text: str) -> str:
     """Summarize text using Hugging Face Falconsai/text_summarization model"""
     global summarizer_model, summarizer_tokenizer
@@ -187,30 +1550,291 @@ def huggingface_summarize(text: str) -> str:
             return simple_summarize(text)
         
         # Prepare text for summarization
-        if len(text) > 1024:  # Truncate if too long
-            text = text[:1024]
+        if len(text) > SUMMARY_INPUT_CHARS:  # Truncate if too long
+            text = text[:SUMMARY_INPUT_CHARS]
+        
+        import torch
         
         # Tokenize and generate summary
-        inputs = summarizer_tokenizer.encode("summarize: " + text, return_tensors="pt", max_length=512, truncation=True)
-        
-        with torch.no_grad():
-            summary_ids = summarizer_model.generate(
-                inputs,
-                max_length=150,
-                min_length=30,
-                length_penalty=2.0,
-                num_beams=4,
-                early_stopping=True
+        with stage_timer("tokenize"):
+            inputs = summarizer_tokenizer.encode("summarize: " + text, return_tensors="pt", max_length=SUMMARY_MAX_INPUT_TOKENS, truncation=True)
+        
+        with torch.no_grad(), stage_timer("generate"):
+            summary_ids = summarizer_model.generate(inputs, **SUMMARY_GENERATION_CONFIG)
+        
+        with stage_timer("decode"):
+            summary = summarizer_tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+        
+        logger.info(f"✅ Generated summary using Hugging Face Falconsai/text_summarization model")
+        return summary
+        
+    except Exception as e:
+        logger.error(f"Error in Hugging Face summarization: {e}")
+        return simple_summarize(text)
+
+def generate_summaries(encoded: List[List[int]], batch_size: int, generation_config: Dict) -> List[Optional[str]]:
+    """Generate one summary per tokenized input in length-sorted padded batches; None where a batch failed"""
+    import torch
+    
+    summaries: List[Optional[str]] = [None] * len(encoded)
+    order = sorted(range(len(encoded)), key=lambda i: len(encoded[i]))
+    
+    for start in range(0, len(order), max(1, batch_size)):
+        batch = order[start:start + batch_size]
+        try:
+            # Pad only to the longest input in this batch
+            inputs = summarizer_tokenizer.pad({"input_ids": [encoded[i] for i in batch]}, return_tensors="pt")
+            
+            with torch.no_grad(), stage_timer("generate"):
+                summary_ids = summarizer_model.generate(
+                    inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    **generation_config
+                )
+            
+            with stage_timer("decode"):
+                decoded = summarizer_tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+            for i, summary in zip(batch, decoded):
+                summaries[i] = summary
+            
+        except Exception as e:
+            logger.error(f"Error in batched Hugging Face summarization: {e}")
+    
+    return summaries
+
+def tokenize_sentences(text: str) -> Tuple[array, List[int]]:
+    """Return an article's token ids and the end offset of each sentence, tokenizing each article once"""
+    key = content_key(text, SUMMARIZER_MODEL_NAME)
+    cached = token_cache.get(key)
+    if cached is not None:
+        token_cache.move_to_end(key)
+        token_cache_stats["hits"] += 1
+        return cached
+    
+    token_cache_stats["misses"] += 1
+    ids, ends = array("i"), []
+    sentences = [sentence for sentence in SENTENCE_BOUNDARY_PATTERN.split(text.strip()) if sentence]
+    if sentences:
+        for sentence_ids in summarizer_tokenizer(sentences, add_special_tokens=False)["input_ids"]:
+            ids.extend(sentence_ids)
+            ends.append(len(ids))
+    
+    token_cache[key] = (ids, ends)
+    while len(token_cache) > SUMMARY_TOKEN_CACHE_SIZE:
+        token_cache.popitem(last=False)
+    return ids, ends
+
+def plan_chunks(ids: array, ends: List[int], budget: int, max_chunks: int = SUMMARY_MAX_CHUNKS) -> List[List[int]]:
+    """Pack whole sentences into chunks of at most budget tokens; a sentence longer than the budget is cut"""
+    chunks: List[List[int]] = []
+    chunk_start = sentence_start = 0
+    
+    for end in ends:
+        if end - chunk_start > budget and sentence_start > chunk_start:
+            chunks.append(ids[chunk_start:sentence_start].tolist())
+            chunk_start = sentence_start
+        while end - chunk_start > budget:
+            chunks.append(ids[chunk_start:chunk_start + budget].tolist())
+            chunk_start += budget
+        sentence_start = end
+        if len(chunks) >= max_chunks:
+            break
+    
+    if chunk_start < len(ids):
+        chunks.append(ids[chunk_start:].tolist())
+    return chunks[:max_chunks]
+
+def map_reduce_summarize(texts: List[str], batch_size: int, generation_config: Dict) -> List[Optional[str]]:
+    """Summarize whole articles: chunk summaries generated together, then merged per article in a reduce pass"""
+    # Build model inputs from the cached sentence ids instead of tokenizing the prompt again
+    prefix = summarizer_tokenizer("summarize:", add_special_tokens=False)["input_ids"]
+    eos = [summarizer_tokenizer.eos_token_id] if summarizer_tokenizer.eos_token_id is not None else []
+    budget = max(1, SUMMARY_MAX_INPUT_TOKENS - len(prefix) - len(eos))
+    with stage_timer("tokenize"):
+        plans = [plan_chunks(*tokenize_sentences(text), budget) or [[]] for text in texts]
+    
+    summaries: List[Optional[str]] = [None] * len(texts)
+    
+    # Articles that fit in one chunk are summarized directly with the full generation settings
+    single = [i for i, chunks in enumerate(plans) if len(chunks) == 1]
+    generated = generate_summaries([prefix + plans[i][0] + eos for i in single], batch_size, generation_config)
+    for i, summary in zip(single, generated):
+        summaries[i] = summary
+    
+    # Map: every chunk of every long article in one length-sorted batch run
+    chunk_owners = [i for i, chunks in enumerate(plans) if len(chunks) > 1 for _ in chunks]
+    chunk_inputs = [prefix + chunk + eos for chunks in plans if len(chunks) > 1 for chunk in chunks]
+    chunk_summaries = generate_summaries(chunk_inputs, batch_size, dict(generation_config, **SUMMARY_MAP_CONFIG))
+    
+    merged: Dict[int, List[Optional[str]]] = {}
+    for i, summary in zip(chunk_owners, chunk_summaries):
+        merged.setdefault(i, []).append(summary)
+    
+    # Reduce: summarize the joined chunk summaries; an article with a failed chunk stays None
+    reduce = [i for i, parts in merged.items() if all(part is not None for part in parts)]
+    if reduce:
+        prompts = ["summarize: " + " ".join(merged[i]) for i in reduce]
+        with stage_timer("tokenize"):
+            encoded = summarizer_tokenizer(prompts, max_length=SUMMARY_MAX_INPUT_TOKENS, truncation=True)["input_ids"]
+        for i, summary in zip(reduce, generate_summaries(encoded, batch_size, generation_config)):
+            summaries[i] = summary
+    
+    return summaries
+
+def encode_prompts(texts: List[str]) -> List[List[int]]:
+    """Tokenize truncated summarization prompts without padding so inputs can be grouped by length"""
+    prompts = ["summarize: " + text[:SUMMARY_INPUT_CHARS] for text in texts]
+    with stage_timer("tokenize"):
+        return summarizer_tokenizer(prompts, max_length=SUMMARY_MAX_INPUT_TOKENS, truncation=True)["input_ids"]
+
+def model_summarize_batch(texts: List[str], batch_size: int = SUMMARY_BATCH_SIZE, generation_config: Optional[Dict] = None,
+                          mode: Optional[str] = None) -> List[Optional[str]]:
+    """Summarize many texts with the loaded model; None where the model produced no summary"""
+    if generation_config is None:
+        generation_config = SUMMARY_GENERATION_CONFIG
+    if mode is None:
+        mode = SUMMARY_MODE
+    if summarizer_model is None or summarizer_tokenizer is None:
+        return [None] * len(texts)
+    
+    try:
+        if mode == "chunked":
+            generated = map_reduce_summarize(texts, batch_size, generation_config)
+        else:
+            generated = generate_summaries(encode_prompts(texts), batch_size, generation_config)
+    except Exception as e:
+        logger.error(f"Error preparing summarization batch, retrying per item: {e}")
+        generated = [None] * len(texts)
+    
+    for i, summary in enumerate(generated):
+        if summary is None:
+            # The batch holding this text failed: retry it on its own
+            try:
+                generated[i] = generate_summaries(encode_prompts([texts[i]]), 1, generation_config)[0]
+            except Exception as e:
+                logger.error(f"Error in Hugging Face summarization: {e}")
+    return [summary or None for summary in generated]
+
+def huggingface_summarize_batch(texts: List[str], batch_size: int = SUMMARY_BATCH_SIZE, generation_config: Optional[Dict] = None,
+                                mode: Optional[str] = None) -> List[str]:
+    """Summarize many texts, generating length-sorted padded batches in one forward pass each"""
+    if not texts:
+        return []
+    if summarizer_model is None or summarizer_tokenizer is None:
+        logger.warning("Summarization model not loaded, falling back to simple summarization")
+        return [simple_summarize(text) for text in texts]
+    
+    generated = model_summarize_batch(texts, batch_size, generation_config, mode)
+    logger.info(f"✅ Generated {len(texts)} summaries in batches of {batch_size} using Hugging Face {SUMMARIZER_MODEL_NAME} model")
+    return [summary or simple_summarize(text) for text, summary in zip(texts, generated)]
+
+def summary_cache_key(text: str) -> str:
+    """Return the cache key for a summary: article content plus model and generation settings"""
+    return content_key(
+        text,
+        SUMMARIZER_MODEL_NAME,
+        SUMMARIZER_BACKEND,
+        json.dumps(SUMMARY_GENERATION_CONFIG, sort_keys=True),
+        str(SUMMARY_INPUT_CHARS),
+        str(SUMMARY_MAX_INPUT_TOKENS),
+        # Only chunked mode adds parts, so truncate-mode keys stay the same as before
+        *(["chunked", str(SUMMARY_MAX_CHUNKS), json.dumps(SUMMARY_MAP_CONFIG, sort_keys=True)]
+          if SUMMARY_MODE == "chunked" else []),
+    )
+
+def get_summary_db() -> Optional[sqlite3.Connection]:
+    """Open the on-disk summary cache, creating it on first use"""
+    global summary_db
+    
+    if summary_db is None:
+        try:
+            os.makedirs(os.path.dirname(SUMMARY_CACHE_PATH) or ".", exist_ok=True)
+            summary_db = sqlite3.connect(SUMMARY_CACHE_PATH, check_same_thread=False)
+            summary_db.execute("PRAGMA journal_mode=WAL")
+            summary_db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, summary TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
             )
+            summary_db.execute("CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at)")
+            summary_db.commit()
+        except Exception as e:
+            logger.error(f"Error opening summary cache {SUMMARY_CACHE_PATH}: {e}")
+            summary_db = None
+    return summary_db
+
+def _remember_summary(key: str, summary: str):
+    """Put a summary in the in-memory LRU (caller holds summary_cache_lock)"""
+    summary_lru[key] = summary
+    summary_lru.move_to_end(key)
+    while len(summary_lru) > SUMMARY_CACHE_LRU_SIZE:
+        summary_lru.popitem(last=False)
+
+def summary_cache_get(key: str) -> Optional[str]:
+    """Look up a cached summary, first in memory and then on disk"""
+    with summary_cache_lock:
+        if key in summary_lru:
+            summary_lru.move_to_end(key)
+            summary_cache_stats["memory_hits"] += 1
+            return summary_lru[key]
         
-        summary = summarizer_tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+        db = get_summary_db()
+        if db is not None:
+            try:
+                now = time.time()
+                row = db.execute(
+                    "SELECT summary FROM summaries WHERE key = ? AND created_at >= ?",
+                    (key, now - SUMMARY_CACHE_MAX_AGE),
+                ).fetchone()
+                if row is not None:
+                    db.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+                    db.commit()
+                    _remember_summary(key, row[0])
+                    summary_cache_stats["disk_hits"] += 1
+                    return row[0]
+            except Exception as e:
+                logger.error(f"Error reading summary cache: {e}")
         
-        logger.info(f"✅ Generated summary using Hugging Face Falconsai/text_summarization model")
-        return summary
+        summary_cache_stats["misses"] += 1
+        return None
+
+def summary_cache_put(items: Dict[str, str]):
+    """Store summaries in memory and on disk, evicting old and least recently used entries"""
+    with summary_cache_lock:
+        for key, summary in items.items():
+            _remember_summary(key, summary)
         
-    except Exception as e:
-        logger.error(f"Error in Hugging Face summarization: {e}")
-        return simple_summarize(text)
+        db = get_summary_db()
+        if db is None or not items:
+            return
+        try:
+            now = time.time()
+            db.executemany(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, summary, now, now) for key, summary in items.items()],
+            )
+            db.execute("DELETE FROM summaries WHERE created_at < ?", (now - SUMMARY_CACHE_MAX_AGE,))
+            db.execute(
+                "DELETE FROM summaries WHERE key IN ("
+                "SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (SUMMARY_CACHE_MAX_ENTRIES,),
+            )
+            db.commit()
+            summary_cache_stats["writes"] += len(items)
+        except Exception as e:
+            logger.error(f"Error writing summary cache: {e}")
+
+def summarize_batch_in_worker(texts: List[str]) -> Tuple[List[str], List[bool], List[Tuple]]:
+    """Summarize a batch in the worker, reporting per text whether the model (not the fallback) wrote it and the stage timings"""
+    # Worker processes have their own metrics; collect the timings so the server process records them
+    stage_collector.observations = []
+    try:
+        if not summarizer_worker_ready():
+            logger.warning("Summarization model not loaded, falling back to simple summarization")
+        generated = model_summarize_batch(texts)
+        summaries = [summary or simple_summarize(text) for text, summary in zip(texts, generated)]
+        return summaries, [summary is not None for summary in generated], stage_collector.observations
+    finally:
+        stage_collector.observations = None
 
 def simple_summarize(text: str) -> str:
     """Simple text summarization by taking first few sentences (fallback)"""
@@ -238,62 +1862,248 @@ def simple_summarize(text: str) -> str:
         logger.error(f"Error summarizing text: {e}")
         return text[:200] + "..." if len(text) > 200 else text
 
-def generate_celebrity_voice(text: str, voice_name: str) -> str:
-    """Generate audio using TTS with celebrity voice simulation"""
+def get_audio_db() -> Optional[sqlite3.Connection]:
+    """Open the audio cache index, creating it on first use"""
+    global audio_db
+    
+    if audio_db is None:
+        try:
+            os.makedirs(os.path.dirname(AUDIO_CACHE_INDEX_PATH) or ".", exist_ok=True)
+            audio_db = sqlite3.connect(AUDIO_CACHE_INDEX_PATH, check_same_thread=False)
+            audio_db.execute("PRAGMA journal_mode=WAL")
+            audio_db.execute(
+                "CREATE TABLE IF NOT EXISTS audio_files ("
+                "key TEXT PRIMARY KEY, filename TEXT NOT NULL, voice TEXT NOT NULL, engine TEXT NOT NULL, "
+                "rate TEXT NOT NULL, size_bytes INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            audio_db.execute("CREATE INDEX IF NOT EXISTS idx_audio_accessed ON audio_files (accessed_at)")
+            audio_db.commit()
+        except Exception as e:
+            logger.error(f"Error opening audio cache index {AUDIO_CACHE_INDEX_PATH}: {e}")
+            audio_db = None
+    return audio_db
+
+def voice_rate(voice_name: str, engine: str) -> str:
+    """Return the speech rate an engine uses for a voice (part of the audio cache key)"""
+    if engine != "pyttsx3":
+        return "normal"
+    # Adjust speech rate based on character
+    if voice_name == 'stephen_hawking':
+        return "120"  # Slower
+    elif voice_name == 'david_attenborough':
+        return "140"  # Measured pace
+    return "150"  # Normal pace
+
+def audio_cache_key(text: str, voice_name: str, engine: str) -> str:
+    """Return the audio cache key for the full text hash, voice, engine and rate"""
+    return content_key(hashlib.sha256(text.encode("utf-8")).hexdigest(), voice_name, engine, voice_rate(voice_name, engine))
+
+def audio_cache_lookup(text: str, voice_name: str, engines: Optional[List[str]] = None) -> Optional[str]:
+    """Return the URL of already synthesized audio for this text and voice, from any of the given engines"""
+    with audio_cache_lock:
+        db = get_audio_db()
+        if db is None:
+            return None
+        try:
+            for engine in engines or AUDIO_ENGINE_EXTENSIONS:
+                key = audio_cache_key(text, voice_name, engine)
+                row = db.execute("SELECT filename FROM audio_files WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                if not os.path.exists(os.path.join(AUDIO_DIR, row[0])):
+                    # File was removed behind our back; forget it
+                    forget_prerendered(row[0])
+                    db.execute("DELETE FROM audio_files WHERE key = ?", (key,))
+                    db.commit()
+                    continue
+                db.execute("UPDATE audio_files SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                db.commit()
+                audio_cache_stats["hits"] += 1
+                return f"/{AUDIO_DIR}/{row[0]}"
+        except Exception as e:
+            logger.error(f"Error reading audio cache index: {e}")
+        audio_cache_stats["misses"] += 1
+        return None
+
+def evict_audio_files():
+    """Delete least recently used audio files until the cache fits its byte budget (caller holds audio_cache_lock)"""
+    db = get_audio_db()
+    total = db.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM audio_files").fetchone()[0]
+    if total <= AUDIO_CACHE_MAX_BYTES:
+        return
+    for key, filename, size_bytes in db.execute(
+        "SELECT key, filename, size_bytes FROM audio_files ORDER BY accessed_at ASC"
+    ).fetchall():
+        if total <= AUDIO_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(os.path.join(AUDIO_DIR, filename))
+        except FileNotFoundError:
+            pass
+        forget_prerendered(filename)
+        db.execute("DELETE FROM audio_files WHERE key = ?", (key,))
+        total -= size_bytes
+        audio_cache_stats["evictions"] += 1
+    db.commit()
+
+def synthesize_to_cache(text: str, voice_name: str, engine: str, render: Callable[[str], None]) -> str:
+    """Render audio to a temporary file, atomically move it into place and index it"""
+    key = audio_cache_key(text, voice_name, engine)
+    audio_filename = f"news_{voice_name}_{engine}_{key[:16]}.{AUDIO_ENGINE_EXTENSIONS[engine]}"
+    audio_path = os.path.join(AUDIO_DIR, audio_filename)
+    tmp_path = os.path.join(AUDIO_DIR, f".tmp-{uuid.uuid4().hex}.{AUDIO_ENGINE_EXTENSIONS[engine]}")
+    
+    try:
+        with stage_timer("tts", engine):
+            render(tmp_path)
+        # Readers never see a partially written file
+        os.replace(tmp_path, audio_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    with audio_cache_lock:
+        db = get_audio_db()
+        if db is not None:
+            try:
+                now = time.time()
+                db.execute(
+                    "INSERT OR REPLACE INTO audio_files "
+                    "(key, filename, voice, engine, rate, size_bytes, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, audio_filename, voice_name, engine, voice_rate(voice_name, engine),
+                     os.path.getsize(audio_path), now, now),
+                )
+                db.commit()
+                audio_cache_stats["writes"] += 1
+                evict_audio_files()
+            except Exception as e:
+                logger.error(f"Error writing audio cache index: {e}")
+    
+    return f"/{AUDIO_DIR}/{audio_filename}"
+
+def reconcile_audio_cache():
+    """Drop index entries whose file is gone and delete audio files the index doesn't know about"""
+    # One worker reconciles at a time; the others skip it at startup
+    state = get_shared_state()
+    if not state.acquire_lease("audio_reconcile", WORKER_ID, AUDIO_RECONCILE_LEASE_TTL):
+        return
+    try:
+        reconcile_audio_files()
+    finally:
+        state.release_lease("audio_reconcile", WORKER_ID)
+
+def reconcile_audio_files():
+    """Reconcile the audio directory with its index (with the reconcile lease held)"""
+    with audio_cache_lock:
+        db = get_audio_db()
+        if db is None:
+            return
+        try:
+            indexed = {}
+            for key, filename in db.execute("SELECT key, filename FROM audio_files").fetchall():
+                if os.path.exists(os.path.join(AUDIO_DIR, filename)):
+                    indexed[filename] = key
+                else:
+                    forget_prerendered(filename)
+                    db.execute("DELETE FROM audio_files WHERE key = ?", (key,))
+            db.commit()
+            
+            now = time.time()
+            for filename in os.listdir(AUDIO_DIR):
+                # Leftover temporary files and generated audio with no index entry; recent ones may still
+                # be rendering, or moved into place and about to be indexed, in another worker
+                if filename.startswith(".tmp-") or (filename.startswith("news_") and filename not in indexed):
+                    path = os.path.join(AUDIO_DIR, filename)
+                    try:
+                        if now - os.path.getmtime(path) > AUDIO_ORPHAN_GRACE:
+                            os.remove(path)
+                            audio_cache_stats["orphans_removed"] += 1
+                    except FileNotFoundError:
+                        pass
+            
+            evict_audio_files()
+            logger.info(f"🧹 Audio cache reconciled: {len(indexed)} files indexed, {audio_cache_stats['orphans_removed']} orphans removed")
+        except Exception as e:
+            logger.error(f"Error reconciling audio cache: {e}")
+
+def get_audio_cache_stats() -> Dict:
+    """Return audio cache counters and current size"""
+    stats = dict(audio_cache_stats)
+    with audio_cache_lock:
+        db = get_audio_db()
+        if db is not None:
+            files, size_bytes = db.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM audio_files").fetchone()
+            stats.update(files=files, size_bytes=size_bytes, max_bytes=AUDIO_CACHE_MAX_BYTES)
+    return stats
+
+def pyttsx3_synthesize(text: str, voice_name: str, audio_path: str):
+    """Render text to a file with pyttsx3 (run on the dedicated pyttsx3 thread)"""
+    # Configure voice based on celebrity selection
+    voices = tts_engine.getProperty('voices')
+    if voices:
+        # Select voice based on celebrity preference
+        voice_index = 0
+        if voice_name in ['morgan_freeman', 'barack_obama']:
+            # Prefer male voices
+            for i, voice in enumerate(voices):
+                if 'male' in voice.name.lower() or 'david' in voice.name.lower():
+                    voice_index = i
+                    break
+        elif voice_name in ['winston_churchill']:
+            # Prefer British/formal voices
+            for i, voice in enumerate(voices):
+                if 'british' in voice.name.lower() or 'uk' in voice.name.lower():
+                    voice_index = i
+                    break
+        
+        tts_engine.setProperty('voice', voices[voice_index].id)
+    
+    tts_engine.setProperty('rate', int(voice_rate(voice_name, "pyttsx3")))
+    
+    tts_engine.save_to_file(text, audio_path)
+    tts_engine.runAndWait()
+
+def gtts_synthesize(text: str, audio_path: str):
+    """Render text to a file with Google Text-to-Speech"""
+    from gtts import gTTS
+    tts = gTTS(text=text, lang='en', slow=False)
+    tts.save(audio_path)
+
+def generate_celebrity_voice(text: str, voice_name: str, engine: Optional[str] = None, check_cache: bool = True) -> str:
+    """Generate audio using TTS with celebrity voice simulation, reusing cached audio
+
+    engine restricts synthesis to "gtts" or "pyttsx3"; by default gTTS is tried first.
+    check_cache=False skips the cache lookup when the caller has already missed.
+    """
     global tts_engine
     
     try:
-        # Create unique filename
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-        audio_filename = f"news_{voice_name}_{text_hash}.wav"
-        audio_path = f"static/audio/{audio_filename}"
+        # Already synthesized for this exact text and voice
+        audio_url = audio_cache_lookup(text, voice_name, [engine] if engine else None) if check_cache else None
+        if audio_url:
+            logger.info(f"♻️ Reusing cached audio for {voice_name} voice: {audio_url}")
+            return audio_url
         
         logger.info(f"🎤 Generating audio with {voice_name} voice")
         
         # Try gTTS first (Google Text-to-Speech)
-        try:
-            tts = gTTS(text=text, lang='en', slow=False)
-            tts.save(audio_path)
-            logger.info(f"✅ Audio generated successfully using gTTS: {audio_filename}")
-            return f"/static/audio/{audio_filename}"
-        except Exception as gtts_error:
-            logger.warning(f"gTTS failed: {gtts_error}, trying pyttsx3")
-        
-        # Fallback to pyttsx3
-        if tts_engine:
-            # Configure voice based on celebrity selection
-            voices = tts_engine.getProperty('voices')
-            if voices:
-                # Select voice based on celebrity preference
-                voice_index = 0
-                if voice_name in ['morgan_freeman', 'barack_obama']:
-                    # Prefer male voices
-                    for i, voice in enumerate(voices):
-                        if 'male' in voice.name.lower() or 'david' in voice.name.lower():
-                            voice_index = i
-                            break
-                elif voice_name in ['winston_churchill']:
-                    # Prefer British/formal voices
-                    for i, voice in enumerate(voices):
-                        if 'british' in voice.name.lower() or 'uk' in voice.name.lower():
-                            voice_index = i
-                            break
-                
-                tts_engine.setProperty('voice', voices[voice_index].id)
-            
-            # Adjust speech rate based on character
-            if voice_name == 'stephen_hawking':
-                tts_engine.setProperty('rate', 120)  # Slower
-            elif voice_name == 'david_attenborough':
-                tts_engine.setProperty('rate', 140)  # Measured pace
-            else:
-                tts_engine.setProperty('rate', 150)  # Normal pace
-            
-            tts_engine.save_to_file(text, audio_path)
-            tts_engine.runAndWait()
+        if engine in (None, "gtts"):
+            try:
+                audio_url = synthesize_to_cache(text, voice_name, "gtts", lambda path: gtts_synthesize(text, path))
+                logger.info(f"✅ Audio generated successfully using gTTS: {audio_url}")
+                return audio_url
+            except Exception as gtts_error:
+                logger.warning(f"gTTS failed: {gtts_error}, trying pyttsx3")
+        
+        # Fallback to pyttsx3, always on its own thread since the engine is not thread-safe
+        if tts_engine and engine in (None, "pyttsx3"):
+            audio_url = synthesize_to_cache(
+                text, voice_name, "pyttsx3",
+                lambda path: pyttsx3_executor.submit(pyttsx3_synthesize, text, voice_name, path).result(),
+            )
             
-            logger.info(f"✅ Audio generated successfully using pyttsx3: {audio_filename}")
-            return f"/static/audio/{audio_filename}"
+            logger.info(f"✅ Audio generated successfully using pyttsx3: {audio_url}")
+            return audio_url
         
         logger.warning("No TTS engine available")
         return None
@@ -302,85 +2112,1038 @@ def generate_celebrity_voice(text: str, voice_name: str) -> str:
         logger.error(f"Error generating audio: {e}")
         return None
 
+def split_text_for_tts(text: str) -> List[str]:
+    """Split text into sentence chunks for streaming synthesis, merging very short sentences"""
+    chunks = []
+    current = ""
+    for sentence in re.split(r'(?<=[.!?])\s+', text.strip()):
+        if not sentence:
+            continue
+        current = f"{current} {sentence}".strip()
+        if len(current) >= TTS_STREAM_CHUNK_MIN_CHARS:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+def wav_stream_header(channels: int, sample_width: int, frame_rate: int) -> bytes:
+    """Build a WAV header for a stream of unknown length"""
+    block_align = channels * sample_width
+    return (
+        b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, frame_rate, frame_rate * block_align, block_align, sample_width * 8)
+        + b"data" + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+def read_audio_chunk(audio_url: str, include_header: bool) -> bytes:
+    """Read a synthesized chunk as bytes that can be appended to an audio stream"""
+    audio_path = audio_url.lstrip("/")
+    if not audio_path.endswith(".wav"):
+        # MP3 frames can simply be concatenated
+        with open(audio_path, "rb") as f:
+            return f.read()
+    
+    # WAV chunks each carry a header: send one streaming header, then raw frames only
+    with wave.open(audio_path, "rb") as wav:
+        frames = wav.readframes(wav.getnframes())
+        if include_header:
+            return wav_stream_header(wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) + frames
+        return frames
+
+def audio_text_for_item(item: Dict) -> str:
+    """Return the text the frontend reads aloud for a news item"""
+    return f"{item['title']}. {item['summary']}"
+
+def queue_prerender(items: List[Dict]):
+    """Queue freshly summarized items for audio pre-rendering in the configured voices"""
+    if prerender_queue is None:
+        return
+    for item in items:
+        # Budget: only the first few configured voices are pre-rendered
+        for voice_name in PRERENDER_VOICES[:PRERENDER_MAX_VOICES]:
+            try:
+                prerender_queue.put_nowait((item, voice_name))
+                prerender_stats["queued"] += 1
+            except asyncio.QueueFull:
+                prerender_stats["dropped"] += 1
+
+async def prerender_worker():
+    """Pre-render queued audio one item at a time, yielding to user audio requests"""
+    while True:
+        item, voice_name = await prerender_queue.get()
+        try:
+            # Low priority: wait while users are waiting on audio
+            while inference_queue_depth["audio"] > 0:
+                await asyncio.sleep(0.5)
+            
+            text = audio_text_for_item(item)
+            audio_url = await synthesize_audio(text, voice_name, kind="prerender", block=True)
+            if audio_url:
+                await record_prerendered_audio(item, voice_name, audio_url)
+                remember_prerendered(content_key(text, voice_name), audio_url)
+                prerender_stats["rendered"] += 1
+            else:
+                prerender_stats["failed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            prerender_stats["failed"] += 1
+            logger.error(f"Error pre-rendering audio: {e}")
+        finally:
+            prerender_queue.task_done()
+
+async def record_prerendered_audio(item: Dict, voice_name: str, audio_url: str):
+    """Attach a pre-rendered file to the stored story and to the copies in the current snapshot"""
+    if item.get("id"):
+        await run_store_call(store_article_audio, item["id"], voice_name, audio_url)
+    
+    cache_time, snapshot = get_news_snapshot() or (0, [])
+    in_snapshot = [cached for cached in snapshot if item.get("id") and cached["id"] == item["id"]]
+    for news_item in [item] + in_snapshot:
+        news_item.setdefault("audio_files", {})[voice_name] = audio_url
+        if voice_name == PRERENDER_VOICES[0]:
+            news_item["audio_file"] = audio_url
+    if in_snapshot:
+        # Republish so other workers (and the serialized body and ETag) pick up the new audio
+        set_news_snapshot(cache_time, snapshot)
+
+def remember_prerendered(key: str, audio_url: str):
+    """Track a pre-rendered file so requests for it count as hits, forgetting the oldest beyond the limit"""
+    filename = os.path.basename(audio_url)
+    with prerender_lock:
+        prerendered_files[filename] = key
+        prerendered_files.move_to_end(filename)
+        prerendered_keys[key] = filename
+        while len(prerendered_files) > PRERENDER_TRACKED_LIMIT:
+            old_filename, old_key = prerendered_files.popitem(last=False)
+            if prerendered_keys.get(old_key) == old_filename:
+                del prerendered_keys[old_key]
+
+def forget_prerendered(filename: str):
+    """Stop tracking a pre-rendered file, e.g. once the audio cache has evicted it"""
+    with prerender_lock:
+        key = prerendered_files.pop(filename, None)
+        if key is not None and prerendered_keys.get(key) == filename:
+            del prerendered_keys[key]
+
+def count_prerendered_play(path: str, scope) -> None:
+    """Count a served audio file as a pre-render hit; follow-up range requests of the same play are not counted"""
+    if not PRERENDER_AUDIO or os.path.basename(path) not in prerendered_files:
+        return
+    range_header = dict(scope.get("headers", [])).get(b"range", b"")
+    if not range_header or range_header.startswith(b"bytes=0-"):
+        prerender_stats["request_hits"] += 1
+
+def start_prerender_worker():
+    """Start the background audio pre-render worker"""
+    global prerender_queue, prerender_task
+    
+    prerender_queue = asyncio.Queue(maxsize=PRERENDER_QUEUE_SIZE)
+    prerender_task = asyncio.ensure_future(prerender_worker())
+    logger.info(f"🎧 Audio pre-rendering enabled for voices: {', '.join(PRERENDER_VOICES[:PRERENDER_MAX_VOICES])}")
+
+def get_prerender_stats() -> Dict:
+    """Return pre-render counters, the request hit rate and snapshot coverage
+
+    Hits are plays of pre-rendered files (served from /static/audio, or asked for through
+    /api/generate-audio); misses are /api/generate-audio requests that had to synthesize.
+    """
+    stats = dict(prerender_stats, enabled=PRERENDER_AUDIO, tracked_files=len(prerendered_files))
+    requests_seen = stats["request_hits"] + stats["request_misses"]
+    stats["request_hit_rate"] = round(stats["request_hits"] / requests_seen, 3) if requests_seen else None
+    snapshot = (get_news_snapshot() or (0, []))[1]
+    stats["snapshot_coverage"] = (
+        round(sum(1 for item in snapshot if item.get("audio_file")) / len(snapshot), 3) if snapshot else None
+    )
+    return stats
+
+class MemoryStateBackend:
+    """Shared state kept in this process; only suitable for a single worker"""
+    
+    name = "memory"
+    
+    def __init__(self):
+        self.values: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self.values.get(key)
+        if entry is None or (entry[1] is not None and entry[1] <= time.time()):
+            return None
+        return entry[0]
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        self.values[key] = (value, time.time() + ttl if ttl else None)
+    
+    def delete(self, key: str):
+        self.values.pop(key, None)
+    
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Take the lease, or extend it if owner already holds it"""
+        with self.lock:
+            if self.get(f"lease:{name}") not in (None, owner):
+                return False
+            self.set(f"lease:{name}", owner, ttl)
+            return True
+    
+    def release_lease(self, name: str, owner: str):
+        with self.lock:
+            if self.get(f"lease:{name}") == owner:
+                self.delete(f"lease:{name}")
+
+class SQLiteStateBackend:
+    """Shared state in a SQLite file, for workers on one host"""
+    
+    name = "sqlite"
+    
+    def __init__(self, path: str = CACHE_BACKEND_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit, so leases can take the write lock explicitly with BEGIN IMMEDIATE
+        self.db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS shared_state (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)")
+        self.lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value FROM shared_state WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO shared_state (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl if ttl else None),
+            )
+    
+    def delete(self, key: str):
+        with self.lock:
+            self.db.execute("DELETE FROM shared_state WHERE key = ?", (key,))
+    
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Take the lease, or extend it if owner already holds it"""
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute(
+                    "SELECT value FROM shared_state WHERE key = ? AND expires_at > ?", (f"lease:{name}", now)
+                ).fetchone()
+                if row is not None and row[0] != owner:
+                    return False
+                self.db.execute(
+                    "INSERT OR REPLACE INTO shared_state (key, value, expires_at) VALUES (?, ?, ?)",
+                    (f"lease:{name}", owner, now + ttl),
+                )
+                return True
+            finally:
+                self.db.execute("COMMIT")
+    
+    def release_lease(self, name: str, owner: str):
+        with self.lock:
+            self.db.execute("DELETE FROM shared_state WHERE key = ? AND value = ?", (f"lease:{name}", owner))
+
+class RedisStateBackend:
+    """Shared state in Redis (or anything speaking its protocol), for workers on several hosts"""
+    
+    name = "redis"
+    
+    def __init__(self, url: str = REDIS_URL, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client
+    
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(key)
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        self.client.set(key, value, px=int(ttl * 1000) if ttl else None)
+    
+    def delete(self, key: str):
+        self.client.delete(key)
+    
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Take the lease, or extend it if owner already holds it"""
+        key = f"lease:{name}"
+        if self.client.set(key, owner, nx=True, px=int(ttl * 1000)):
+            return True
+        return self._if_owner(key, owner, lambda pipe: pipe.pexpire(key, int(ttl * 1000)))
+    
+    def release_lease(self, name: str, owner: str):
+        key = f"lease:{name}"
+        self._if_owner(key, owner, lambda pipe: pipe.delete(key))
+    
+    def _if_owner(self, key: str, owner: str, action: Callable) -> bool:
+        """Apply action to key atomically, only while owner holds it"""
+        from redis.exceptions import WatchError
+        
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) != owner:
+                    return False
+                pipe.multi()
+                action(pipe)
+                pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+STATE_BACKENDS = {
+    "memory": MemoryStateBackend,
+    "sqlite": SQLiteStateBackend,
+    "redis": RedisStateBackend,
+}
+
+def get_shared_state():
+    """Return the configured shared state backend, creating it on first use"""
+    global shared_state
+    
+    if shared_state is None:
+        if CACHE_BACKEND not in STATE_BACKENDS:
+            raise ValueError(f"Unknown NEWSBREEZE_CACHE_BACKEND {CACHE_BACKEND!r}; choose from {', '.join(STATE_BACKENDS)}")
+        shared_state = STATE_BACKENDS[CACHE_BACKEND]()
+        logger.info(f"🗄️ Shared state backend: {shared_state.name} (worker {WORKER_ID})")
+    return shared_state
+
+def get_news_snapshot() -> Optional[Tuple[float, List[Dict]]]:
+    """Return the shared (cache_time, items) snapshot, deserializing it only when its version changed"""
+    state = get_shared_state()
+    version = state.get("news_snapshot_version")
+    if version is None:
+        return None
+    if local_snapshot.get("version") != version:
+        raw = state.get("news_snapshot")
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        local_snapshot.clear()
+        local_snapshot.update(version=data["version"], snapshot=(data["cache_time"], data["news"]))
+    return local_snapshot["snapshot"]
+
+def set_news_snapshot(cache_time: float, items: List[Dict]):
+    """Publish a new snapshot to every worker"""
+    version = uuid.uuid4().hex
+    state = get_shared_state()
+    state.set("news_snapshot", json.dumps({"version": version, "cache_time": cache_time, "news": items}))
+    state.set("news_snapshot_version", version)
+    local_snapshot.clear()
+    local_snapshot.update(version=version, snapshot=(cache_time, items))
+
+def drop_news_snapshot():
+    """Discard the shared snapshot so the next read refreshes"""
+    state = get_shared_state()
+    state.delete("news_snapshot_version")
+    state.delete("news_snapshot")
+    local_snapshot.clear()
+
+def poller_mode() -> bool:
+    """Report whether feeds are polled in the background (by this worker or by the leader)"""
+    return poller_leader_task is not None
+
+async def wait_for_shared_refresh() -> List[Dict]:
+    """Wait for the worker holding the refresh lease to publish a fresh snapshot"""
+    logger.info("⏳ Another worker is refreshing the news, waiting for its snapshot")
+    deadline = time.time() + REFRESH_LEASE_TTL
+    while time.time() < deadline:
+        snapshot = get_news_snapshot()
+        if snapshot and datetime.now().timestamp() - snapshot[0] < CACHE_DURATION:
+            return snapshot[1]
+        await asyncio.sleep(0.5)
+    # The other worker gave up; answer from the shared article store
+    return (await run_store_call(query_news, MAX_NEWS_ITEMS))[0]
+
+async def poller_leadership():
+    """Keep the poller lease: the leader polls feeds and summarizes, followers serve the shared snapshot"""
+    while True:
+        try:
+            state = get_shared_state()
+            leader = state.acquire_lease("poller", WORKER_ID, POLLER_LEASE_TTL)
+            if leader and not poller_tasks:
+                logger.info("👑 This worker is the feed poller")
+                # Only the leader summarizes, so only the leader holds the summarization model
+                start_model_loading(["summarizer"])
+                start_feed_poller()
+            elif not leader and poller_tasks:
+                logger.warning("Lost the poller lease, stopping background polling")
+                await stop_feed_poller()
+            
+            if leader and state.get("refresh_requested"):
+                state.delete("refresh_requested")
+                logger.info("🔄 Forced refresh: polling all feeds now")
+                asyncio.ensure_future(single_flight("forced_refresh", refresh_all_feeds))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error renewing the poller lease: {e}")
+        await asyncio.sleep(POLLER_LEASE_RENEW)
+
+def get_shared_state_stats() -> Dict:
+    """Return the backend in use and this worker's role"""
+    return {
+        "backend": CACHE_BACKEND,
+        "worker_id": WORKER_ID,
+        "poller_leader": bool(poller_tasks),
+        "snapshot_version": local_snapshot.get("version"),
+    }
+
+async def publish_news_snapshot():
+    """Rebuild the shared news snapshot from the article store, keeping the current one (and its ETag) if nothing changed"""
+    items = (await run_store_call(query_news, MAX_NEWS_ITEMS))[0]
+    snapshot = get_news_snapshot()
+    if snapshot and snapshot[1] == items:
+        return
+    set_news_snapshot(datetime.now().timestamp(), items)
+
+async def refresh_feed(source_name: str, url: str):
+    """Fetch one feed and summarize only the entries that are new or changed since earlier polls"""
+    articles = await fetch_rss_feed(url, source_name)
+    loop = asyncio.get_running_loop()
+    pending = await loop.run_in_executor(None, ingest_articles, articles) if articles else []
+    
+    # Stories left with a fallback summary (model loading, failed batch) get another try, a few per poll
+    queued = {article["id"] for article in pending}
+    retries = await loop.run_in_executor(None, pending_articles, PENDING_RETRY_BATCH)
+    pending += [article for article in retries if article["id"] not in queued]
+    if not articles and not pending:
+        return
+    
+    if pending:
+        # Background work waits for queue space instead of being rejected
+        items = await summarize_articles(pending, block=True)
+        logger.info(f"📝 Summarized {len(items)} articles from {source_name}")
+    await publish_news_snapshot()
+
+async def refresh_all_feeds():
+    """Poll every feed once now, outside their regular schedules"""
+    await asyncio.gather(*(refresh_feed(name, url) for name, url in RSS_FEEDS.items()), return_exceptions=True)
+
+async def poll_feed(source_name: str, url: str):
+    """Refresh a feed forever on its own jittered interval, waiting out its backoff while its circuit is open"""
+    interval = FEED_REGISTRY.get(source_name, FEED_DEFAULTS)["interval"]
+    
+    # Stagger the first polls so feeds don't all hit the summarizer together
+    await asyncio.sleep(random.uniform(0, 2))
+    while True:
+        try:
+            await refresh_feed(source_name, url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error polling {source_name}: {e}")
+        
+        jitter = random.uniform(-FEED_POLL_JITTER, FEED_POLL_JITTER)
+        backoff = feed_state[source_name]["open_until"] - time.time() if source_name in feed_state else 0
+        await asyncio.sleep(max(interval * (1 + jitter), backoff))
+
+def start_feed_poller():
+    """Start one background polling task per RSS feed"""
+    for source_name, rss_url in RSS_FEEDS.items():
+        task = poller_tasks.get(source_name)
+        if task is None or task.done():
+            poller_tasks[source_name] = asyncio.ensure_future(poll_feed(source_name, rss_url))
+    logger.info(f"🔄 Background polling started for {len(poller_tasks)} feeds")
+
+async def stop_feed_poller():
+    """Cancel the background polling tasks"""
+    for task in poller_tasks.values():
+        task.cancel()
+    await asyncio.gather(*poller_tasks.values(), return_exceptions=True)
+    poller_tasks.clear()
+
 @app.on_event("startup")
 async def startup_event():
-    """Load AI models on startup"""
+    """Start loading AI models and polling feeds in the background"""
+    global startup_seconds, poller_leader_task, idle_unload_task
+    
     logger.info("🚀 Starting NewsBreeze with Hugging Face AI integration")
-    load_ai_models()
+    if CACHE_BACKEND == "memory" and WORKERS > 1:
+        logger.warning("⚠️ Several workers with the memory backend each keep their own snapshot; use sqlite or redis")
+    asyncio.get_running_loop().run_in_executor(None, reconcile_audio_cache)
+    if PRERENDER_AUDIO:
+        start_prerender_worker()
+    if BACKGROUND_POLLING:
+        # The summarizer is loaded only by whichever worker wins the poller lease
+        model_states["summarizer"] = "standby"
+        start_model_loading(["tts"])
+        # Serve what was stored before the restart while the first polls run
+        if get_news_snapshot() is None and (await run_store_call(query_news, 1))[0]:
+            await publish_news_snapshot()
+        poller_leader_task = asyncio.ensure_future(poller_leadership())
+    else:
+        start_model_loading()
+    if MODEL_IDLE_UNLOAD > 0:
+        idle_unload_task = asyncio.ensure_future(unload_idle_models())
+    
+    startup_seconds = round(time.time() - PROCESS_START_TIME, 3)
+    logger.info(f"⚡ Accepting requests {startup_seconds}s after process start, models loading in background")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background polling, give up the poller lease, close the shared HTTP client and stop inference workers"""
+    if poller_leader_task is not None:
+        poller_leader_task.cancel()
+    if idle_unload_task is not None:
+        idle_unload_task.cancel()
+    if poller_tasks:
+        await stop_feed_poller()
+        # Hand the poller over to another worker without waiting for the lease to expire
+        get_shared_state().release_lease("poller", WORKER_ID)
+    if prerender_task is not None:
+        prerender_task.cancel()
+    if http_client is not None:
+        await http_client.aclose()
+    shutdown_inference_workers()
+
+class RequestTimingMiddleware:
+    """Times every request by route template, so paths with parameters share a series (plain ASGI, for low overhead)"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        started = time.perf_counter()
+        status = [500]
+        
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router records the matched route in the scope
+            observe("newsbreeze_http_request_seconds", time.perf_counter() - started,
+                    route=getattr(scope.get("route"), "path", "other"), status=str(status[0]))
+
+app.add_middleware(RequestTimingMiddleware)
 
 @app.get("/")
 async def home(request: Request):
     """Serve the main page"""
     return templates.TemplateResponse("index.html", {"request": request})
 
+@traced("summarize_texts")
+async def summarize_texts(texts: List[str], block: bool = False) -> Tuple[List[str], List[bool]]:
+    """Summarize texts in batches off the event loop, reusing cached and in-progress summaries of the same text;
+    also returns, per text, whether the model wrote the summary rather than the fallback"""
+    if not texts:
+        return [], []
+    loop = asyncio.get_running_loop()
+    
+    # Until the model is first ready, requests degrade to simple summaries; background work waits for it,
+    # as does everything after an idle unload, since reloading mapped weights is quick
+    reloading = model_states["summarizer"] in ("unloaded", "reloading")
+    if not await ensure_model("summarizer", wait=block or reloading):
+        return [simple_summarize(text) for text in texts], [False] * len(texts)
+    futures = []
+    leaders: Dict[str, asyncio.Future] = {}
+    leader_texts: Dict[str, str] = {}
+    
+    for text in texts:
+        key = summary_cache_key(text)
+        future = inflight_calls.get("summary:" + key)
+        if future is None:
+            cached = summary_cache_get(key)
+            if cached is not None:
+                future = loop.create_future()
+                future.set_result((cached, True))
+                futures.append(future)
+                continue
+            
+            future = loop.create_future()
+            inflight_calls["summary:" + key] = future
+            future.add_done_callback(lambda f, key=key: inflight_calls.pop("summary:" + key, None))
+            leaders[key] = future
+            leader_texts[key] = text
+        futures.append(future)
+    
+    async def run_batch():
+        global summary_executor
+        batch_keys, batch_texts = list(leader_texts.keys()), list(leader_texts.values())
+        try:
+            summaries, model_used, observations = await run_inference(
+                "summary", get_summary_executor(), summarize_batch_in_worker, batch_texts, block=block
+            )
+            for metric, seconds, labels in observations:
+                observe(metric, seconds, **labels)
+            # Fallback summaries are not keyed by the model, so only cache real ones
+            model_summaries = {key: summary for key, summary, used in zip(batch_keys, summaries, model_used) if used}
+            if model_summaries:
+                await loop.run_in_executor(None, summary_cache_put, model_summaries)
+            for key, summary, used in zip(batch_keys, summaries, model_used):
+                leaders[key].set_result((summary, used))
+        except asyncio.CancelledError:
+            for future in leaders.values():
+                future.cancel()
+            raise
+        except HTTPException as e:
+            for future in leaders.values():
+                if not future.done():
+                    future.set_exception(e)
+        except Exception as e:
+            logger.error(f"Error in summarization batch: {e}")
+            if isinstance(e, BrokenProcessPool):
+                summary_executor = None  # Restart the pool on the next batch
+            for key, text in zip(batch_keys, batch_texts):
+                if not leaders[key].done():
+                    leaders[key].set_result((simple_summarize(text), False))
+    
+    if leaders:
+        # Run as a task so the batch completes for other waiters even if this caller goes away
+        asyncio.ensure_future(run_batch())
+    
+    # gather retrieves every future's exception when a rejected batch fails them all
+    results = await asyncio.gather(*(asyncio.shield(future) for future in futures))
+    return [summary for summary, _ in results], [used for _, used in results]
+
+async def summarize_text(text: str, block: bool = False) -> str:
+    """Summarize a single text off the event loop"""
+    return (await summarize_texts([text], block=block))[0][0]
+
+@traced("summarize_articles")
+async def summarize_articles(articles: List[Dict], block: bool = False) -> List[Dict]:
+    """Summarize raw articles into serialized NewsItem dicts"""
+    # Use Hugging Face model for summarization, batched across articles
+    summaries, model_used = await summarize_texts([article["content"] for article in articles], block=block)
+    
+    processed_articles = []
+    model_written = []
+    for i, (article, summary, used) in enumerate(zip(articles, summaries, model_used)):
+        try:
+            news_item = NewsItem(
+                id=article.get("id", ""),
+                title=article["title"],
+                summary=summary,
+                original_content=article["content"],
+                url=article["url"],
+                published=article["published"],
+                published_at=article.get("published_at", 0.0),
+                source=article["source"],
+                sources=article.get("sources") or [{"source": article["source"], "url": article["url"]}],
+            )
+            processed_articles.append(news_item.dict())
+            model_written.append(used)
+            
+        except Exception as e:
+            logger.error(f"Error processing article {i}: {e}")
+            continue
+    
+    await run_store_call(store_summaries, processed_articles, model_written)
+    
+    # Optional next stage: render audio for the new summaries in the background
+    queue_prerender(processed_articles)
+    return processed_articles
+
+async def summarize_articles_stream(articles: List[Dict]):
+    """Yield (index, NewsItem dict) pairs as soon as each article's summary is ready"""
+    # A single-article first chunk gets the first result out quickly; the rest are batched
+    chunks = [list(range(min(1, len(articles))))]
+    for start in range(1, len(articles), SUMMARY_BATCH_SIZE):
+        chunks.append(list(range(start, min(start + SUMMARY_BATCH_SIZE, len(articles)))))
+    
+    async def summarize_chunk(indices: List[int]):
+        items = await summarize_articles([articles[i] for i in indices])
+        by_url = {item["url"]: item for item in items}
+        return [(i, by_url[articles[i]["url"]]) for i in indices if articles[i]["url"] in by_url]
+    
+    tasks = [asyncio.ensure_future(summarize_chunk(indices)) for indices in chunks if indices]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for pair in await next_done:
+                yield pair
+    finally:
+        for task in tasks:
+            task.cancel()
+
+@traced("refresh_news")
+async def refresh_news() -> List[Dict]:
+    """Fetch all feeds, summarize and cache the latest news; one worker at a time"""
+    state = get_shared_state()
+    if not state.acquire_lease("news_refresh", WORKER_ID, REFRESH_LEASE_TTL):
+        return await wait_for_shared_refresh()
+    try:
+        return await refresh_news_locked()
+    finally:
+        state.release_lease("news_refresh", WORKER_ID)
+
+async def refresh_news_locked() -> List[Dict]:
+    """Fetch all feeds, summarize and cache the latest news (with the refresh lease held)"""
+    current_time = datetime.now().timestamp()
+    logger.info("📰 Fetching fresh news from RSS feeds")
+    
+    # Fetch from all RSS sources concurrently and store what is new or changed
+    all_articles = take_late_articles() + await fetch_all_feeds()
+    await asyncio.get_running_loop().run_in_executor(None, ingest_articles, all_articles)
+    
+    logger.info(f"Total articles fetched: {len(all_articles)}")
+    
+    # Summarize the newest pending stories; the rest wait for later refreshes
+    await summarize_articles(await run_store_call(pending_articles, MAX_NEWS_ITEMS))
+    
+    # Cache the latest stories from the store
+    processed_articles = (await run_store_call(query_news, MAX_NEWS_ITEMS))[0]
+    set_news_snapshot(current_time, processed_articles)
+    
+    logger.info(f"Returning {len(processed_articles)} processed articles with Hugging Face AI summaries")
+    return processed_articles
+
+def forced_refresh_allowed() -> bool:
+    """Allow one forced refresh per FORCED_REFRESH_INTERVAL across all clients and workers"""
+    # A lease nobody renews or releases: the first taker wins until it expires (SET NX PX on redis)
+    if not get_shared_state().acquire_lease("forced_refresh", uuid.uuid4().hex, FORCED_REFRESH_INTERVAL):
+        news_response_stats["refreshes_throttled"] += 1
+        return False
+    news_response_stats["forced_refreshes"] += 1
+    return True
+
+def force_refresh():
+    """Make the next read refresh: poll all feeds now (via the poller leader), or drop the on-request cache"""
+    if poller_tasks:
+        logger.info("🔄 Forced refresh: polling all feeds now")
+        asyncio.ensure_future(single_flight("forced_refresh", refresh_all_feeds))
+    elif poller_mode():
+        # The leader picks the request up on its next lease renewal
+        get_shared_state().set("refresh_requested", WORKER_ID, POLLER_LEASE_TTL)
+    else:
+        drop_news_snapshot()
+
+@traced("current_news")
+async def current_news() -> Dict:
+    """Return the latest news snapshot, refreshing it first when it has expired"""
+    current_time = datetime.now().timestamp()
+    snapshot = get_news_snapshot()
+    
+    # The background poller keeps the snapshot fresh; never refresh inline
+    if poller_mode():
+        if snapshot is not None:
+            news_response_stats["cache_hits"] += 1
+            cache_time, cached_news = snapshot
+            return {"news": cached_news, "cached": True, "updated_at": datetime.fromtimestamp(cache_time).isoformat()}
+        logger.info("News snapshot not ready yet, first poll still running")
+        news_response_stats["cache_misses"] += 1
+        return {"news": [], "cached": False, "refreshing": True}
+    
+    # Check cache
+    if snapshot is not None:
+        cache_time, cached_news = snapshot
+        if current_time - cache_time < CACHE_DURATION:
+            # Merge articles from feeds that missed the previous deadline
+            late_articles = take_late_articles()
+            if late_articles and await asyncio.get_running_loop().run_in_executor(None, ingest_articles, late_articles):
+                await summarize_articles(await run_store_call(pending_articles, MAX_NEWS_ITEMS))
+                cached_news = (await run_store_call(query_news, MAX_NEWS_ITEMS))[0]
+                set_news_snapshot(cache_time, cached_news)
+            logger.info("Returning cached news")
+            news_response_stats["cache_hits"] += 1
+            return {"news": cached_news, "cached": True}
+    
+    # Concurrent callers on an expired cache share a single refresh
+    news_response_stats["cache_misses"] += 1
+    processed_articles = await single_flight("news_refresh", refresh_news)
+    return {"news": processed_articles, "cached": False}
+
+def parse_time_param(name: str, value: Optional[str]) -> Optional[float]:
+    """Parse a since/until parameter given as epoch seconds or ISO 8601 (UTC when no offset is given)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: expected epoch seconds or ISO 8601")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def parse_fields_param(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated field projection"""
+    if fields is None:
+        return None
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in selected if field not in NEWS_ITEM_COLUMNS]
+    if unknown or not selected:
+        raise HTTPException(status_code=400, detail=f"Invalid fields {unknown}; choose from {', '.join(NEWS_ITEM_COLUMNS)}")
+    return selected
+
 @app.get("/api/news")
-async def get_news():
-    """Fetch and return latest news with AI-powered summaries"""
+@traced("get_news", root=True)
+async def get_news(
+    request: Request,
+    refresh: bool = Query(False, description="Refresh now instead of serving the cached snapshot (rate limited)"),
+    source: Optional[List[str]] = Query(None, description="Only these sources (repeatable)"),
+    since: Optional[str] = Query(None, description="Published at or after (epoch seconds or ISO 8601)"),
+    until: Optional[str] = Query(None, description="Published before (epoch seconds or ISO 8601)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(MAX_NEWS_ITEMS, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,summary"),
+):
+    """Fetch and return latest news with AI-powered summaries; filter, page and project with query parameters"""
     try:
-        cache_key = "latest_news"
-        current_time = datetime.now().timestamp()
-        
-        # Check cache
-        if cache_key in news_cache:
-            cache_time, cached_news = news_cache[cache_key]
-            if current_time - cache_time < CACHE_DURATION:
-                logger.info("Returning cached news")
-                return {"news": cached_news, "cached": True}
-        
-        logger.info("📰 Fetching fresh news from RSS feeds")
-        all_articles = []
-        
-        # Fetch from all RSS sources
-        for source_name, rss_url in RSS_FEEDS.items():
+        since_at, until_at = parse_time_param("since", since), parse_time_param("until", until)
+        selected_fields = parse_fields_param(fields)
+        if cursor:
             try:
-                articles = await fetch_rss_feed(rss_url, source_name)
-                all_articles.extend(articles)
-                logger.info(f"Fetched {len(articles)} articles from {source_name}")
-            except Exception as e:
-                logger.error(f"Failed to fetch from {source_name}: {e}")
-                continue
+                decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
         
-        logger.info(f"Total articles fetched: {len(all_articles)}")
-        
-        # Process articles with AI summarization
-        processed_articles = []
-        for i, article in enumerate(all_articles[:20]):  # Limit to 20 total articles
-            try:
-                # Use Hugging Face model for summarization
-                summary = huggingface_summarize(article["content"])
-                
-                news_item = NewsItem(
-                    title=article["title"],
-                    summary=summary,
-                    original_content=article["content"],
-                    url=article["url"],
-                    published=article["published"],
-                    source=article["source"]
-                )
-                processed_articles.append(news_item.dict())
-                
-            except Exception as e:
-                logger.error(f"Error processing article {i}: {e}")
-                continue
+        if refresh and forced_refresh_allowed():
+            force_refresh()
         
-        # Cache the results
-        news_cache[cache_key] = (current_time, processed_articles)
+        response = await current_news()
+        if not (source or since or until or cursor or selected_fields or limit != MAX_NEWS_ITEMS):
+            # The common case: the same snapshot for everyone, serialized once and revalidated with 304s
+            return snapshot_response(request) if response["cached"] else response
         
-        logger.info(f"Returning {len(processed_articles)} processed articles with Hugging Face AI summaries")
-        return {"news": processed_articles, "cached": False}
+        # Filtered, paged or projected queries are answered from the store's indexes
+        response["news"], response["next_cursor"] = await run_store_call(
+            query_news, limit, sources=source, since=since_at, until=until_at, cursor=cursor, fields=selected_fields
+        )
+        return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching news: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching news: {str(e)}")
 
+def ndjson_line(payload: Dict) -> bytes:
+    """Serialize one NDJSON record"""
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+def build_payload(body: bytes, version: Any, cache_time: float, media_type: str) -> Dict[str, Any]:
+    """Compress a serialized snapshot body once and compute its validators"""
+    with stage_timer("compress"):
+        compressed_gzip = gzip.compress(body, compresslevel=6)
+        compressed_br = brotli.compress(body) if brotli is not None else None
+    news_response_stats["serializations"] += 1
+    return {
+        "version": version,
+        "media_type": media_type,
+        "identity": body,
+        "gzip": compressed_gzip,
+        "br": compressed_br,
+        "etag": '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+        "last_modified": formatdate(int(cache_time), usegmt=True),
+        "last_modified_at": int(cache_time),
+    }
+
+def get_snapshot_payload() -> Dict[str, Any]:
+    """Serialize and compress the current snapshot once, with its validators"""
+    cache_time, cached_news = get_news_snapshot()
+    version = local_snapshot["version"]
+    if snapshot_payload.get("version") != version:
+        with stage_timer("serialize"):
+            body = json.dumps({
+                "news": cached_news,
+                "cached": True,
+                "updated_at": datetime.fromtimestamp(cache_time).isoformat(),
+            }).encode("utf-8")
+        snapshot_payload.clear()
+        snapshot_payload.update(build_payload(body, version, cache_time, "application/json"))
+    return snapshot_payload
+
+def get_stream_payload(selected_fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Serialize and compress the current snapshot as NDJSON for a field selection, once per snapshot"""
+    cache_time, cached_news = get_news_snapshot()
+    version = local_snapshot["version"]
+    key = ",".join(selected_fields or [])
+    payload = stream_payloads.get(key)
+    if payload is None or payload["version"] != version:
+        with stage_timer("serialize"):
+            lines = [ndjson_line({"type": "article", "article": project_fields(item, selected_fields)}) for item in cached_news]
+            lines.append(ndjson_line({"type": "meta", "cached": True, "count": len(cached_news),
+                                      "updated_at": datetime.fromtimestamp(cache_time).isoformat()}))
+        if len(stream_payloads) >= STREAM_PAYLOAD_LIMIT or any(p["version"] != version for p in stream_payloads.values()):
+            stream_payloads.clear()
+        payload = stream_payloads[key] = build_payload(b"".join(lines), version, cache_time, "application/x-ndjson")
+    return payload
+
+def encoding_etag(etag: str, encoding: str) -> str:
+    """Return the ETag of one content encoding of a payload, so caches never mix up the bodies"""
+    return etag[:-1] + ENCODING_ETAG_SUFFIXES[encoding] + '"'
+
+def snapshot_not_modified(request: Request, payload: Dict[str, Any], etag: str) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when there is no If-None-Match, against a snapshot"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since).timestamp() >= payload["last_modified_at"]
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def choose_encoding(accept_encoding: str, available: List[str]) -> str:
+    """Pick the available content encoding the client weights highest (earlier ones win ties); q=0 refuses one"""
+    weights = {}
+    for token in accept_encoding.split(","):
+        name, _, params = token.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            weights[name.strip().lower()] = quality
+    
+    best, best_quality = "identity", 0.0
+    for name in available:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+def snapshot_response(request: Request, payload: Optional[Dict[str, Any]] = None) -> Response:
+    """Answer with a pre-serialized snapshot (by default the /api/news body), or 304 if the client already has it"""
+    if payload is None:
+        payload = get_snapshot_payload()
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""), [name for name in ("br", "gzip") if payload[name] is not None])
+    
+    # Each encoding is a different body, so it gets its own ETag
+    etag = encoding_etag(payload["etag"], encoding)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": payload["last_modified"],
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if snapshot_not_modified(request, payload, etag):
+        news_response_stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    
+    news_response_stats["served"] += 1
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload[encoding], media_type=payload["media_type"], headers=headers)
+
+def project_fields(item: Dict, fields: Optional[List[str]]) -> Dict:
+    """Keep only the requested fields of a serialized NewsItem"""
+    return {field: item[field] for field in fields} if fields else item
+
+async def stream_fresh_news(current_time: float, selected_fields: Optional[List[str]]):
+    """Fetch and summarize, yielding NDJSON lines as stories complete (with the refresh lease held)"""
+    logger.info("📰 Streaming fresh news from RSS feeds")
+    articles = take_late_articles() + await fetch_all_feeds()
+    await asyncio.get_running_loop().run_in_executor(None, ingest_articles, articles)
+    
+    # Newly summarized stories first, as they complete
+    streamed = set()
+    async for _, item in summarize_articles_stream(await run_store_call(pending_articles, MAX_NEWS_ITEMS)):
+        streamed.add(item["id"])
+        yield ndjson_line({"type": "article", "article": project_fields(item, selected_fields)})
+    
+    # Then the stories already summarized in the store
+    processed_articles = (await run_store_call(query_news, MAX_NEWS_ITEMS))[0]
+    set_news_snapshot(current_time, processed_articles)
+    for item in processed_articles:
+        if item["id"] not in streamed:
+            yield ndjson_line({"type": "article", "article": project_fields(item, selected_fields)})
+    yield ndjson_line({"type": "meta", "cached": False, "count": len(processed_articles)})
+
+@app.get("/api/news/stream")
+async def stream_news(
+    request: Request,
+    refresh: bool = Query(False, description="Refresh now instead of serving the cached snapshot (rate limited)"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,summary"),
+):
+    """Stream the latest news as NDJSON: one article per line as soon as it is summarized, then a metadata line"""
+    selected_fields = parse_fields_param(fields)
+    if refresh and forced_refresh_allowed():
+        force_refresh()
+    
+    snapshot = get_news_snapshot()
+    if snapshot is not None and (poller_mode() or datetime.now().timestamp() - snapshot[0] < CACHE_DURATION):
+        # The common case: the cached snapshot, serialized once per field selection and revalidated with 304s
+        return snapshot_response(request, get_stream_payload(selected_fields))
+    
+    async def generate():
+        current_time = datetime.now().timestamp()
+        try:
+            cached_news = None
+            snapshot = get_news_snapshot()
+            if snapshot is not None:
+                cache_time, news = snapshot
+                if poller_mode() or current_time - cache_time < CACHE_DURATION:
+                    cached_news = news
+            
+            if cached_news is not None:
+                for item in cached_news:
+                    yield ndjson_line({"type": "article", "article": project_fields(item, selected_fields)})
+                yield ndjson_line({"type": "meta", "cached": True, "count": len(cached_news),
+                                   "updated_at": datetime.fromtimestamp(cache_time).isoformat()})
+                return
+            
+            if poller_mode():
+                logger.info("News snapshot not ready yet, first poll still running")
+                yield ndjson_line({"type": "meta", "cached": False, "count": 0, "refreshing": True})
+                return
+            
+            if "news_refresh" in inflight_calls:
+                # Another request is already refreshing; share its result
+                processed_articles = await asyncio.shield(inflight_calls["news_refresh"])
+                for item in processed_articles:
+                    yield ndjson_line({"type": "article", "article": project_fields(item, selected_fields)})
+                yield ndjson_line({"type": "meta", "cached": False, "count": len(processed_articles)})
+                return
+            
+            state = get_shared_state()
+            if not state.acquire_lease("news_refresh", WORKER_ID, REFRESH_LEASE_TTL):
+                # Another worker is refreshing; stream its snapshot once published
+                processed_articles = await wait_for_shared_refresh()
+                for item in processed_articles:
+                    yield ndjson_line({"type": "article", "article": project_fields(item, selected_fields)})
+                yield ndjson_line({"type": "meta", "cached": False, "count": len(processed_articles)})
+                return
+            
+            try:
+                async for line in stream_fresh_news(current_time, selected_fields):
+                    yield line
+            finally:
+                state.release_lease("news_refresh", WORKER_ID)
+            
+        except HTTPException as e:
+            yield ndjson_line({"type": "error", "status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            logger.error(f"Error streaming news: {e}")
+            yield ndjson_line({"type": "error", "status": 500, "detail": f"Error fetching news: {str(e)}"})
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.post("/api/generate-audio")
+@traced("generate_audio", root=True)
 async def generate_audio_endpoint(voice_request: VoiceRequest):
     """Generate audio using TTS with celebrity voice simulation"""
     try:
         logger.info(f"🎤 Audio generation requested for voice: {voice_request.voice_name}")
         
-        # Generate audio using TTS
-        audio_url = generate_celebrity_voice(voice_request.text, voice_request.voice_name)
+        # Generate audio using TTS off the event loop; identical requests share one synthesis
+        text, voice_name = voice_request.text, voice_request.voice_name
+        if PRERENDER_AUDIO:
+            if content_key(text, voice_name) in prerendered_keys:
+                prerender_stats["request_hits"] += 1
+            else:
+                prerender_stats["request_misses"] += 1
+        audio_url = await synthesize_audio(text, voice_name)
         
         if audio_url:
             return {
@@ -395,10 +3158,71 @@ async def generate_audio_endpoint(voice_request: VoiceRequest):
                 "message": "Failed to generate audio. TTS engine may not be available."
             }
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating audio: {e}")
         raise HTTPException(status_code=500, detail="Error generating audio")
 
+@traced("synthesize_audio")
+async def synthesize_audio(text: str, voice_name: str, engine: Optional[str] = None, kind: str = "audio", block: bool = False) -> Optional[str]:
+    """Synthesize (or reuse) audio off the event loop; identical requests share one synthesis"""
+    # Cache hits return straight away instead of waiting for (or being refused) a TTS slot
+    audio_url = await asyncio.get_running_loop().run_in_executor(
+        None, audio_cache_lookup, text, voice_name, [engine] if engine else None
+    )
+    if audio_url:
+        return audio_url
+    return await single_flight(
+        "audio:" + content_key(text, voice_name, engine or ""),
+        lambda: run_inference(kind, tts_executor, generate_celebrity_voice, text, voice_name, engine, False, block=block),
+    )
+
+@app.post("/api/generate-audio/stream")
+async def stream_audio_endpoint(voice_request: VoiceRequest):
+    """Stream audio sentence by sentence, starting as soon as the first chunk is synthesized"""
+    chunks = split_text_for_tts(voice_request.text)
+    if not chunks:
+        raise HTTPException(status_code=400, detail="No text to synthesize")
+    voice_name = voice_request.voice_name
+    
+    logger.info(f"🎤 Streaming audio requested for voice: {voice_name} ({len(chunks)} chunks)")
+    first_url = await synthesize_audio(chunks[0], voice_name)
+    if not first_url:
+        raise HTTPException(status_code=503, detail="Failed to generate audio. TTS engine may not be available.")
+    
+    # Every chunk must use the first chunk's engine so the encoded audio can be concatenated
+    extension = first_url.rsplit(".", 1)[-1]
+    engine = next(name for name, ext in AUDIO_ENGINE_EXTENSIONS.items() if ext == extension)
+    
+    async def generate():
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        next_chunk = 1
+        
+        def schedule():
+            # Keep a few chunks synthesizing ahead of the one being streamed
+            nonlocal next_chunk
+            while len(pending) < TTS_STREAM_PARALLELISM and next_chunk < len(chunks):
+                pending.append(asyncio.ensure_future(synthesize_audio(chunks[next_chunk], voice_name, engine, block=True)))
+                next_chunk += 1
+        
+        try:
+            schedule()
+            yield await loop.run_in_executor(None, read_audio_chunk, first_url, True)
+            while pending:
+                audio_url = await pending.popleft()
+                schedule()
+                if not audio_url:
+                    logger.warning(f"Audio chunk failed for {voice_name}, ending stream early")
+                    break
+                yield await loop.run_in_executor(None, read_audio_chunk, audio_url, False)
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    return StreamingResponse(generate(), media_type=AUDIO_MEDIA_TYPES[extension])
+
 @app.get("/api/voices")
 async def get_available_voices():
     """Get list of available celebrity voices"""
@@ -414,22 +3238,119 @@ async def get_available_voices():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    # Both counts scan a SQLite table under its lock
+    store_stats = await run_store_call(get_article_store_stats)
+    audio_stats = await run_store_call(get_audio_cache_stats)
     model_status = {
-        "summarizer": "loaded" if summarizer_model is not None else "not_loaded",
-        "tts": "loaded" if tts_engine is not None else "not_loaded"
+        name: "loaded" if state == "ready" else state if state in ("standby", "unloaded", "reloading") else "not_loaded"
+        for name, state in model_states.items()
     }
     
     return {
         "status": "healthy",
         "models_loaded": model_status,
         "rss_feeds": list(RSS_FEEDS.keys()),
+        "feed_stats": get_feed_stats(),
+        "deduplication": dedup_stats,
+        "article_store": store_stats,
+        "news_responses": news_response_stats,
+        "shared_state": get_shared_state_stats(),
+        "models": get_model_stats(),
+        "process_memory": process_memory_mb(),
+        "summary_cache": dict(summary_cache_stats, memory_entries=len(summary_lru)),
+        "inference_queue_depth": inference_queue_depth,
+        "audio_cache": audio_stats,
+        "audio_prerender": get_prerender_stats(),
         "ai_features": {
-            "huggingface_summarization": "Falconsai/text_summarization",
+            "huggingface_summarization": SUMMARIZER_MODEL_NAME,
+            "summarizer_backend": SUMMARIZER_BACKEND,
+            "summary_preset": SUMMARY_PRESET,
             "voice_synthesis": "gTTS + pyttsx3"
         },
         "timestamp": datetime.now().isoformat()
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: reports each model's loading state, 503 until loading has finished"""
+    # standby: another worker runs this model; unloaded/reloading: idle-unloaded and back on the next use. None is waited on
+    idle_states = ("standby", "unloaded", "reloading")
+    ready = all(state in ("ready", "failed") + idle_states for state in model_states.values())
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "degraded": any(state not in ("ready",) + idle_states for state in model_states.values()),
+            "models": {
+                name: {"state": state, "load_seconds": model_load_seconds.get(name)}
+                for name, state in model_states.items()
+            },
+            "startup_seconds": startup_seconds,
+            "uptime_seconds": round(time.time() - PROCESS_START_TIME, 3),
+        },
+    )
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics for this worker: stage and request latency histograms, cache counters and gauges"""
+    return Response(content=render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/admin/profile")
+async def profile_endpoint(
+    request: Request,
+    seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS, description="How long to sample"),
+    hz: int = Query(100, ge=1, le=1000, description="Samples per second"),
+    idle: bool = Query(False, description="Include threads that are only waiting"),
+):
+    """Sample this worker's threads and return collapsed stacks for flamegraph.pl or speedscope (admin only)"""
+    require_admin(request)
+    if not profile_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A profile is already being taken")
+    try:
+        logger.info(f"🔬 Profiling for {seconds}s at {hz} Hz")
+        loop = asyncio.get_running_loop()
+        counts = await loop.run_in_executor(profiler_executor, sample_stacks, seconds, hz, idle)
+    finally:
+        profile_lock.release()
+    
+    body = "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
+    return Response(content=body, media_type="text/plain",
+                    headers={"Content-Disposition": 'attachment; filename="newsbreeze-profile.folded"'})
+
+@app.get("/admin/tracing")
+async def get_tracing(request: Request):
+    """Report whether requests are being traced (admin only)"""
+    require_admin(request)
+    return dict(tracing, buffered_traces=len(recent_traces))
+
+@app.post("/admin/tracing")
+async def set_tracing(
+    request: Request,
+    enabled: bool = Query(..., description="Trace get_news and generate_audio requests"),
+    sample_rate: float = Query(1.0, gt=0, le=1, description="Fraction of requests to trace"),
+):
+    """Switch request tracing on or off without a restart (admin only)"""
+    require_admin(request)
+    tracing.update(enabled=enabled, sample_rate=sample_rate)
+    logger.info(f"🔍 Request tracing {'enabled' if enabled else 'disabled'} (sample rate {sample_rate})")
+    return dict(tracing, buffered_traces=len(recent_traces))
+
+@app.get("/admin/traces")
+async def get_traces(
+    request: Request,
+    limit: int = Query(20, ge=1, le=TRACE_BUFFER_SIZE),
+    name: Optional[str] = Query(None, description="Only traces of this endpoint, e.g. get_news"),
+):
+    """Return the most recent request traces, newest first, with per-span timings (admin only)"""
+    require_admin(request)
+    traces = [trace for trace in reversed(recent_traces) if name is None or trace["name"] == name]
+    return {"traces": traces[:limit]}
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    if WORKERS > 1:
+        # Workers are separate processes, so uvicorn needs the import string rather than the app object
+        uvicorn.run("app:app", host="0.0.0.0", port=8000, workers=WORKERS)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
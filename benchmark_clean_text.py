@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+NewsBreeze Text Cleaning Benchmark
+Compares the fast clean_text path with the original BeautifulSoup cleaner on feed fixtures
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import feedparser
+from bs4 import BeautifulSoup
+
+import app
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feeds")
+
+
+def legacy_clean_text(text):
+    """The original cleaner: a full BeautifulSoup parse plus two uncompiled regexes"""
+    if not text:
+        return ""
+
+    soup = BeautifulSoup(text, 'html.parser')
+    text = soup.get_text()
+    text = re.sub(r'\s+', ' ', text).strip()
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    return text
+
+
+def load_fixture_texts(fixtures_dir=FIXTURES_DIR):
+    """Return every title and body clean_text would see when ingesting the fixture feeds"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.xml"))):
+        feed = feedparser.parse(path)
+        for entry in feed.entries:
+            texts.append(entry.title)
+            if hasattr(entry, 'content') and entry.content:
+                texts.append(entry.content[0].value)
+            elif hasattr(entry, 'summary'):
+                texts.append(entry.summary)
+    return texts
+
+
+def time_cleaner(cleaner, texts, repeats):
+    """Return the seconds per pass over the texts, best of several repeats"""
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for text in texts:
+            cleaner(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewsBreeze text cleaning")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory of RSS/Atom fixture files")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    texts = load_fixture_texts(args.fixtures)
+    if not texts:
+        print(f"❌ No fixture texts found in {args.fixtures}")
+        return False
+
+    print("📊 NewsBreeze Text Cleaning Benchmark")
+    print("=" * 60)
+    print(f"{len(texts)} fixture texts")
+
+    mismatches = [text for text in texts if app.clean_text(text) != legacy_clean_text(text)]
+    legacy_seconds = time_cleaner(legacy_clean_text, texts, args.repeats)
+    fast_seconds = time_cleaner(app.clean_text, texts, args.repeats)
+
+    print(f"BeautifulSoup: {legacy_seconds * 1e6 / len(texts):8.1f} µs/text")
+    print(f"clean_text:    {fast_seconds * 1e6 / len(texts):8.1f} µs/text")
+    print(f"Speed-up:      {legacy_seconds / fast_seconds:8.1f}x")
+
+    if mismatches:
+        print(f"❌ {len(mismatches)} texts cleaned differently from the original")
+        return False
+
+    print("✅ Output identical to the original cleaner")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+NewsBreeze Pipeline Benchmark
+Replays recorded feed fixtures offline through each pipeline stage, and through the app under concurrent load
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import wave
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from benchmark_clean_text import FIXTURES_DIR, load_fixture_texts
+from benchmark_summarizer import current_rss_mb, percentile
+
+LOAD_ENDPOINTS = [
+    "/api/news",
+    "/api/news?fields=id,title,summary",
+    "/api/news?limit=5",
+    "/health",
+]
+
+
+class QuietFixtureHandler(SimpleHTTPRequestHandler):
+    """Serves the fixture directory without logging every request"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(fixtures_dir):
+    """Serve the recorded feeds on a free local port and return the server"""
+    handler = functools.partial(QuietFixtureHandler, directory=fixtures_dir)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class RssSampler:
+    """Samples this process's RSS in a thread while a stage runs, keeping the peak"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = 0.0
+        self.running = False
+
+    def __enter__(self):
+        self.peak = current_rss_mb()
+        self.running = True
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def sample(self):
+        while self.running:
+            self.peak = max(self.peak, current_rss_mb())
+            time.sleep(self.interval)
+
+    def __exit__(self, *exc):
+        self.running = False
+        self.thread.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+
+class StubTTSEngine:
+    """Stands in for the pyttsx3 engine: writes silent 16 kHz WAV audio, 60 ms per word"""
+
+    def __init__(self):
+        self.properties = {"voices": [], "rate": 150}
+
+    def getProperty(self, name):
+        return self.properties.get(name)
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def save_to_file(self, text, path):
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * int(16000 * 0.06 * len(text.split())))
+
+    def runAndWait(self):
+        pass
+
+
+def build_stub_summarizer(texts):
+    """A tiny randomly initialized T5 with a word-level tokenizer built from the fixture vocabulary"""
+    import torch
+    from tokenizers import Tokenizer, models, normalizers, pre_tokenizers
+    from transformers import PreTrainedTokenizerFast, T5Config, T5ForConditionalGeneration
+
+    vocab = {"<pad>": 0, "</s>": 1, "<unk>": 2}
+    for word in sorted({w for text in texts for w in app.WORD_PATTERN.findall(("summarize: " + text).lower())}):
+        vocab.setdefault(word, len(vocab))
+
+    backend = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    backend.normalizer = normalizers.Lowercase()
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=backend, pad_token="<pad>", eos_token="</s>", unk_token="<unk>")
+
+    config = T5Config(vocab_size=len(vocab), d_model=64, d_kv=16, d_ff=128, num_layers=2, num_heads=4,
+                      pad_token_id=0, eos_token_id=1, decoder_start_token_id=0)
+    torch.manual_seed(0)
+    return tokenizer, T5ForConditionalGeneration(config).eval()
+
+
+def use_models(kind, texts):
+    """Install stub or real summarization and TTS models; returns a description"""
+    if kind == "stub":
+        app.summarizer_tokenizer, app.summarizer_model = build_stub_summarizer(texts)
+        app.tts_engine = StubTTSEngine()
+        return {"summarizer": "stub T5 (2 layers, d_model 64)", "tts": "stub WAV writer", "tts_engine": "pyttsx3"}
+
+    app.load_summarizer_model()
+    app.init_tts_engine()
+    if app.summarizer_model is None:
+        raise RuntimeError(f"could not load {app.SUMMARIZER_MODEL_NAME}")
+    return {"summarizer": app.SUMMARIZER_MODEL_NAME, "tts": "gTTS, then pyttsx3", "tts_engine": None}
+
+
+def use_temporary_state(workdir):
+    """Point every store and cache the pipeline writes to at an empty scratch directory"""
+    app.ARTICLE_STORE_PATH = os.path.join(workdir, "articles.db")
+    app.SUMMARY_CACHE_PATH = os.path.join(workdir, "summaries.db")
+    app.AUDIO_CACHE_INDEX_PATH = os.path.join(workdir, "audio_index.db")
+    app.AUDIO_DIR = os.path.join(workdir, "audio")
+    os.makedirs(app.AUDIO_DIR, exist_ok=True)
+    app.article_db = app.summary_db = app.audio_db = None
+    app.summary_lru.clear()
+    app.feed_state.clear()
+    app.shared_state = None
+    app.local_snapshot.clear()
+    app.snapshot_payload.clear()
+
+
+def measure_stage(name, func, inputs, repeats):
+    """Time func over every input, then repeat one untimed pass under tracemalloc for allocations"""
+    func(inputs[0])  # Warm-up so one-time initialization is not counted
+
+    latencies = []
+    rss_before = current_rss_mb()
+    with RssSampler() as sampler:
+        started = time.perf_counter()
+        for _ in range(repeats):
+            for item in inputs:
+                call_started = time.perf_counter()
+                func(item)
+                latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    # tracemalloc slows everything down, so allocations are counted on a separate pass
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for item in inputs:
+        func(item)
+    after = tracemalloc.take_snapshot()
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocated = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+
+    result = {
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "throughput_per_s": round(len(latencies) / elapsed, 1),
+        "peak_rss_mb": round(sampler.peak, 1),
+        "rss_growth_mb": round(sampler.peak - rss_before, 1),
+        "traced_peak_kb": round(traced_peak / 1024, 1),
+        "retained_kb_per_call": round(sum(stat.size_diff for stat in allocated) / 1024 / len(inputs), 2),
+        "retained_blocks_per_call": round(sum(stat.count_diff for stat in allocated) / len(inputs), 1),
+    }
+    print(f"{name:<16} p50 {result['p50_ms']:>9} ms  p95 {result['p95_ms']:>9} ms  "
+          f"{result['throughput_per_s']:>9}/s  peak RSS {result['peak_rss_mb']} MB")
+    return result
+
+
+def run_stages(fixture_urls, fixture_bodies, texts, models, repeats):
+    """Benchmark fetch, parse, clean, summarize and speak on the recorded fixtures"""
+    loop = asyncio.new_event_loop()
+    stages = {}
+
+    def fetch(item):
+        name, url = item
+        app.feed_state.pop(name, None)  # Always a full download, never a 304
+        articles = loop.run_until_complete(app.fetch_rss_feed(url, name))
+        if app.feed_state[name]["full_fetches"] != 1:
+            raise RuntimeError(f"{name} was not fully downloaded: {app.get_feed_stats()[name]}")
+        return articles
+
+    def parse(item):
+        name, body = item
+        return app.parse_feed_entries(body, name)
+
+    articles = []
+    for name, body in fixture_bodies:
+        articles.extend(parse((name, body)))
+    summary_texts = [article["content"] for article in articles]
+
+    counter = iter(range(10 ** 9))
+
+    def speak(text):
+        # A fresh text each call, so every call synthesizes instead of hitting the audio cache
+        return app.generate_celebrity_voice(f"{text} ({next(counter)})", "morgan_freeman", models["tts_engine"])
+
+    stages["fetch_rss_feed"] = measure_stage("fetch_rss_feed", fetch, fixture_urls, repeats)
+    stages["parse_feed"] = measure_stage("parse_feed", parse, fixture_bodies, repeats)
+    stages["clean_text"] = measure_stage("clean_text", app.clean_text, texts, repeats)
+    stages["summarize"] = measure_stage("summarize", app.huggingface_summarize, summary_texts, 1)
+    stages["summarize_batch"] = measure_stage(
+        "summarize_batch", lambda batch: app.huggingface_summarize_batch(batch), [summary_texts], 1
+    )
+    stages["summarize_batch"]["articles_per_s"] = round(
+        len(summary_texts) * stages["summarize_batch"]["throughput_per_s"], 2
+    )
+    stages["tts"] = measure_stage("tts", speak, [app.audio_text_for_item({"title": a["title"], "summary": a["content"][:200]})
+                                                 for a in articles[:6]], 1)
+
+    loop.run_until_complete(app.http_client.aclose())
+    app.http_client = None
+    loop.close()
+    return stages
+
+
+async def drive_load(concurrency, requests_per_endpoint):
+    """Issue concurrent requests against the app in-process and time them per endpoint"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app.app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+        # The first request refreshes from the fixture feeds; time it on its own
+        started = time.perf_counter()
+        response = await client.get("/api/news")
+        results["cold_refresh"] = {"status": response.status_code,
+                                   "seconds": round(time.perf_counter() - started, 3),
+                                   "articles": len(response.json()["news"])}
+
+        for endpoint in LOAD_ENDPOINTS:
+            latencies = []
+            statuses = {}
+            slots = asyncio.Semaphore(concurrency)
+
+            async def one_request():
+                async with slots:
+                    call_started = time.perf_counter()
+                    response = await client.get(endpoint, headers={"Accept-Encoding": "gzip"})
+                    latencies.append(time.perf_counter() - call_started)
+                    statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+            with RssSampler() as sampler:
+                started = time.perf_counter()
+                await asyncio.gather(*(one_request() for _ in range(requests_per_endpoint)))
+                elapsed = time.perf_counter() - started
+
+            results[endpoint] = {
+                "requests": len(latencies),
+                "concurrency": concurrency,
+                "statuses": statuses,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                "requests_per_s": round(len(latencies) / elapsed, 1),
+                "peak_rss_mb": round(sampler.peak, 1),
+            }
+            print(f"{endpoint:<36} p50 {results[endpoint]['p50_ms']:>8} ms  p95 {results[endpoint]['p95_ms']:>8} ms  "
+                  f"{results[endpoint]['requests_per_s']:>8} req/s  {statuses}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the NewsBreeze pipeline offline on recorded feeds")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory of RSS/Atom fixture files")
+    parser.add_argument("--models", default="stub", choices=["stub", "real"], help="Tiny stub models or the real ones")
+    parser.add_argument("--mode", default="stages", choices=["stages", "load", "all"])
+    parser.add_argument("--repeats", type=int, default=20, help="Passes over the fixtures for the cheap stages")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients in load mode")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint in load mode")
+    parser.add_argument("--json", help="Write the results to this file as JSON")
+    args = parser.parse_args()
+
+    fixture_files = sorted(f for f in os.listdir(args.fixtures) if f.endswith(".xml"))
+    if not fixture_files:
+        print(f"❌ No fixtures found in {args.fixtures}")
+        return False
+
+    print("📊 NewsBreeze Pipeline Benchmark")
+    print("=" * 60)
+
+    server = start_fixture_server(args.fixtures)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    fixture_urls = [(os.path.splitext(f)[0], f"{base_url}/{f}") for f in fixture_files]
+    fixture_bodies = []
+    for f in fixture_files:
+        with open(os.path.join(args.fixtures, f), "rb") as fh:
+            fixture_bodies.append((os.path.splitext(f)[0], fh.read()))
+    texts = load_fixture_texts(args.fixtures)
+
+    use_temporary_state(tempfile.mkdtemp(prefix="newsbreeze-bench-"))
+    try:
+        models = use_models(args.models, texts)
+    except Exception as e:
+        print(f"❌ Could not load {args.models} models: {e}")
+        return False
+    print(f"{len(fixture_files)} fixture feeds, {len(texts)} texts, models: {models['summarizer']} / {models['tts']}")
+
+    results = {
+        "models": args.models,
+        "model_details": models,
+        "summary_preset": app.SUMMARY_PRESET,
+        "fixtures": fixture_files,
+        "baseline_rss_mb": round(current_rss_mb(), 1),
+    }
+
+    if args.mode in ("stages", "all"):
+        print("\n⏱️ Stages")
+        results["stages"] = run_stages(fixture_urls, fixture_bodies, texts, models, args.repeats)
+
+    if args.mode in ("load", "all"):
+        print(f"\n🔥 In-process load, {args.concurrency} concurrent clients")
+        use_temporary_state(tempfile.mkdtemp(prefix="newsbreeze-bench-"))
+        # Refresh on request, from the fixture server only, summarizing in-process with the installed models
+        app.RSS_FEEDS = dict(fixture_urls)
+        app.SUMMARY_WORKERS = 0
+        app.model_states.update(summarizer="ready", tts="ready")
+        results["load"] = asyncio.run(drive_load(args.concurrency, args.requests))
+
+    server.shutdown()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+NewsBreeze Summarizer Benchmark
+Compares summarizer backends, generation presets and long-article modes on latency, memory and quality
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app
+
+SAMPLE_ARTICLES = [
+    "The city council approved a new budget on Tuesday that increases funding for public transit by 12 percent. "
+    "Officials said the money will pay for more frequent bus service on the busiest routes and for repairs to aging "
+    "rail stations. Critics argued that the plan does not address rising housing costs, while supporters said better "
+    "transit would help residents reach jobs across the region. The budget takes effect in July.",
+    "Researchers announced the discovery of a new species of frog in the cloud forests of Ecuador. The small amber "
+    "coloured frog was found during a survey of streams at high altitude. Scientists say the species is already at "
+    "risk because its habitat is threatened by mining and farming. They called for the area to be protected and "
+    "said further surveys are planned for next year.",
+    "Global stock markets fell sharply after new data showed inflation rising faster than expected. Investors now "
+    "expect central banks to keep interest rates higher for longer. Technology shares led the decline, while energy "
+    "companies gained as oil prices climbed. Analysts warned that volatility could continue until the next round of "
+    "economic figures is released later this month.",
+    "The national football team secured a place in the tournament final with a dramatic late goal. The match had "
+    "been level for most of the second half before a substitute scored in stoppage time. Thousands of fans celebrated "
+    "in the capital's main square. The coach praised the players for their resilience and said the team would rest "
+    "before preparing for the final on Sunday.",
+    "A severe storm brought heavy rain and strong winds to the coast overnight, cutting power to more than fifty "
+    "thousand homes. Emergency services rescued several people from flooded cars, and schools in the area were "
+    "closed. Forecasters said the storm would weaken as it moved inland, but warned of further flooding along rivers "
+    "over the coming days. Repair crews are working to restore electricity.",
+    "The health ministry launched a campaign encouraging adults to get vaccinated before the winter season. Clinics "
+    "will extend their opening hours and pharmacies will offer walk-in appointments. Officials said last year's "
+    "uptake was lower than hoped and that hospitals came under pressure during the peak months. The campaign will "
+    "run on television, radio and social media.",
+]
+
+# Long articles for comparing truncation with chunked map-reduce: several stories run together, so most
+# of each text lies beyond the SUMMARY_INPUT_CHARS that truncation keeps
+LONG_ARTICLES = [
+    " ".join(SAMPLE_ARTICLES[i:] + SAMPLE_ARTICLES[:i])
+    for i in range(len(SAMPLE_ARTICLES))
+]
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def current_rss_mb():
+    """Return the resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def lcs_length(a, b):
+    """Length of the longest common subsequence of two token lists"""
+    previous = [0] * (len(b) + 1)
+    for token_a in a:
+        current = [0]
+        for j, token_b in enumerate(b):
+            current.append(previous[j] + 1 if token_a == token_b else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rouge_scores(candidate, reference):
+    """ROUGE-1 and ROUGE-L F1 between a candidate and a reference summary"""
+    cand, ref = candidate.lower().split(), reference.lower().split()
+    if not cand or not ref:
+        return 0.0, 0.0
+
+    overlap = sum(min(cand.count(token), ref.count(token)) for token in set(cand))
+    lcs = lcs_length(cand, ref)
+
+    def f1(hits):
+        if hits == 0:
+            return 0.0
+        precision, recall = hits / len(cand), hits / len(ref)
+        return 2 * precision * recall / (precision + recall)
+
+    return f1(overlap), f1(lcs)
+
+
+def tail_coverage(summary, article):
+    """Share of summary words found only in the part of the article truncation never shows the model"""
+    head = set(article[:app.SUMMARY_INPUT_CHARS].lower().split())
+    tail = set(article[app.SUMMARY_INPUT_CHARS:].lower().split()) - head
+    words = summary.lower().split()
+    if not words:
+        return 0.0
+    return sum(1 for word in words if word in tail) / len(words)
+
+
+def run_config(backend, preset, mode, texts, batch_size, torch_threads, repeats):
+    """Load one backend and time summarizing the texts with one preset and long-article mode"""
+    rss_before = current_rss_mb()
+    started = time.time()
+    app.summarizer_tokenizer, app.summarizer_model = app.build_summarizer(
+        app.SUMMARIZER_MODEL_NAME, backend, torch_threads
+    )
+    load_seconds = time.time() - started
+    rss_loaded = current_rss_mb()
+
+    generation_config = app.SUMMARY_PRESETS[preset]
+    # Warm-up run so one-time initialization is not counted
+    app.huggingface_summarize_batch(texts[:1], batch_size=1, generation_config=generation_config, mode=mode)
+    # Chunked mode tokenizes each article once and caches it; start every configuration cold
+    app.token_cache.clear()
+
+    latencies = []
+    summaries = []
+    for _ in range(repeats):
+        started = time.time()
+        summaries = app.huggingface_summarize_batch(texts, batch_size=batch_size, generation_config=generation_config, mode=mode)
+        latencies.append(time.time() - started)
+
+    result = {
+        "backend": backend,
+        "preset": preset,
+        "mode": mode,
+        "model_class": type(app.summarizer_model).__name__,
+        "load_seconds": round(load_seconds, 3),
+        "batch_seconds_p50": round(percentile(latencies, 50), 3),
+        "batch_seconds_p95": round(percentile(latencies, 95), 3),
+        "articles_per_second": round(len(texts) / percentile(latencies, 50), 3),
+        "model_rss_mb": round(rss_loaded - rss_before, 1),
+        "peak_rss_mb": round(current_rss_mb(), 1),
+        "tail_coverage": round(sum(tail_coverage(s, t) for s, t in zip(summaries, texts)) / len(texts), 3),
+        "summaries": summaries,
+    }
+
+    app.summarizer_tokenizer, app.summarizer_model = None, None
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewsBreeze summarizer backends and presets")
+    parser.add_argument("--backends", default="eager,int8,onnx", help="Comma-separated backends to compare")
+    parser.add_argument("--presets", default="quality,balanced,fast", help="Comma-separated generation presets")
+    parser.add_argument("--modes", default="truncate", help="Comma-separated long-article modes (truncate,chunked)")
+    parser.add_argument("--texts", help="JSON file with a list of article texts (defaults to built-in samples)")
+    parser.add_argument("--long", action="store_true", help="Use the built-in long articles instead of the short samples")
+    parser.add_argument("--batch-size", type=int, default=app.SUMMARY_BATCH_SIZE)
+    parser.add_argument("--torch-threads", type=int, default=app.SUMMARIZER_TORCH_THREADS)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", help="Write the results to this file as JSON")
+    args = parser.parse_args()
+
+    texts = LONG_ARTICLES if args.long else SAMPLE_ARTICLES
+    if args.texts:
+        with open(args.texts) as f:
+            texts = json.load(f)
+
+    print("📊 NewsBreeze Summarizer Benchmark")
+    print("=" * 60)
+    print(f"Model: {app.SUMMARIZER_MODEL_NAME}, {len(texts)} articles, batch size {args.batch_size}")
+
+    # Load once up front so library initialization doesn't count towards the first model's memory
+    app.build_summarizer(app.SUMMARIZER_MODEL_NAME, "eager", args.torch_threads)
+
+    results = []
+    for backend in args.backends.split(","):
+        for preset in args.presets.split(","):
+            for mode in args.modes.split(","):
+                print(f"\n⏱️ {backend} / {preset} / {mode}...")
+                try:
+                    results.append(run_config(backend, preset, mode, texts, args.batch_size, args.torch_threads, args.repeats))
+                except Exception as e:
+                    print(f"❌ {backend} / {preset} / {mode} failed: {e}")
+
+    if not results:
+        print("❌ No configuration could be benchmarked")
+        return False
+
+    # Quality is measured against the first configuration (eager / quality / truncate by default)
+    reference = results[0]
+    for result in results:
+        scores = [rouge_scores(c, r) for c, r in zip(result["summaries"], reference["summaries"])]
+        result["rouge1_vs_reference"] = round(sum(s[0] for s in scores) / len(scores), 3)
+        result["rougeL_vs_reference"] = round(sum(s[1] for s in scores) / len(scores), 3)
+
+    print("\n" + "=" * 60)
+    print(f"{'backend':<8} {'preset':<9} {'mode':<9} {'p50 s':>7} {'art/s':>7} {'model MB':>9} {'ROUGE-L':>8} {'tail':>6}")
+    for r in results:
+        print(f"{r['backend']:<8} {r['preset']:<9} {r['mode']:<9} {r['batch_seconds_p50']:>7} {r['articles_per_second']:>7} "
+              f"{r['model_rss_mb']:>9} {r['rougeL_vs_reference']:>8} {r['tail_coverage']:>6}")
+    print(f"\nROUGE is measured against {reference['backend']} / {reference['preset']} / {reference['mode']}")
+    print(f"tail: share of summary words only found beyond the first {app.SUMMARY_INPUT_CHARS} characters")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
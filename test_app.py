@@ -26,6 +26,23 @@ def test_health_endpoint():
         print(f"❌ Health check error: {e}")
         return False
 
+def test_ready_endpoint():
+    """Test the readiness endpoint"""
+    try:
+        response = requests.get("http://localhost:8000/ready", timeout=10)
+        if response.status_code in (200, 503):
+            data = response.json()
+            print(f"✅ Readiness check responded ({'ready' if data.get('ready') else 'models still loading'})")
+            for name, model in data.get('models', {}).items():
+                print(f"   {name}: {model.get('state')} ({model.get('load_seconds')}s)")
+            return True
+        else:
+            print(f"❌ Readiness check failed: {response.status_code}")
+            return False
+    except Exception as e:
+        print(f"❌ Readiness check error: {e}")
+        return False
+
 def test_news_endpoint():
     """Test the news aggregation endpoint"""
     try:
@@ -45,6 +62,62 @@ def test_news_endpoint():
         print(f"❌ News endpoint error: {e}")
         return False
 
+def test_news_revalidation():
+    """Test that an unchanged news snapshot is answered with 304 Not Modified"""
+    try:
+        print("🔄 Testing news revalidation...")
+        response = requests.get("http://localhost:8000/api/news", timeout=30)
+        etag = response.headers.get("ETag")
+        if response.status_code != 200 or not etag:
+            print(f"❌ News endpoint returned no ETag: {response.status_code}")
+            return False
+        
+        revalidated = requests.get("http://localhost:8000/api/news", headers={"If-None-Match": etag}, timeout=30)
+        if revalidated.status_code != 304:
+            print(f"❌ Expected 304 for an unchanged snapshot, got {revalidated.status_code}")
+            return False
+        print(f"✅ News revalidation working - ETag {etag}, encoding {response.headers.get('Content-Encoding', 'identity')}")
+        return True
+    except Exception as e:
+        print(f"❌ News revalidation error: {e}")
+        return False
+
+def test_news_stream_endpoint():
+    """Test the streaming news endpoint"""
+    try:
+        print("🔄 Testing streaming news endpoint (this may take a moment)...")
+        started = time.time()
+        first_article_seconds = None
+        articles = 0
+        meta = None
+        with requests.get("http://localhost:8000/api/news/stream", stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                print(f"❌ Streaming news endpoint failed: {response.status_code}")
+                return False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record["type"] == "article":
+                    articles += 1
+                    if first_article_seconds is None:
+                        first_article_seconds = time.time() - started
+                elif record["type"] == "meta":
+                    meta = record
+                elif record["type"] == "error":
+                    print(f"❌ Streaming news endpoint error: {record.get('detail')}")
+                    return False
+        if meta is None:
+            print("❌ Streaming news endpoint ended without a metadata record")
+            return False
+        print(f"✅ Streaming news endpoint working - {articles} articles streamed")
+        if first_article_seconds is not None:
+            print(f"   First article after {first_article_seconds:.2f}s, all after {time.time() - started:.2f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Streaming news endpoint error: {e}")
+        return False
+
 def test_voices_endpoint():
     """Test the voices endpoint"""
     try:
@@ -92,6 +165,33 @@ def test_audio_generation():
         print(f"❌ Audio generation error: {e}")
         return False
 
+def test_audio_streaming():
+    """Test the sentence-chunked streaming audio endpoint"""
+    try:
+        print("🔄 Testing streaming audio generation...")
+        payload = {
+            "text": "This is a test of the NewsBreeze streaming audio system. "
+                    "Each sentence is synthesized separately. The first one plays while the rest are still rendering.",
+            "voice_name": "celebrity_voice"
+        }
+        started = time.time()
+        first_chunk_seconds = None
+        total_bytes = 0
+        with requests.post("http://localhost:8000/api/generate-audio/stream", json=payload, stream=True, timeout=60) as response:
+            if response.status_code != 200:
+                print(f"❌ Streaming audio endpoint failed: {response.status_code}")
+                return False
+            for chunk in response.iter_content(chunk_size=None):
+                if first_chunk_seconds is None:
+                    first_chunk_seconds = time.time() - started
+                total_bytes += len(chunk)
+        print(f"✅ Streaming audio working - {total_bytes} bytes of {response.headers.get('content-type')}")
+        print(f"   First audio after {first_chunk_seconds:.2f}s, complete after {time.time() - started:.2f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Streaming audio error: {e}")
+        return False
+
 def main():
     """Main test function"""
     print("🎙️ NewsBreeze Application Test Suite")
@@ -103,9 +203,13 @@ def main():
     
     tests = [
         ("Health Check", test_health_endpoint),
+        ("Readiness Check", test_ready_endpoint),
         ("News Aggregation", test_news_endpoint),
+        ("News Revalidation", test_news_revalidation),
+        ("News Streaming", test_news_stream_endpoint),
         ("Voice Options", test_voices_endpoint),
         ("Audio Generation", test_audio_generation),
+        ("Audio Streaming", test_audio_streaming),
     ]
     
     passed = 0
@@ -0,0 +1,1603 @@
+#!/usr/bin/env python3
+"""
+NewsBreeze Feed Ingestion Test
+Runs the RSS fetch layer against a local stub feed server
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+<title>Stub Feed</title>
+<item>
+<title>Stub article {n}</title>
+<link>http://example.com/{path}/{n}</link>
+<description>&lt;p&gt;This is the body of stub article {n}. It is long enough to pass the minimum content length check.&lt;/p&gt;</description>
+<pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>
+</item>
+</channel>
+</rss>
+"""
+
+SLOW_FEED_DELAY = 3  # seconds
+STUB_ETAG = '"stub-v1"'
+failing_feed_hits = []
+
+
+class StubFeedHandler(BaseHTTPRequestHandler):
+    """Serves a tiny RSS document, optionally after a delay"""
+
+    def do_GET(self):
+        if self.path.startswith("/fail"):
+            failing_feed_hits.append(self.path)
+            self.send_response(500)
+            self.end_headers()
+            return
+        if self.path.startswith("/slow"):
+            time.sleep(SLOW_FEED_DELAY)
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == STUB_ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = SAMPLE_FEED.format(n=1, path=self.path.strip("/")).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", STUB_ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    """Start the stub feed server on a free local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubFeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_concurrent_fetch():
+    """Fetch several feeds at once and check the deadline is honoured"""
+    print("📡 Testing concurrent feed fetch...")
+    try:
+        import app
+
+        server = start_stub_server()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        feeds = {f"Fast {i}": f"{base}/fast{i}" for i in range(5)}
+        feeds["Slow"] = f"{base}/slow"
+
+        async def run():
+            started = time.monotonic()
+            articles = await app.fetch_all_feeds(feeds, deadline=1)
+            elapsed = time.monotonic() - started
+            # Give the slow feed time to finish in the background
+            await asyncio.sleep(SLOW_FEED_DELAY + 0.5)
+            late = app.take_late_articles()
+            await app.get_http_client().aclose()
+            return articles, elapsed, late
+
+        articles, elapsed, late = asyncio.run(run())
+        server.shutdown()
+
+        if len(articles) != 5 or elapsed > 2:
+            print(f"❌ Expected 5 articles within the deadline, got {len(articles)} in {elapsed:.2f}s")
+            return False
+        if len(late) != 1 or late[0]["source"] != "Slow":
+            print(f"❌ Slow feed articles were not delivered late: {late}")
+            return False
+
+        print(f"✅ Fetched {len(articles)} articles in {elapsed:.2f}s, slow feed delivered late")
+        return True
+    except Exception as e:
+        print(f"❌ Concurrent fetch test failed: {e}")
+        return False
+
+
+def test_conditional_revalidation():
+    """Re-fetch unchanged feeds and check they are not parsed again"""
+    print("♻️ Testing conditional feed revalidation...")
+    try:
+        import app
+
+        server = start_stub_server()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        async def run():
+            for _ in range(3):
+                await app.fetch_rss_feed(f"{base}/etag", "ETag Feed")
+                await app.fetch_rss_feed(f"{base}/plain", "Plain Feed")
+            await app.get_http_client().aclose()
+
+        asyncio.run(run())
+        server.shutdown()
+
+        stats = app.get_feed_stats()
+        etag_stats, plain_stats = stats["ETag Feed"], stats["Plain Feed"]
+        if etag_stats["full_fetches"] != 1 or etag_stats["not_modified"] != 2:
+            print(f"❌ ETag feed was not revalidated: {etag_stats}")
+            return False
+        if plain_stats["full_fetches"] != 1 or plain_stats["unchanged"] != 2:
+            print(f"❌ Unchanged body was parsed again: {plain_stats}")
+            return False
+
+        print(f"✅ Revalidation working: {stats}")
+        return True
+    except Exception as e:
+        print(f"❌ Conditional revalidation test failed: {e}")
+        return False
+
+
+def test_feed_registry():
+    """Load feeds from a registry file: disabled feeds dropped, priority order, per-feed settings"""
+    print("📋 Testing feed registry loading...")
+    try:
+        import app
+
+        config = {"feeds": [
+            {"name": "Low", "url": "http://example.com/low", "priority": 1},
+            {"name": "Off", "url": "http://example.com/off", "enabled": False},
+            {"name": "High", "url": "http://example.com/high", "priority": 9, "max_entries": 10, "interval": 60},
+            {"name": "No URL"},
+        ]}
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(config, f)
+        registry = app.load_feed_registry(f.name)
+        os.unlink(f.name)
+
+        if list(registry) != ["High", "Low"]:
+            print(f"❌ Unexpected feeds or order: {list(registry)}")
+            return False
+        if registry["High"]["max_entries"] != 10 or registry["Low"]["interval"] != app.FEED_POLL_INTERVAL:
+            print(f"❌ Per-feed settings or defaults not applied: {registry}")
+            return False
+
+        print(f"✅ Registry loaded: {list(registry)}")
+        return True
+    except Exception as e:
+        print(f"❌ Feed registry test failed: {e}")
+        return False
+
+
+def test_circuit_breaker():
+    """Stop fetching a feed that keeps failing until its backoff expires"""
+    print("🚧 Testing feed circuit breaker...")
+    try:
+        import app
+
+        server = start_stub_server()
+        url = f"http://127.0.0.1:{server.server_address[1]}/fail"
+
+        async def run():
+            for _ in range(app.FEED_FAILURE_THRESHOLD + 2):
+                await app.fetch_rss_feed(url, "Failing Feed")
+            await app.get_http_client().aclose()
+
+        asyncio.run(run())
+        server.shutdown()
+
+        stats = app.get_feed_stats()["Failing Feed"]
+        if len(failing_feed_hits) != app.FEED_FAILURE_THRESHOLD or not stats["circuit_open"] or stats["skipped"] != 2:
+            print(f"❌ Circuit did not open after {app.FEED_FAILURE_THRESHOLD} failures: "
+                  f"{len(failing_feed_hits)} requests, {stats}")
+            return False
+
+        print(f"✅ Circuit opened after {len(failing_feed_hits)} failures: {stats}")
+        return True
+    except Exception as e:
+        print(f"❌ Circuit breaker test failed: {e}")
+        return False
+
+
+def test_clean_text_equivalence():
+    """Check the fast cleaner matches the original BeautifulSoup cleaner on feed fixtures"""
+    print("🧹 Testing clean_text against the original cleaner...")
+    try:
+        import app
+        from benchmark_clean_text import legacy_clean_text, load_fixture_texts
+
+        texts = load_fixture_texts()
+        mismatches = [text for text in texts if app.clean_text(text) != legacy_clean_text(text)]
+        if not texts or mismatches:
+            print(f"❌ {len(mismatches)} of {len(texts)} fixture texts cleaned differently: {mismatches[:1]}")
+            return False
+
+        # Script contents never reach the text, and plain text skips the parser
+        if app.clean_text("<p>Hello <script>track()</script>world</p>") != "Hello world":
+            print("❌ Script contents leaked into the cleaned text")
+            return False
+        if app.clean_text("Plain   title &amp; more") != "Plain title & more":
+            print("❌ Plain-text fast path did not decode entities")
+            return False
+
+        print(f"✅ {len(texts)} fixture texts cleaned identically")
+        return True
+    except Exception as e:
+        print(f"❌ clean_text equivalence test failed: {e}")
+        return False
+
+
+def use_temporary_article_store(app):
+    """Point the app at an empty article store"""
+    app.article_db = None
+    app.ARTICLE_STORE_PATH = os.path.join(tempfile.mkdtemp(), "articles.db")
+
+
+def use_temporary_audio_cache(app):
+    """Point the app at an empty audio directory and cache index"""
+    app.audio_db = None
+    app.AUDIO_DIR = tempfile.mkdtemp()
+    app.AUDIO_CACHE_INDEX_PATH = os.path.join(tempfile.mkdtemp(), "audio_index.db")
+
+
+def stub_article(source, url, content, guid="", title=None):
+    """Build a fetched article dict like parse_feed_entries does"""
+    return {"title": title or f"{source} story", "content": content, "url": url, "guid": guid,
+            "published": "Mon, 06 Jan 2025 10:00:00 GMT", "published_at": time.time(), "source": source}
+
+
+def test_deduplication():
+    """Store the same story from several sources once, listing every source"""
+    print("🧬 Testing cross-source deduplication...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        wire = ("Global stock markets fell sharply on Tuesday after new data showed inflation rising faster than "
+                "expected. Investors now expect central banks to keep interest rates higher for longer. Technology "
+                "shares led the decline, while energy companies gained as oil prices climbed.")
+        articles = [
+            stub_article("Wire", "https://www.wire.example/markets?utm_source=rss", wire, guid="wire-1"),
+            stub_article("Paper", "https://paper.example/business/stocks", "(Agency) - " + wire + " Editing by A. Editor."),
+            stub_article("Wire Mirror", "http://wire.example/markets/", "Updated copy with a different body entirely."),
+            stub_article("Science", "https://science.example/frog", "Researchers announced the discovery of a new "
+                         "species of frog in the cloud forests of Ecuador during a survey of high altitude streams."),
+        ]
+
+        pending = app.ingest_articles(articles)
+        if [a["source"] for a in pending] != ["Wire", "Science"]:
+            print(f"❌ Unexpected stories to summarize: {[a['source'] for a in pending]}")
+            return False
+        sources = [s["source"] for s in pending[0]["sources"]]
+        if sources != ["Wire", "Paper", "Wire Mirror"]:
+            print(f"❌ Story does not list every source: {sources}")
+            return False
+
+        # Later batches use the in-memory index, caught up with stories another worker stored meanwhile
+        indexed = set(app.dedup_index.ids)
+        other_worker = sqlite3.connect(app.ARTICLE_STORE_PATH)
+        frog = articles[3]
+        other_worker.execute(
+            "INSERT INTO articles (id, source, guid, url, title, content, content_hash, published, published_at, "
+            "first_seen_at, last_seen_at, summary, needs_summary, duplicate_of, sources) "
+            "VALUES ('other', 'Other', '', 'https://other.example/storm', 'Storm', ?, '', '', ?, ?, ?, NULL, 1, NULL, '[]')",
+            ("A severe storm brought heavy rain and strong winds to the coast overnight, cutting power to more "
+             "than fifty thousand homes while emergency services rescued people from flooded cars.", time.time(), time.time(), time.time()),
+        )
+        other_worker.commit()
+        other_worker.close()
+        later = app.ingest_articles([
+            stub_article("Gazette", "https://gazette.example/frog", "Science desk: " + frog["content"]),
+            stub_article("Coast", "https://coast.example/storm", "A severe storm brought heavy rain and strong winds to "
+                         "the coast overnight, cutting power to more than fifty thousand homes while emergency services "
+                         "rescued people from flooded cars."),
+        ])
+        if later or app.dedup_index.ids != indexed | {"other"}:
+            print(f"❌ Later duplicates not matched incrementally: {[a['source'] for a in later]}")
+            return False
+
+        print(f"✅ {len(articles)} articles collapsed to {len(pending)} stories")
+        return True
+    except Exception as e:
+        print(f"❌ Deduplication test failed: {e}")
+        return False
+
+
+def test_store_lock_off_event_loop():
+    """Ingest fingerprints outside the store lock, and requests keep being served while the lock is held"""
+    print("🔓 Testing the article store lock stays off the event loop...")
+    try:
+        import httpx
+
+        import app
+
+        use_temporary_article_store(app)
+        hashed_under_lock = []
+        original_simhash = app.simhash
+
+        def simhash(text):
+            hashed_under_lock.append(app.article_store_lock.locked())
+            return original_simhash(text)
+
+        app.simhash = simhash
+        try:
+            app.ingest_articles([stub_article("Local", f"https://local.example/{name}", f"The {name} story. " * 5, guid=name)
+                                 for name in ("budget", "parks")])
+            app.ingest_articles([stub_article("Local", "https://local.example/budget", "The budget story. " * 5, guid="budget")])
+        finally:
+            app.simhash = original_simhash
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                # A long write elsewhere holds the lock; /health waits for it off the loop
+                app.article_store_lock.acquire()
+                threading.Timer(1.0, app.article_store_lock.release).start()
+                health = asyncio.ensure_future(client.get("/health"))
+                await asyncio.sleep(0.1)
+                started = time.perf_counter()
+                voices = await client.get("/api/voices")
+                elapsed = time.perf_counter() - started
+                return (await health).status_code, voices.status_code, elapsed
+
+        health_status, voices_status, elapsed = asyncio.run(scenario())
+
+        if hashed_under_lock != [False, False]:
+            print(f"❌ SimHash calls (True = under the store lock): {hashed_under_lock} (expected two, unlocked)")
+            return False
+        if health_status != 200 or voices_status != 200 or elapsed > 0.5:
+            print(f"❌ /api/voices took {elapsed:.2f}s while /health waited on the store lock ({health_status}, {voices_status})")
+            return False
+
+        print(f"✅ Fingerprints computed unlocked, /api/voices served in {elapsed * 1000:.0f}ms while the store was locked")
+        return True
+    except Exception as e:
+        print(f"❌ Store lock test failed: {e}")
+        return False
+
+
+def test_article_store():
+    """Only new or changed entries are marked for summarization, and stories survive a restart"""
+    print("🗃️ Testing incremental article store...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        body = "The city council approved a new budget that increases funding for public transit by 12 percent."
+        first = [stub_article("Local", "https://local.example/budget", body, guid="budget"),
+                 stub_article("Local", "https://local.example/parks", "Parks will open later this summer " * 3, guid="parks")]
+
+        pending = app.ingest_articles(first)
+        app.store_summaries([app.NewsItem(id=a["id"], title=a["title"], summary="Summary", original_content=a["content"],
+                                          url=a["url"], published=a["published"], source=a["source"]).dict()
+                             for a in pending], [True] * len(pending))
+
+        # Same poll again, then one entry edited
+        unchanged = app.ingest_articles([dict(a) for a in first])
+        edited = [dict(first[0], content=body + " It takes effect in July."), dict(first[1])]
+        changed = app.ingest_articles(edited)
+        if len(pending) != 2 or unchanged or [a["guid"] for a in changed] != ["budget"]:
+            print(f"❌ Change detection wrong: {len(pending)} new, {len(unchanged)} unchanged, {len(changed)} changed")
+            return False
+
+        # Reopen the store as after a restart
+        app.article_db.close()
+        app.article_db = None
+        stored, _ = app.query_news(10)
+        if len(stored) != 2 or app.get_article_store_stats()["pending_summaries"] != 1:
+            print(f"❌ Stored stories not served after reopening: {stored}")
+            return False
+
+        print(f"✅ Change detection and persistence working: {app.get_article_store_stats()}")
+        return True
+    except Exception as e:
+        print(f"❌ Article store test failed: {e}")
+        return False
+
+
+def test_news_query():
+    """Page through stored stories by source and time with a field projection"""
+    print("🔎 Testing news query API...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        now = time.time()
+        articles = []
+        for i in range(12):
+            article = stub_article(f"Source {i % 2}", f"https://example.com/{i}", f"Story {i} body " + f"word{i} " * 20)
+            article["published_at"] = now - i * 60
+            articles.append(article)
+        pending = app.ingest_articles(articles)
+        app.store_summaries([{"id": a["id"], "summary": f"Summary {a['url']}", "original_content": a["content"]}
+                             for a in pending], [True] * len(pending))
+
+        pages, cursor = [], None
+        while True:
+            page, cursor = app.query_news(4, sources=["Source 0"], since=now - 570, cursor=cursor,
+                                          fields=["id", "title", "summary"])
+            pages.append(page)
+            if cursor is None:
+                break
+
+        items = [item for page in pages for item in page]
+        if len(items) != 5 or len({item["id"] for item in items}) != 5:
+            print(f"❌ Expected 5 distinct Source 0 stories from the last 9.5 minutes, got {len(items)}")
+            return False
+        if set(items[0]) != {"id", "title", "summary"}:
+            print(f"❌ Projection returned extra fields: {sorted(items[0])}")
+            return False
+
+        print(f"✅ {len(items)} stories over {len(pages)} pages")
+        return True
+    except Exception as e:
+        print(f"❌ News query test failed: {e}")
+        return False
+
+
+def test_cursor_pagination():
+    """Two pages of stories published at the same moment: every story once, in (published_at, id) order"""
+    print("📑 Testing cursor pagination...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        published_at = time.time()
+        articles = []
+        for i in range(6):
+            article = stub_article("Local", f"https://local.example/{i}", f"Distinct story {i} " + f"topic{i} " * 20)
+            article["published_at"] = published_at  # Ties are broken by id
+            articles.append(article)
+        pending = app.ingest_articles(articles)
+        app.store_summaries([{"id": a["id"], "summary": "Summary", "original_content": a["content"]} for a in pending],
+                            [True] * len(pending))
+
+        first, cursor = app.query_news(3)
+        second, last_cursor = app.query_news(3, cursor=cursor)
+        after_last, _ = app.query_news(3, cursor=last_cursor) if last_cursor else ([], None)
+        ids = [item["id"] for item in first + second + after_last]
+        if len(first) != 3 or len(second) != 3 or len(set(ids)) != len(ids) or set(ids) != {a["id"] for a in articles}:
+            print(f"❌ Pages {len(first)} + {len(second)} + {len(after_last)} stories, {len(set(ids))} distinct of 6")
+            return False
+        if ids[:6] != sorted(ids[:6], reverse=True):
+            print(f"❌ Tied stories not ordered by id: {ids}")
+            return False
+
+        print("✅ 6 stories over 2 pages, none repeated")
+        return True
+    except Exception as e:
+        print(f"❌ Cursor pagination test failed: {e}")
+        return False
+
+
+def shared_state_backends(app):
+    """Pairs of backend instances that stand in for two workers sharing one store"""
+    path = os.path.join(tempfile.mkdtemp(), "shared_state.db")
+    memory = app.MemoryStateBackend()
+    pairs = [("memory", memory, memory), ("sqlite", app.SQLiteStateBackend(path), app.SQLiteStateBackend(path))]
+    try:
+        import fakeredis
+        server = fakeredis.FakeServer()
+        pairs.append(("redis", app.RedisStateBackend(client=fakeredis.FakeRedis(server=server, decode_responses=True)),
+                      app.RedisStateBackend(client=fakeredis.FakeRedis(server=server, decode_responses=True))))
+    except ImportError:
+        print("ℹ️ fakeredis not installed, skipping the Redis backend")
+    return pairs
+
+
+def test_shared_state_leases():
+    """Only one worker holds a lease until it is released or expires"""
+    print("🔐 Testing shared state leases...")
+    try:
+        import app
+
+        for name, first, second in shared_state_backends(app):
+            if not first.acquire_lease("poller", "worker-a", 0.5):
+                print(f"❌ {name}: first worker could not take a free lease")
+                return False
+            if second.acquire_lease("poller", "worker-b", 0.5):
+                print(f"❌ {name}: second worker took a held lease")
+                return False
+            if not first.acquire_lease("poller", "worker-a", 0.5):
+                print(f"❌ {name}: holder could not renew its lease")
+                return False
+            second.release_lease("poller", "worker-b")  # Not the holder: must be a no-op
+            if second.acquire_lease("poller", "worker-b", 0.5):
+                print(f"❌ {name}: another worker released a lease it did not hold")
+                return False
+            time.sleep(0.6)
+            if not second.acquire_lease("poller", "worker-b", 10):
+                print(f"❌ {name}: expired lease was not taken over")
+                return False
+            second.release_lease("poller", "worker-b")
+            if not first.acquire_lease("poller", "worker-a", 10):
+                print(f"❌ {name}: released lease could not be taken")
+                return False
+
+            # The forced-refresh limit holds across workers, and within one
+            original_interval, app.FORCED_REFRESH_INTERVAL = app.FORCED_REFRESH_INTERVAL, 0.5
+            try:
+                allowed = []
+                for worker_state in (first, second, first):
+                    app.shared_state = worker_state
+                    allowed.append(app.forced_refresh_allowed())
+                time.sleep(0.6)
+                allowed.append(app.forced_refresh_allowed())
+            finally:
+                app.FORCED_REFRESH_INTERVAL, app.shared_state = original_interval, None
+            if allowed != [True, False, False, True]:
+                print(f"❌ {name}: forced refreshes allowed {allowed}, expected one per interval across workers")
+                return False
+            print(f"✅ {name} leases exclusive, renewable and expiring")
+        return True
+    except Exception as e:
+        print(f"❌ Shared state lease test failed: {e}")
+        return False
+
+
+def test_shared_snapshot():
+    """A snapshot published by one worker is served, and revalidated, by another"""
+    print("📡 Testing shared news snapshot...")
+    try:
+        import app
+
+        path = os.path.join(tempfile.mkdtemp(), "shared_state.db")
+        leader, follower = app.SQLiteStateBackend(path), app.SQLiteStateBackend(path)
+        items = [{"id": "a", "title": "Story", "summary": "Summary"}]
+
+        app.shared_state = leader
+        app.local_snapshot.clear()
+        app.set_news_snapshot(1000.0, items)
+        leader_etag = app.get_snapshot_payload()["etag"]
+
+        # The follower has its own process-local copy and payload
+        app.shared_state = follower
+        app.local_snapshot.clear()
+        app.snapshot_payload.clear()
+        if app.get_news_snapshot() != (1000.0, items):
+            print(f"❌ Follower read {app.get_news_snapshot()}")
+            return False
+        if app.get_snapshot_payload()["etag"] != leader_etag:
+            print("❌ Workers disagree on the ETag of the same snapshot")
+            return False
+
+        app.shared_state = leader
+        app.set_news_snapshot(2000.0, items + [{"id": "b", "title": "Second", "summary": "Summary"}])
+        app.shared_state = follower
+        if len(app.get_news_snapshot()[1]) != 2 or app.get_snapshot_payload()["etag"] == leader_etag:
+            print("❌ Follower did not pick up the new snapshot version")
+            return False
+
+        app.drop_news_snapshot()
+        if app.get_news_snapshot() is not None:
+            print("❌ Dropped snapshot still served")
+            return False
+
+        print("✅ Snapshot shared between workers by version")
+        return True
+    except Exception as e:
+        print(f"❌ Shared snapshot test failed: {e}")
+        return False
+    finally:
+        app.shared_state = None
+        app.local_snapshot.clear()
+        app.snapshot_payload.clear()
+
+
+def test_news_validators():
+    """/api/news and /api/news/stream serve the cached snapshot compressed, with per-encoding ETags and 304s"""
+    print("🏷️ Testing snapshot validators...")
+    try:
+        import gzip
+
+        import httpx
+
+        import app
+
+        async def scenario():
+            app.shared_state = app.MemoryStateBackend()
+            app.local_snapshot.clear()
+            app.set_news_snapshot(time.time(), [{"id": "a", "title": "Story", "summary": "Summary", "source": "Local"}])
+            transport = httpx.ASGITransport(app=app.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                results = {}
+                for path in ("/api/news", "/api/news/stream?fields=id,title"):
+                    plain = await client.get(path, headers={"Accept-Encoding": "identity"})
+                    zipped = await client.get(path, headers={"Accept-Encoding": "gzip"})
+                    revalidated = await client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]})
+                    mixed = await client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": zipped.headers["ETag"]})
+                    refused = await client.get(path, headers={"Accept-Encoding": "gzip;q=0, br;q=0, deflate"})
+                    results[path] = (plain, zipped, revalidated, mixed, refused)
+                return results
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            app.shared_state = None
+            app.local_snapshot.clear()
+            app.snapshot_payload.clear()
+            app.stream_payloads.clear()
+
+        for path, (plain, zipped, revalidated, mixed, refused) in results.items():
+            if "Content-Encoding" in refused.headers or refused.headers["ETag"] != plain.headers["ETag"]:
+                print(f"❌ {path} ignored q=0 in Accept-Encoding: {refused.headers.get('Content-Encoding')}")
+                return False
+            if zipped.headers.get("Content-Encoding") != "gzip" or zipped.headers.get("Vary") != "Accept-Encoding":
+                print(f"❌ {path} not served gzip-compressed with Vary: {dict(zipped.headers)}")
+                return False
+            if plain.headers["ETag"] == zipped.headers["ETag"] or not zipped.headers["ETag"].endswith('-gz"'):
+                print(f"❌ {path} shares one ETag across encodings: {plain.headers['ETag']} {zipped.headers['ETag']}")
+                return False
+            if revalidated.status_code != 304 or mixed.status_code != 200:
+                print(f"❌ {path} revalidation: {revalidated.status_code} for the same encoding, {mixed.status_code} for another")
+                return False
+
+        lines = [json.loads(line) for line in results["/api/news/stream?fields=id,title"][0].text.splitlines()]
+        if lines != [{"type": "article", "article": {"id": "a", "title": "Story"}}, dict(lines[-1], type="meta", cached=True, count=1)]:
+            print(f"❌ Unexpected stream body: {lines}")
+            return False
+
+        print("✅ Snapshot and stream compressed, revalidated per encoding")
+        return True
+    except Exception as e:
+        print(f"❌ Snapshot validators test failed: {e}")
+        return False
+
+
+def test_unchanged_poll_keeps_etag():
+    """Republishing an unchanged article store keeps the snapshot ETag; a new story replaces it"""
+    print("🏷️ Testing unchanged polls keep the ETag...")
+    try:
+        import httpx
+
+        import app
+
+        use_temporary_article_store(app)
+        articles = [stub_article("Local", f"https://local.example/{name}", f"The {name} story has enough words to summarize. " * 3,
+                                 guid=name) for name in ("budget", "parks")]
+        def ingest_summarized(batch):
+            pending = app.ingest_articles(batch)
+            app.store_summaries([{"id": a["id"], "summary": f"Summary {a['url']}", "original_content": a["content"]} for a in pending],
+                                [True] * len(pending))
+
+        ingest_summarized([dict(article) for article in articles])
+
+        async def scenario():
+            app.shared_state = app.MemoryStateBackend()
+            app.local_snapshot.clear()
+            transport = httpx.ASGITransport(app=app.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                etags = []
+                for arrival in (None, None, stub_article("Local", "https://local.example/roads", "The roads story is new. " * 3, guid="roads")):
+                    if arrival:
+                        ingest_summarized([arrival])
+                    await app.publish_news_snapshot()
+                    etags.append((await client.get("/api/news")).headers["ETag"])
+                return etags
+
+        try:
+            first, unchanged, changed = asyncio.run(scenario())
+        finally:
+            app.shared_state = None
+            app.local_snapshot.clear()
+            app.snapshot_payload.clear()
+            app.stream_payloads.clear()
+
+        if unchanged != first:
+            print(f"❌ ETag changed without a story changing: {first} -> {unchanged}")
+            return False
+        if changed == first:
+            print(f"❌ ETag {first} kept after a new story arrived")
+            return False
+
+        print("✅ Unchanged polls keep the ETag, new stories replace it")
+        return True
+    except Exception as e:
+        print(f"❌ Unchanged poll ETag test failed: {e}")
+        return False
+
+
+def test_metrics():
+    """Stage timings, including ones collected in an inference worker, render as Prometheus histograms"""
+    print("📈 Testing Prometheus metrics...")
+    try:
+        import app
+
+        app.metric_histograms.clear()
+        app.observe_stage("fetch", 0.003, "Stub \"Feed\"")
+        app.observe_stage("fetch", 7.0, "Stub \"Feed\"")
+
+        # What summarize_batch_in_worker does in a worker process
+        app.stage_collector.observations = []
+        with app.stage_timer("generate"):
+            pass
+        collected, app.stage_collector.observations = app.stage_collector.observations, None
+        for metric, seconds, labels in collected:
+            app.observe(metric, seconds, **labels)
+
+        text = app.render_metrics()
+        expected = [
+            '# TYPE newsbreeze_stage_seconds histogram',
+            'newsbreeze_stage_seconds_bucket{source="Stub \\"Feed\\"",stage="fetch",le="0.0025"} 0',
+            'newsbreeze_stage_seconds_bucket{source="Stub \\"Feed\\"",stage="fetch",le="0.005"} 1',
+            'newsbreeze_stage_seconds_bucket{source="Stub \\"Feed\\"",stage="fetch",le="+Inf"} 2',
+            'newsbreeze_stage_seconds_sum{source="Stub \\"Feed\\"",stage="fetch"} 7.003000',
+            'newsbreeze_stage_seconds_count{source="",stage="generate"} 1',
+            'newsbreeze_cache_events_total{cache="summary",event="misses"}',
+        ]
+        missing = [line for line in expected if line not in text]
+        if missing:
+            print(f"❌ Missing from /metrics: {missing}")
+            return False
+
+        print(f"✅ {len(text.splitlines())} metric lines rendered")
+        return True
+    except Exception as e:
+        print(f"❌ Metrics test failed: {e}")
+        return False
+
+
+def busy_loop_for_profile(stop):
+    """Spin until stop is set, so the profiler has something to sample"""
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def test_tracing_and_profiler():
+    """Traced calls record nested spans only while tracing is on; the profiler finds a busy thread"""
+    print("🔬 Testing request tracing and the sampling profiler...")
+    try:
+        import app
+
+        @app.traced("outer", root=True)
+        async def outer():
+            with app.stage_timer("inner", "Stub"):
+                await asyncio.sleep(0.01)
+
+        app.recent_traces.clear()
+        asyncio.run(outer())
+        if app.recent_traces:
+            print("❌ Traced while tracing was off")
+            return False
+
+        app.tracing.update(enabled=True, sample_rate=1.0)
+        try:
+            asyncio.run(outer())
+        finally:
+            app.tracing.update(enabled=False)
+        spans = app.recent_traces[-1]["spans"]
+        if [(s["name"], s["parent"]) for s in spans] != [("outer", None), ("inner", 1)] or spans[1]["duration_ms"] < 10:
+            print(f"❌ Unexpected spans: {spans}")
+            return False
+
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop_for_profile, args=(stop,), name="busy")
+        worker.start()
+        try:
+            counts = app.sample_stacks(0.3, 200)
+        finally:
+            stop.set()
+            worker.join()
+        busy = sum(count for stack, count in counts.items() if stack.startswith("busy;") and "busy_loop_for_profile" in stack)
+        if busy < 10:
+            print(f"❌ Profiler missed the busy thread: {busy} samples")
+            return False
+
+        # Any wrong token, including one with non-ASCII bytes, is rejected rather than failing
+        from fastapi import HTTPException
+        from starlette.requests import Request
+
+        original_token, app.ADMIN_TOKEN = app.ADMIN_TOKEN, "secret"
+        try:
+            statuses = []
+            for token in ("wrong".encode(), "tök€n".encode("utf-8"), "secret".encode()):
+                try:
+                    app.require_admin(Request({"type": "http", "headers": [(b"x-admin-token", token)]}))
+                    statuses.append(200)
+                except HTTPException as e:
+                    statuses.append(e.status_code)
+        finally:
+            app.ADMIN_TOKEN = original_token
+        if statuses != [403, 403, 200]:
+            print(f"❌ Admin token checks answered {statuses}")
+            return False
+
+        print(f"✅ Spans nested, {busy} samples in the busy thread")
+        return True
+    except Exception as e:
+        print(f"❌ Tracing and profiler test failed: {e}")
+        return False
+
+
+def test_single_flight():
+    """Concurrent callers with one key share a single call, its result or its error, and the key is freed after"""
+    print("🔗 Testing single-flight coalescing...")
+    try:
+        import app
+
+        calls = []
+
+        async def work(outcome):
+            calls.append(outcome)
+            await asyncio.sleep(0.05)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        async def scenario():
+            results = await asyncio.gather(*(app.single_flight("news_refresh", lambda: work(["story"])) for _ in range(5)))
+            freed_after_success = "news_refresh" not in app.inflight_calls
+
+            failure = RuntimeError("feed down")
+            errors = await asyncio.gather(*(app.single_flight("news_refresh", lambda: work(failure)) for _ in range(5)),
+                                          return_exceptions=True)
+            freed_after_failure = "news_refresh" not in app.inflight_calls
+
+            # A caller that goes away does not cancel the shared work for the others
+            first = asyncio.ensure_future(app.single_flight("news_refresh", lambda: work("shared")))
+            second = asyncio.ensure_future(app.single_flight("news_refresh", lambda: work("shared")))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return results, freed_after_success, errors, failure, freed_after_failure, await second
+
+        results, freed_after_success, errors, failure, freed_after_failure, survivor = asyncio.run(scenario())
+
+        if len(calls) != 3:
+            print(f"❌ {len(calls)} underlying calls for 3 rounds of concurrent callers (expected 3)")
+            return False
+        if any(result is not results[0] for result in results) or not freed_after_success:
+            print(f"❌ Callers got different results or the key stayed in flight: {results}")
+            return False
+        if any(error is not failure for error in errors) or not freed_after_failure:
+            print(f"❌ Callers did not all get the same error: {errors}")
+            return False
+        if survivor != "shared":
+            print(f"❌ Remaining caller got {survivor!r} after another caller was cancelled")
+            return False
+
+        print("✅ Concurrent callers share one call, its result and its error")
+        return True
+    except Exception as e:
+        print(f"❌ Single-flight test failed: {e}")
+        return False
+
+
+def test_inference_backpressure():
+    """With every summarization slot taken, a refresh gets a 429 with Retry-After while /health stays responsive"""
+    print("🚦 Testing inference backpressure...")
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+
+        import httpx
+
+        import app
+
+        use_temporary_article_store(app)
+        articles = [stub_article("Local", f"https://local.example/{name}", f"The {name} story has enough words to summarize. " * 3,
+                                 guid=name) for name in ("budget", "parks")]
+
+        async def fetch_all_feeds(*args, **kwargs):
+            return [dict(article) for article in articles]
+
+        original_fetch, original_batch = app.fetch_all_feeds, app.model_summarize_batch
+        original_workers, original_cache = app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH
+        app.fetch_all_feeds, app.model_summarize_batch = fetch_all_feeds, lambda texts: ["Model summary."] * len(texts)
+        app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = 0, os.path.join(tempfile.mkdtemp(), "s.db"), None
+        app.summary_lru.clear()
+        app.model_states["summarizer"] = "ready"
+        app.summarizer_tokenizer, app.summarizer_model = "tokenizer", "model"
+        release = threading.Event()
+        busy = ThreadPoolExecutor(max_workers=app.INFERENCE_QUEUE_LIMITS["summary"])
+
+        async def scenario():
+            app.shared_state = app.MemoryStateBackend()
+            app.local_snapshot.clear()
+            app.inference_slots.clear()  # Semaphores belong to the loop that created them
+            transport = httpx.ASGITransport(app=app.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                # Long-running batches hold every summarization slot
+                fillers = [asyncio.ensure_future(app.run_inference("summary", busy, release.wait, 10, block=True))
+                           for _ in range(app.INFERENCE_QUEUE_LIMITS["summary"])]
+                await asyncio.sleep(0.1)
+                depth = app.inference_queue_depth["summary"]
+
+                started = time.perf_counter()
+                rejected = await client.get("/api/news")
+                rejected_after = time.perf_counter() - started
+                started = time.perf_counter()
+                health = await client.get("/health")
+                health_after = time.perf_counter() - started
+
+                release.set()
+                await asyncio.gather(*fillers)
+                recovered = await client.get("/api/news")
+                return depth, rejected, rejected_after, health, health_after, recovered
+
+        try:
+            depth, rejected, rejected_after, health, health_after, recovered = asyncio.run(scenario())
+        finally:
+            release.set()
+            busy.shutdown(wait=False)
+            app.fetch_all_feeds, app.model_summarize_batch = original_fetch, original_batch
+            app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = original_workers, original_cache, None
+            app.summarizer_tokenizer = app.summarizer_model = app.summary_executor = None
+            app.model_states["summarizer"] = "pending"
+            app.inference_slots.clear()
+            app.shared_state = None
+            app.local_snapshot.clear()
+            app.snapshot_payload.clear()
+
+        if depth != app.INFERENCE_QUEUE_LIMITS["summary"]:
+            print(f"❌ {depth} summarization batches running (expected every slot taken)")
+            return False
+        if rejected.status_code != 429 or rejected.headers.get("Retry-After") != str(app.INFERENCE_RETRY_AFTER) or rejected_after > 1:
+            print(f"❌ Full queue answered {rejected.status_code} after {rejected_after:.2f}s, Retry-After {rejected.headers.get('Retry-After')}")
+            return False
+        if health.status_code != 200 or health.json()["inference_queue_depth"]["summary"] != depth or health_after > 1:
+            print(f"❌ /health answered {health.status_code} after {health_after:.2f}s while the queue was full")
+            return False
+        if recovered.status_code != 200 or len(recovered.json()["news"]) != 2:
+            print(f"❌ Refresh after the queue drained answered {recovered.status_code}: {recovered.text[:200]}")
+            return False
+
+        print(f"✅ Full queue rejected in {rejected_after * 1000:.0f}ms with Retry-After, /health in {health_after * 1000:.0f}ms")
+        return True
+    except Exception as e:
+        print(f"❌ Inference backpressure test failed: {e}")
+        return False
+
+
+def test_model_lifecycle():
+    """Weights map from safetensors; an unloaded model is reloaded once for concurrent callers"""
+    print("💤 Testing model unload and reload...")
+    try:
+        import torch
+        from safetensors.torch import save_file
+
+        import app
+
+        path = os.path.join(tempfile.mkdtemp(), "model.safetensors")
+        weights = {"embed": torch.randn(32, 8), "scale": torch.ones(3, dtype=torch.float16), "steps": torch.arange(5)}
+        save_file(weights, path)
+        mapped = app.mmap_safetensors(path)
+        if any(not torch.equal(mapped[name], tensor) for name, tensor in weights.items()):
+            print("❌ Memory-mapped tensors differ from the saved ones")
+            return False
+
+        loads = []
+
+        def stub_loader():
+            time.sleep(0.2)
+            loads.append(1)
+            app.summarizer_tokenizer, app.summarizer_model = "tokenizer", "model"
+            return True
+
+        original_loader, original_batch = app.MODEL_LOADERS["summarizer"], app.model_summarize_batch
+        original_workers, original_cache = app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH
+        app.MODEL_LOADERS["summarizer"] = stub_loader
+        app.model_summarize_batch = lambda texts: [f"model summary {i}" for i in range(len(texts))]
+        app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = 0, os.path.join(tempfile.mkdtemp(), "s.db"), None
+        app.summary_lru.clear()
+        try:
+            async def scenario():
+                app.model_states["summarizer"] = "ready"
+                await app.unload_model("summarizer")
+                if app.model_states["summarizer"] != "unloaded" or app.summarizer_model is not None:
+                    return "model still loaded after unload"
+                results = await asyncio.gather(*(app.summarize_text(f"Article {i} " * 20) for i in range(3)))
+                if len(loads) != 1:
+                    return f"{len(loads)} reloads for 3 concurrent callers"
+                if not all(result.startswith("model summary") for result in results):
+                    return f"callers got fallback summaries: {results}"
+                return None
+
+            problem = asyncio.run(scenario())
+        finally:
+            app.MODEL_LOADERS["summarizer"], app.model_summarize_batch = original_loader, original_batch
+            app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = original_workers, original_cache, None
+            app.summarizer_tokenizer = app.summarizer_model = app.summary_executor = None
+            app.model_states["summarizer"] = "pending"
+            app.model_load_tasks.clear()
+
+        if problem:
+            print(f"❌ {problem}")
+            return False
+        print("✅ Mapped weights match, one reload shared by concurrent callers")
+        return True
+    except Exception as e:
+        print(f"❌ Model lifecycle test failed: {e}")
+        return False
+
+
+def test_batched_summary_order():
+    """Length-sorted batches come back in input order, padded per batch, with a failed batch retried per item"""
+    print("📦 Testing batched summary order...")
+    try:
+        import torch
+
+        import app
+
+        class EchoTokenizer:
+            """One id per distinct word; decoding an echoed input gives back its prompt"""
+            pad_token_id = 0
+
+            def __init__(self):
+                self.vocab, self.padded = {}, []
+
+            def __call__(self, texts, max_length=None, truncation=False):
+                encoded = [[self.vocab.setdefault(word, len(self.vocab) + 1) for word in text.split()] for text in texts]
+                return {"input_ids": [ids[:max_length] if truncation else ids for ids in encoded]}
+
+            def pad(self, features, return_tensors="pt"):
+                rows = features["input_ids"]
+                width = max(len(ids) for ids in rows)
+                self.padded.append(([len(ids) for ids in rows], width))
+                input_ids = torch.tensor([ids + [self.pad_token_id] * (width - len(ids)) for ids in rows])
+                return {"input_ids": input_ids, "attention_mask": (input_ids != self.pad_token_id).long()}
+
+            def batch_decode(self, rows, skip_special_tokens=True):
+                words = {token: word for word, token in self.vocab.items()}
+                return [" ".join(words[int(token)] for token in row if int(token)) for row in rows]
+
+        class EchoModel:
+            """Echoes its inputs, failing any multi-item batch holding the "echo" story"""
+            def __init__(self, tokenizer):
+                self.tokenizer = tokenizer
+
+            def generate(self, input_ids, attention_mask, **config):
+                if len(input_ids) > 1 and (input_ids == self.tokenizer.vocab.get("echo")).any():
+                    raise RuntimeError("batch failed")
+                return input_ids
+
+        # Lengths 5, 1, 9, 3, 7: sorting by length reorders them
+        texts = [" ".join([word] * count) for word, count in (("alpha", 5), ("bravo", 1), ("charlie", 9), ("delta", 3), ("echo", 7))]
+        expected = ["summarize: " + text for text in texts]
+        tokenizer = EchoTokenizer()
+        original = (app.summarizer_tokenizer, app.summarizer_model)
+        app.summarizer_tokenizer, app.summarizer_model = tokenizer, EchoModel(tokenizer)
+        try:
+            batched = app.generate_summaries(app.encode_prompts(texts), 2, {})
+            padded = list(tokenizer.padded)
+            retried = app.huggingface_summarize_batch(texts, batch_size=2, generation_config={}, mode="truncate")
+        finally:
+            app.summarizer_tokenizer, app.summarizer_model = original
+
+        # bravo+delta, then alpha+echo (fails), then charlie on its own
+        if padded != [([2, 4], 4), ([6, 8], 8), ([10], 10)]:
+            print(f"❌ Batches not length-sorted and padded per batch: {padded}")
+            return False
+        if batched != [None, expected[1], expected[2], expected[3], None]:
+            print(f"❌ Summaries out of input order or failed batch misplaced: {batched}")
+            return False
+        if retried != expected:
+            print(f"❌ Retried summaries out of input order: {retried}")
+            return False
+
+        print("✅ Summaries returned in input order, failed batch retried per item")
+        return True
+    except Exception as e:
+        print(f"❌ Batched summary order test failed: {e}")
+        return False
+
+
+def test_summary_cache():
+    """Cached summaries skip the model, even after a restart, and eviction keeps the most recently used rows"""
+    print("💾 Testing summary cache...")
+    try:
+        import app
+
+        batches = []
+
+        def summarize(texts):
+            batches.append(list(texts))
+            return [f"Summary of {text}" for text in texts]
+
+        texts = [f"The {name} story has enough words to summarize." for name in ("budget", "parks", "roads")]
+        original_batch, original_workers = app.model_summarize_batch, app.SUMMARY_WORKERS
+        original_cache, original_limit = app.SUMMARY_CACHE_PATH, app.SUMMARY_CACHE_MAX_ENTRIES
+        app.model_summarize_batch, app.SUMMARY_WORKERS = summarize, 0
+        app.SUMMARY_CACHE_PATH, app.summary_db = os.path.join(tempfile.mkdtemp(), "s.db"), None
+        app.summary_lru.clear()
+        app.model_states["summarizer"] = "ready"
+        app.summarizer_tokenizer, app.summarizer_model = "tokenizer", "model"
+        disk_hits = app.summary_cache_stats["disk_hits"]
+        try:
+            async def scenario():
+                await app.summarize_texts(texts[:2])
+                app.summary_lru.clear()  # As after a restart: only the disk cache is left
+                return await app.summarize_texts(texts)
+
+            summaries, model_used = asyncio.run(scenario())
+            disk_hits = app.summary_cache_stats["disk_hits"] - disk_hits
+
+            # Eviction: three slots, and the oldest entry is read again before a fourth arrives
+            app.SUMMARY_CACHE_MAX_ENTRIES = 3
+            app.summary_db.execute("DELETE FROM summaries")
+            for key in ("first", "second", "third"):
+                app.summary_cache_put({key: key})
+                time.sleep(0.01)
+            app.summary_lru.clear()
+            app.summary_cache_get("first")
+            time.sleep(0.01)
+            app.summary_cache_put({"fourth": "fourth"})
+            kept = {row[0] for row in app.summary_db.execute("SELECT key FROM summaries")}
+        finally:
+            app.model_summarize_batch, app.SUMMARY_WORKERS = original_batch, original_workers
+            app.SUMMARY_CACHE_PATH, app.SUMMARY_CACHE_MAX_ENTRIES, app.summary_db = original_cache, original_limit, None
+            app.summary_lru.clear()
+            app.summarizer_tokenizer = app.summarizer_model = app.summary_executor = None
+            app.model_states["summarizer"] = "pending"
+
+        if batches != [texts[:2], texts[2:]] or disk_hits != 2:
+            print(f"❌ Model batches {batches}, {disk_hits} disk hits (expected only the new text modeled, 2 hits)")
+            return False
+        if summaries != [f"Summary of {text}" for text in texts] or model_used != [True] * 3:
+            print(f"❌ Cached and new summaries mixed up: {summaries}")
+            return False
+        if kept != {"first", "third", "fourth"}:
+            print(f"❌ Eviction kept {sorted(kept)} (expected the three most recently used)")
+            return False
+
+        print("✅ Cache hits skip the model, eviction drops the least recently used row")
+        return True
+    except Exception as e:
+        print(f"❌ Summary cache test failed: {e}")
+        return False
+
+
+def test_chunked_summarization():
+    """Long articles split on sentences within the token budget, tokenized once, and reduced to one summary each"""
+    print("🧩 Testing chunked map-reduce summarization...")
+    try:
+        import app
+
+        class WordTokenizer:
+            """One token per word, counting how often each text is tokenized"""
+            eos_token_id = 1
+
+            def __init__(self):
+                self.calls = {}
+
+            def __call__(self, texts, add_special_tokens=True, max_length=None, truncation=False):
+                texts = [texts] if isinstance(texts, str) else texts
+                encoded = []
+                for text in texts:
+                    self.calls[text] = self.calls.get(text, 0) + 1
+                    ids = [2 + len(word) for word in text.split()] + ([1] if add_special_tokens else [])
+                    encoded.append(ids[:max_length] if truncation else ids)
+                return {"input_ids": encoded}
+
+        generated = []
+
+        def stub_generate(encoded, batch_size, generation_config):
+            generated.append((encoded, generation_config))
+            return [f"part {len(ids)}." for ids in encoded]
+
+        tokenizer = WordTokenizer()
+        sentence = "The storm closed roads across the region overnight."  # 8 words
+        long_article = " ".join([sentence] * 12)
+        original = (app.summarizer_tokenizer, app.summarizer_model, app.generate_summaries, app.SUMMARY_MAX_INPUT_TOKENS)
+        app.summarizer_tokenizer, app.summarizer_model, app.generate_summaries = tokenizer, "model", stub_generate
+        app.SUMMARY_MAX_INPUT_TOKENS = 30
+        app.token_cache.clear()
+        try:
+            ids, ends = app.tokenize_sentences(long_article)
+            chunks = app.plan_chunks(ids, ends, 28, max_chunks=10)
+            if [len(chunk) for chunk in chunks] != [24, 24, 24, 24] or sum(chunks, []) != ids.tolist():
+                print(f"❌ Unexpected chunks: {[len(chunk) for chunk in chunks]}")
+                return False
+
+            summaries = app.huggingface_summarize_batch([long_article, sentence], mode="chunked")
+            summaries = app.huggingface_summarize_batch([long_article, sentence], mode="chunked")
+        finally:
+            app.summarizer_tokenizer, app.summarizer_model, app.generate_summaries, app.SUMMARY_MAX_INPUT_TOKENS = original
+            app.token_cache.clear()
+
+        if len(summaries) != 2 or not all(summaries):
+            print(f"❌ Expected one summary per article, got {summaries}")
+            return False
+        # 12 sentences of the long article plus the short one, tokenized on the first call only
+        if tokenizer.calls.get(sentence) != 13:
+            print(f"❌ Articles tokenized more than once: {tokenizer.calls}")
+            return False
+        if any(len(ids) > 30 for encoded, _ in generated for ids in encoded):
+            print("❌ A chunk exceeded the token budget")
+            return False
+        # Per call: the short article directly, the long article's chunks (map), then their merge (reduce)
+        if [len(encoded) for encoded, _ in generated[:3]] != [1, 4, 1] or generated[1][1]["max_length"] != app.SUMMARY_MAP_CONFIG["max_length"]:
+            print(f"❌ Unexpected generation passes: {[(len(e), c) for e, c in generated]}")
+            return False
+
+        print("✅ Chunks respect the budget, articles tokenized once, one merged summary per article")
+        return True
+    except Exception as e:
+        print(f"❌ Chunked summarization test failed: {e}")
+        return False
+
+
+def test_fallback_summaries_stay_pending():
+    """Fallback summaries are shown but leave stories pending until the model summarizes them"""
+    print("⏳ Testing fallback summaries stay pending...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        articles = [stub_article("Local", f"https://local.example/{name}", f"The {name} story has enough words to summarize. " * 3,
+                                 guid=name) for name in ("budget", "parks")]
+        app.ingest_articles(articles)
+
+        original_batch, original_workers, original_cache = app.model_summarize_batch, app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH
+        app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = 0, os.path.join(tempfile.mkdtemp(), "s.db"), None
+        app.summary_lru.clear()
+        # The model writes the first story; the second one's batch fails
+        app.model_summarize_batch = lambda texts: ["Model summary." if "budget" in text else None for text in texts]
+        try:
+            async def scenario():
+                app.model_states["summarizer"] = "loading"
+                await app.summarize_articles(app.pending_articles(10))
+                while_loading = (len(app.query_news(10)[0]), app.get_article_store_stats()["pending_summaries"])
+
+                app.model_states["summarizer"] = "ready"
+                app.summarizer_tokenizer, app.summarizer_model = "tokenizer", "model"
+                await app.summarize_articles(app.pending_articles(10))
+                return while_loading, app.get_article_store_stats()["pending_summaries"]
+
+            (shown, pending_while_loading), pending_when_ready = asyncio.run(scenario())
+        finally:
+            app.model_summarize_batch = original_batch
+            app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = original_workers, original_cache, None
+            app.summarizer_tokenizer = app.summarizer_model = app.summary_executor = None
+            app.model_states["summarizer"] = "pending"
+
+        if shown != 2 or pending_while_loading != 2:
+            print(f"❌ While loading: {shown} stories shown, {pending_while_loading} pending (expected 2 and 2)")
+            return False
+        if pending_when_ready != 1:
+            print(f"❌ {pending_when_ready} stories pending after the model summarized one (expected 1)")
+            return False
+
+        print("✅ Fallback summaries served while loading and re-summarized once the model is ready")
+        return True
+    except Exception as e:
+        print(f"❌ Fallback summaries test failed: {e}")
+        return False
+
+
+def test_poller_retries_pending_summaries():
+    """A feed poll re-summarizes stories left pending by an earlier failed batch, even when nothing changed"""
+    print("🔁 Testing poller retries pending summaries...")
+    try:
+        import app
+
+        use_temporary_article_store(app)
+        articles = [stub_article("Local", f"https://local.example/{name}", f"The {name} story has enough words to summarize. " * 3,
+                                 guid=name) for name in ("budget", "parks")]
+        calls = []
+
+        async def fetch(url, source_name):
+            return [dict(article) for article in articles]
+
+        def summarize(texts):
+            calls.append(len(texts))
+            return [None] * len(texts) if len(calls) == 1 else ["Model summary."] * len(texts)
+
+        original_fetch, original_batch = app.fetch_rss_feed, app.model_summarize_batch
+        original_workers, original_cache = app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH
+        app.fetch_rss_feed, app.model_summarize_batch = fetch, summarize
+        app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = 0, os.path.join(tempfile.mkdtemp(), "s.db"), None
+        app.summary_lru.clear()
+        app.model_states["summarizer"] = "ready"
+        app.summarizer_tokenizer, app.summarizer_model = "tokenizer", "model"
+        try:
+            async def scenario():
+                await app.refresh_feed("Local", "https://local.example/rss")  # The batch fails
+                after_failure = app.get_article_store_stats()["pending_summaries"]
+                await app.refresh_feed("Local", "https://local.example/rss")  # Same entries, nothing new to ingest
+                return after_failure, app.get_article_store_stats()["pending_summaries"]
+
+            after_failure, after_retry = asyncio.run(scenario())
+        finally:
+            app.fetch_rss_feed, app.model_summarize_batch = original_fetch, original_batch
+            app.SUMMARY_WORKERS, app.SUMMARY_CACHE_PATH, app.summary_db = original_workers, original_cache, None
+            app.summarizer_tokenizer = app.summarizer_model = app.summary_executor = None
+            app.model_states["summarizer"] = "pending"
+            app.drop_news_snapshot()
+
+        if after_failure != 2 or len(calls) != 2:
+            print(f"❌ {after_failure} stories pending after the failed batch, model called {len(calls)} times (expected 2 and 2)")
+            return False
+        if after_retry != 0:
+            print(f"❌ {after_retry} stories still pending after the next poll (expected 0)")
+            return False
+
+        print("✅ Pending stories re-summarized on the next poll")
+        return True
+    except Exception as e:
+        print(f"❌ Poller retry test failed: {e}")
+        return False
+
+
+def test_audio_cache():
+    """Audio lands atomically, the cache keeps to its byte budget, reconciliation cleans up and hits skip the TTS queue"""
+    print("🔊 Testing audio cache...")
+    try:
+        import app
+
+        use_temporary_audio_cache(app)
+        original_budget = app.AUDIO_CACHE_MAX_BYTES
+        app.AUDIO_CACHE_MAX_BYTES = 250
+        seen_while_rendering = []
+
+        def render(path, size=100):
+            final = [name for name in os.listdir(app.AUDIO_DIR) if name.startswith("news_")]
+            seen_while_rendering.append((os.path.basename(path), final))
+            with open(path, "wb") as f:
+                f.write(b"\0" * size)
+
+        try:
+            # Atomic write: rendered under a .tmp- name, then moved into place; a failed render leaves nothing
+            url = app.synthesize_to_cache("first story", "morgan_freeman", "gtts", render)
+            tmp_name, visible = seen_while_rendering[0]
+            if not tmp_name.startswith(".tmp-") or visible or not os.path.exists(os.path.join(app.AUDIO_DIR, os.path.basename(url))):
+                print(f"❌ Audio not written atomically: rendered to {tmp_name}, visible meanwhile {visible}")
+                return False
+
+            def failing_render(path):
+                open(path, "wb").close()
+                raise RuntimeError("TTS failed")
+
+            try:
+                app.synthesize_to_cache("broken story", "morgan_freeman", "gtts", failing_render)
+            except RuntimeError:
+                pass
+            if any(name.startswith(".tmp-") for name in os.listdir(app.AUDIO_DIR)):
+                print("❌ Failed render left a temporary file behind")
+                return False
+
+            # Byte budget: 250 bytes hold two 100-byte files; the least recently used one goes
+            app.synthesize_to_cache("second story", "morgan_freeman", "gtts", render)
+            time.sleep(0.01)
+            app.audio_cache_lookup("first story", "morgan_freeman")
+            app.synthesize_to_cache("third story", "morgan_freeman", "gtts", render)
+            cached = {text: app.audio_cache_lookup(text, "morgan_freeman") is not None
+                      for text in ("first story", "second story", "third story")}
+            if cached != {"first story": True, "second story": False, "third story": True}:
+                print(f"❌ Wrong files evicted: {cached}")
+                return False
+
+            # Reconciliation: forget index entries without a file, delete files without an index entry
+            os.remove(os.path.join(app.AUDIO_DIR, os.path.basename(app.audio_cache_lookup("third story", "morgan_freeman"))))
+            orphans = ["news_morgan_freeman_gtts_orphan.mp3", ".tmp-leftover.mp3"]
+            for name in orphans:
+                path = os.path.join(app.AUDIO_DIR, name)
+                open(path, "wb").close()
+                os.utime(path, (time.time() - 3600, time.time() - 3600))
+            # Just written by another worker and not indexed yet: must survive
+            in_flight = "news_morgan_freeman_gtts_inflight.mp3"
+            open(os.path.join(app.AUDIO_DIR, in_flight), "wb").close()
+
+            # While another worker holds the reconcile lease, this one leaves everything alone
+            state = app.get_shared_state()
+            state.acquire_lease("audio_reconcile", "other-worker", 10)
+            app.reconcile_audio_cache()
+            skipped = len(os.listdir(app.AUDIO_DIR))
+            state.release_lease("audio_reconcile", "other-worker")
+
+            app.reconcile_audio_cache()
+            remaining = sorted(os.listdir(app.AUDIO_DIR))
+            if skipped != 4 or remaining != sorted([os.path.basename(url), in_flight]) or app.get_audio_cache_stats()["files"] != 1:
+                print(f"❌ Reconciliation left {remaining} ({skipped} files while the lease was held), "
+                      f"{app.get_audio_cache_stats()['files']} indexed")
+                return False
+
+            # A cache hit returns even when the TTS queue is full
+            async def hit_with_full_queue():
+                app.inference_slots["audio"] = asyncio.Semaphore(0)
+                try:
+                    return await app.synthesize_audio("first story", "morgan_freeman")
+                finally:
+                    app.inference_slots.pop("audio", None)
+
+            if asyncio.run(hit_with_full_queue()) != url:
+                print("❌ Cache hit did not bypass the full TTS queue")
+                return False
+        finally:
+            app.AUDIO_CACHE_MAX_BYTES = original_budget
+
+        print(f"✅ Atomic writes, LRU eviction and reconciliation working: {app.get_audio_cache_stats()}")
+        return True
+    except Exception as e:
+        print(f"❌ Audio cache test failed: {e}")
+        return False
+
+
+def test_prerender_hits():
+    """Plays of pre-rendered files count as hits where they are served, and tracking stays bounded"""
+    print("🎧 Testing pre-render hit counting...")
+    try:
+        import httpx
+
+        import app
+
+        filename = "news_morgan_freeman_gtts_prerender-test.mp3"
+        path = os.path.join("static", "audio", filename)
+        with open(path, "wb") as f:
+            f.write(b"\0" * 1000)
+        original = (app.PRERENDER_AUDIO, app.PRERENDER_TRACKED_LIMIT, dict(app.prerender_stats))
+        app.PRERENDER_AUDIO, app.PRERENDER_TRACKED_LIMIT = True, 2
+        try:
+            app.remember_prerendered("key-1", f"/static/audio/{filename}")
+
+            async def play():
+                transport = httpx.ASGITransport(app=app.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                    # One play: the opening range request, then a follow-up range of the same file
+                    await client.get(f"/static/audio/{filename}", headers={"Range": "bytes=0-"})
+                    await client.get(f"/static/audio/{filename}", headers={"Range": "bytes=500-"})
+
+            app.prerender_stats["request_hits"] = 0
+            asyncio.run(play())
+            hits = app.prerender_stats["request_hits"]
+
+            app.remember_prerendered("key-2", "/static/audio/second.mp3")
+            app.remember_prerendered("key-3", "/static/audio/third.mp3")
+            capped = sorted(app.prerendered_files)
+            app.forget_prerendered("third.mp3")
+            forgotten = "key-3" in app.prerendered_keys
+        finally:
+            os.remove(path)
+            app.PRERENDER_AUDIO, app.PRERENDER_TRACKED_LIMIT = original[:2]
+            app.prerender_stats.update(original[2])
+            app.prerendered_files.clear()
+            app.prerendered_keys.clear()
+
+        if hits != 1:
+            print(f"❌ {hits} hits counted for one play of a pre-rendered file")
+            return False
+        if capped != ["second.mp3", "third.mp3"] or forgotten:
+            print(f"❌ Tracking not bounded: {capped}, evicted key still tracked: {forgotten}")
+            return False
+
+        print("✅ One hit per play, tracking capped and pruned on eviction")
+        return True
+    except Exception as e:
+        print(f"❌ Pre-render hit test failed: {e}")
+        return False
+
+
+class StubPyttsx3Engine:
+    """Stands in for pyttsx3: writes each text as the frames of an 8-bit mono WAV file"""
+
+    def __init__(self):
+        self.rendered = []
+        self.queued = []
+
+    def getProperty(self, name):
+        return [] if name == "voices" else None
+
+    def setProperty(self, name, value):
+        pass
+
+    def save_to_file(self, text, path):
+        self.queued.append((text, path))
+
+    def runAndWait(self):
+        import wave
+
+        for text, path in self.queued:
+            with wave.open(path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(1)
+                wav.setframerate(8000)
+                wav.writeframes(text.encode("utf-8"))
+            self.rendered.append(text)
+        self.queued = []
+
+
+def test_audio_streaming_offline():
+    """The chunked TTS stream is one WAV with a streaming header, chunks in order, and cached for the next call"""
+    print("🔉 Testing offline audio streaming...")
+    try:
+        import shutil
+
+        import httpx
+
+        import app
+
+        def gtts_offline(text, path):
+            raise RuntimeError("offline")
+
+        text = ("The city council approved a new budget on Tuesday that increases funding for public transit. "
+                "Officials said the money will pay for more frequent bus service on the busiest routes. "
+                "Critics argued that the plan does not address rising housing costs across the region.")
+        chunks = app.split_text_for_tts(text)
+        engine = StubPyttsx3Engine()
+        original = (app.tts_engine, app.gtts_synthesize, app.AUDIO_DIR, app.AUDIO_CACHE_INDEX_PATH)
+        app.tts_engine, app.gtts_synthesize = engine, gtts_offline
+        # Audio URLs are read back relative to the working directory, so stay under static/audio
+        app.audio_db = None
+        app.AUDIO_DIR = tempfile.mkdtemp(dir=os.path.join("static", "audio"))
+        app.AUDIO_CACHE_INDEX_PATH = os.path.join(tempfile.mkdtemp(), "audio_index.db")
+        try:
+            async def stream_twice():
+                transport = httpx.ASGITransport(app=app.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://newsbreeze") as client:
+                    payload = {"text": text, "voice_name": "morgan_freeman"}
+                    first = await client.post("/api/generate-audio/stream", json=payload)
+                    rendered = len(engine.rendered)
+                    second = await client.post("/api/generate-audio/stream", json=payload)
+                    return first, rendered, second
+
+            first, rendered_first, second = asyncio.run(stream_twice())
+        finally:
+            shutil.rmtree(app.AUDIO_DIR, ignore_errors=True)
+            app.tts_engine, app.gtts_synthesize, app.AUDIO_DIR, app.AUDIO_CACHE_INDEX_PATH = original
+            app.audio_db = None
+
+        body = first.content
+        if first.status_code != 200 or first.headers.get("content-type") != "audio/wav":
+            print(f"❌ Stream answered {first.status_code} {first.headers.get('content-type')}")
+            return False
+        if body[:4] != b"RIFF" or body[8:12] != b"WAVE" or body[36:40] != b"data":
+            print(f"❌ Stream does not start with a RIFF/WAVE header: {body[:44]!r}")
+            return False
+        if len(chunks) < 3 or body[44:] != "".join(chunks).encode("utf-8"):
+            print(f"❌ Chunks missing or out of order: {body[44:]!r}")
+            return False
+        if rendered_first != len(chunks) or len(engine.rendered) != len(chunks) or second.content != body:
+            print(f"❌ Second stream re-synthesized: {rendered_first} then {len(engine.rendered)} renders for {len(chunks)} chunks")
+            return False
+
+        print(f"✅ {len(chunks)} chunks streamed in order after one WAV header, served from cache the second time")
+        return True
+    except Exception as e:
+        print(f"❌ Offline audio streaming test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("🚀 NewsBreeze Feed Ingestion Test")
+    print("=" * 60)
+
+    tests = [
+        ("Concurrent Fetch", test_concurrent_fetch),
+        ("Conditional Revalidation", test_conditional_revalidation),
+        ("Feed Registry", test_feed_registry),
+        ("Circuit Breaker", test_circuit_breaker),
+        ("Clean Text Equivalence", test_clean_text_equivalence),
+        ("Deduplication", test_deduplication),
+        ("Store Lock Off Event Loop", test_store_lock_off_event_loop),
+        ("Article Store", test_article_store),
+        ("News Query", test_news_query),
+        ("Cursor Pagination", test_cursor_pagination),
+        ("Shared State Leases", test_shared_state_leases),
+        ("Shared Snapshot", test_shared_snapshot),
+        ("News Validators", test_news_validators),
+        ("Unchanged Poll Keeps ETag", test_unchanged_poll_keeps_etag),
+        ("Metrics", test_metrics),
+        ("Tracing and Profiler", test_tracing_and_profiler),
+        ("Single Flight", test_single_flight),
+        ("Inference Backpressure", test_inference_backpressure),
+        ("Model Lifecycle", test_model_lifecycle),
+        ("Batched Summary Order", test_batched_summary_order),
+        ("Summary Cache", test_summary_cache),
+        ("Chunked Summarization", test_chunked_summarization),
+        ("Fallback Summaries Stay Pending", test_fallback_summaries_stay_pending),
+        ("Poller Retries Pending Summaries", test_poller_retries_pending_summaries),
+        ("Audio Cache", test_audio_cache),
+        ("Pre-render Hits", test_prerender_hits),
+        ("Audio Streaming Offline", test_audio_streaming_offline),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n🧪 Running {test_name} test...")
+        if test_func():
+            passed += 1
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    print("=" * 60)
+    sys.exit(0 if passed == len(tests) else 1)